@@ -0,0 +1,60 @@
+"""Startup-time benchmark for the ``beep-lite`` command line.
+
+Runs each command several times in a fresh interpreter and reports the
+minimum and median wall time, so regressions in import cost show up directly.
+
+Usage:
+    python benchmarks/bench_cli_startup.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+CASES: list[tuple[str, list[str]]] = [
+    ("interpreter only", [sys.executable, "-c", "pass"]),
+    ("import beep_lite", [sys.executable, "-c", "import beep_lite"]),
+    ("legacy one-liner", [sys.executable, "-c", "import beep_lite; beep_lite.ok()"]),
+    ("python -m beep_lite --list", [sys.executable, "-m", "beep_lite", "--list"]),
+    ("python -m beep_lite ok", [sys.executable, "-m", "beep_lite", "ok"]),
+    (
+        "python -m beep_lite --daemon-client ok",
+        [sys.executable, "-m", "beep_lite", "--daemon-client", "ok"],
+    ),
+]
+
+
+def _time_command(command: list[str], runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'case':<42} {'min ms':>8} {'median ms':>10}")
+    for name, command in CASES:
+        timings = _time_command(command, args.runs)
+        print(
+            f"{name:<42} {min(timings) * 1000:>8.1f} "
+            f"{statistics.median(timings) * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""End-to-end latency SLO check: ``scan_ok()`` call to audible output.
+
+Operators are promised audible feedback within 50 ms of a scan. This
+harness calls ``scan_ok()`` on a :class:`~beep_lite.core.Beeper` whose only
+backend candidate is a
+:class:`~beep_lite.backends.loopback_backend.LoopbackBackend`, a virtual
+output device that timestamps the first non-silent sample of every sound
+it receives. The module-level ``beep_lite.scan_ok()`` runs the same code on
+the default beeper. Everything in between (staleness check, warm-up gate,
+in-flight tracking, failover layer, decoding and the hand-off to the
+device thread) is the code that runs in production, so the numbers track
+what beep-lite adds across releases. No sound hardware is needed.
+
+Each of ``--stations`` threads is one scanner: it scans at random intervals
+(``--interval`` on average) and waits until its beep is audible before the
+next scan. ``--cpu-threads`` busy threads add application load competing
+for the interpreter. A beep that never becomes audible counts as a miss.
+
+Usage:
+    python benchmarks/bench_latency_slo.py [--stations N] [--scans N]
+                                           [--interval S] [--cpu-threads N]
+                                           [--device-latency MS]
+                                           [--p50-ms MS] [--p99-ms MS]
+                                           [--max-ms MS] [--cold]
+
+Exits with status 1 if a threshold is exceeded or a beep is missed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import threading
+import time
+
+import beep_lite
+from beep_lite.backends.loopback_backend import LoopbackBackend, Onset
+
+# Longest wait for one beep before it counts as missed
+_MISS_TIMEOUT = 1.0
+
+
+class _Station:
+    """One simulated scanner, woken by the device when its beep is audible."""
+
+    def __init__(self) -> None:
+        self.audible = threading.Event()
+        self.onset: Onset | None = None
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted ``values``."""
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def _busy(stop: threading.Event) -> None:
+    total = 0
+    while not stop.is_set():
+        for i in range(10_000):
+            total += i * i % 7
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stations", type=int, default=8, help="concurrent scanners")
+    parser.add_argument("--scans", type=int, default=100, help="per station")
+    parser.add_argument(
+        "--interval", type=float, default=0.05, help="mean seconds between scans"
+    )
+    parser.add_argument("--cpu-threads", type=int, default=0, help="busy threads")
+    parser.add_argument(
+        "--device-latency", type=float, default=0.0, help="device buffering, ms"
+    )
+    parser.add_argument("--p50-ms", type=float, default=None)
+    parser.add_argument("--p99-ms", type=float, default=50.0)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument(
+        "--cold", action="store_true", help="skip warmup(); count the first beep"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stations: dict[int, _Station] = {}
+
+    def on_audible(onset: Onset) -> None:
+        station = stations.get(onset.caller)
+        if station is not None:
+            station.onset = onset
+            station.audible.set()
+
+    device = LoopbackBackend(args.device_latency / 1000, on_audible=on_audible)
+    # A candidate rather than backend=, so it sits below the failover layer
+    # like a real backend.
+    beeper = beep_lite.Beeper(candidates=[("loopback", lambda: device)])
+    if not args.cold:
+        beep_lite.warmup(background=False, beeper=beeper)
+
+    latencies: list[float] = []
+    missed = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(args.stations + 1)
+
+    def scan(seed: int) -> None:
+        nonlocal missed
+        station = stations[threading.get_ident()] = _Station()
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(args.scans):
+            time.sleep(rng.expovariate(1 / args.interval) if args.interval else 0)
+            station.audible.clear()
+            start = time.monotonic()
+            beeper.scan_ok()
+            heard = station.audible.wait(_MISS_TIMEOUT)
+            with lock:
+                if heard and station.onset is not None:
+                    latencies.append(station.onset.audible - start)
+                else:
+                    missed += 1
+
+    stop = threading.Event()
+    busy = [
+        threading.Thread(target=_busy, args=(stop,), daemon=True)
+        for _ in range(args.cpu_threads)
+    ]
+    scanners = [
+        threading.Thread(target=scan, args=(args.seed + i,))
+        for i in range(args.stations)
+    ]
+    for thread in busy + scanners:
+        thread.start()
+    barrier.wait()
+    start = time.monotonic()
+    for thread in scanners:
+        thread.join()
+    elapsed = time.monotonic() - start
+    stop.set()
+    beeper.flush(timeout=2.0)
+    beeper.close()
+
+    latencies.sort()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(
+        f"{args.stations} stations, {args.cpu_threads} busy threads, "
+        f"{len(latencies) + missed} scans in {elapsed:.1f} s "
+        f"({(len(latencies) + missed) / elapsed:,.0f}/s)"
+    )
+    if not latencies:
+        print("No beep became audible")
+        sys.exit(1)
+    measured = {
+        "p50": _percentile(latencies, 0.50) * 1000,
+        "p99": _percentile(latencies, 0.99) * 1000,
+        "max": latencies[-1] * 1000,
+    }
+    limits = {"p50": args.p50_ms, "p99": args.p99_ms, "max": args.max_ms}
+    print(f"{'':>4} {'latency':>10} {'limit':>10}")
+    failed = missed > 0
+    for name, value in measured.items():
+        limit = limits[name]
+        over = limit is not None and value > limit
+        failed = failed or over
+        shown = "-" if limit is None else f"{limit:.1f} ms"
+        print(f"{name:>4} {value:>7.2f} ms {shown:>10}{'  FAIL' if over else ''}")
+    if missed:
+        print(f"{missed} beeps not audible within {_MISS_TIMEOUT:.0f} s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Multi-threaded throughput benchmark for ``play()``.
+
+Calls ``Beeper.play()`` from 1, 2, 4, ... threads against a backend that
+outputs nothing but signals completion like a real one, from the shared
+scheduler once the sound would have ended. Calls go through the same
+:class:`ResilientBackend`, staleness check and in-flight tracking as real
+playback. On free-threaded CPython
+(3.13t and later) throughput should grow with the thread count; if it stays
+flat the calls serialise on a lock somewhere. A pure-Python reference loop is
+measured the same way, to show how well this machine scales at all. With the
+GIL both stay around 1x.
+
+Usage:
+    python benchmarks/bench_threads.py [--calls N] [--max-threads N]
+                                       [--min-efficiency 0.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from beep_lite import Beeper, Sound
+from beep_lite.scheduler import get_scheduler
+
+# How long every sound "plays"; short, so completions do not pile up
+_DURATION = 0.001
+
+
+class _MixingBackend:
+    """Backend that mixes every sound into a silent output and keeps no state."""
+
+    signals_completion = True
+
+    def play(self, sound, data, *, block=False, done=None) -> None:  # noqa: ANN001
+        if done is not None:
+            get_scheduler().call_later(_DURATION, done.set)
+
+    def is_available(self) -> bool:
+        return True
+
+
+def _reference(calls: int) -> None:
+    total = 0
+    for i in range(calls):
+        total += i * i % 7
+
+
+def _throughput(threads: int, calls: int, work: Callable[[int], None]) -> float:
+    """Total calls per second with ``threads`` threads each running ``work``."""
+    barrier = threading.Barrier(threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        work(calls)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50_000, help="per thread")
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--min-efficiency",
+        type=float,
+        default=None,
+        help="fail if speedup/threads at the highest count is below this",
+    )
+    args = parser.parse_args()
+
+    beeper = Beeper(candidates=[("mixing", _MixingBackend)])
+
+    def play(calls: int) -> None:
+        for _ in range(calls):
+            beeper.play(Sound.OK)
+        beeper.flush(timeout=10.0)
+
+    play(1000)  # select the backend, load the sound
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>7} {'play() calls/s':>15} {'speedup':>8} {'reference':>10}")
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_threads:
+        counts.append(counts[-1] * 2)
+    base = reference_base = 0.0
+    efficiency = 1.0
+    for threads in counts:
+        rate = _throughput(threads, args.calls, play)
+        reference = _throughput(threads, args.calls, _reference)
+        base = base or rate
+        reference_base = reference_base or reference
+        efficiency = rate / base / threads
+        print(
+            f"{threads:>7} {rate:>15,.0f} {rate / base:>7.2f}x "
+            f"{reference / reference_base:>9.2f}x"
+        )
+    beeper.close()
+
+    if args.min_efficiency is not None and efficiency < args.min_efficiency:
+        print(f"Scaling efficiency {efficiency:.2f} < {args.min_efficiency}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Hatch build hook regenerating the bundled sound manifest."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class ManifestBuildHook(BuildHookInterface):
+    """Write ``src/beep_lite/assets/manifest.json`` before every build."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        package = Path(self.root) / "src" / "beep_lite"
+        # Load the module by path: the package itself is not importable here.
+        spec = importlib.util.spec_from_file_location(
+            "_beep_lite_manifest", package / "manifest.py"
+        )
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+            module.write_manifest(package / "assets")
+        finally:
+            del sys.modules[spec.name]
@@ -16,19 +16,62 @@ Using Sound enum:
     >>> play(Sound.SCAN_NG)
 
 All functions are exception-safe - they will never crash your application.
-Errors are logged as warnings.
+Errors are logged as rate-limited warnings and counted (see error_counts()).
 """
 
-from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
-from .api import crit, mew, moo, ng, ok, play, scan_ng, scan_ok, warn
-from .loader import clear_cache, preload_all
+from ._version import __version__
+from .api import (
+    crit,
+    mew,
+    moo,
+    ng,
+    ok,
+    play,
+    play_after,
+    play_at,
+    play_file,
+    scan_ng,
+    scan_ok,
+    warn,
+)
+from .core import Beeper, flush, flush_on_exit
+from .loader import cache_stats, clear_cache, preload_all
+from .manifest import duration
+from .reporting import error_counts, reset_error_counts
+from .scheduler import ScheduledCall
+from .staleness import dropped_counts, reset_dropped_counts, set_max_age
 from .types import Sound
 
-try:
-    __version__ = version("beep-lite")
-except PackageNotFoundError:
-    __version__ = "0.0.0+local"
+# Public names whose modules are only imported on first use, so that scripts
+# that just beep do not pay for them at startup.
+_LAZY = {
+    "Alarm": "alarm",
+    "repeat": "alarm",
+    "RenderJob": "_render",
+    "render": "_render",
+    "render_batch": "_render",
+    "Router": "routing",
+    "prefork": "_prefork",
+    "warmup": "_warmup",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Main API functions
@@ -41,11 +84,33 @@ __all__ = [
     "scan_ok",
     "scan_ng",
     "play",
+    "play_at",
+    "play_after",
+    "play_file",
+    "duration",
+    "repeat",
+    "render",
+    "render_batch",
     # Types
     "Sound",
+    "Beeper",
+    "Router",
+    "ScheduledCall",
+    "Alarm",
+    "RenderJob",
     # Utilities
     "preload_all",
+    "warmup",
+    "prefork",
     "clear_cache",
+    "cache_stats",
+    "flush",
+    "flush_on_exit",
+    "error_counts",
+    "reset_error_counts",
+    "set_max_age",
+    "dropped_counts",
+    "reset_dropped_counts",
     # Metadata
     "__version__",
 ]
@@ -0,0 +1,7 @@
+"""Allow ``python -m beep_lite``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
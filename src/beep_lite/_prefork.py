@@ -0,0 +1,75 @@
+"""Sharing decoded sounds with pre-forked worker processes.
+
+Pre-fork servers (gunicorn, uWSGI, multiprocessing with ``fork``) would
+otherwise decode every sound again in each worker and keep one copy per
+process. :func:`prefork` builds the complete cache in the parent instead:
+
+    >>> import beep_lite
+    >>> beep_lite.prefork()        # in the parent, before the workers fork
+    >>> ...                        # in a worker
+    >>> beep_lite.ok()
+
+The decoded audio is packed into one anonymous shared mapping (see
+:func:`beep_lite.pcm_cache.pack`), which every child reads in place. The
+active backend also prepares each sound in the parent, so its per-sound
+objects are inherited rather than rebuilt.
+
+Threads, player processes and device handles cannot be shared. A handler
+that :mod:`beep_lite.core` registers with :func:`os.register_at_fork` resets
+them in every forked child, whether or not :func:`prefork` was called: module
+locks are replaced, the scheduler and alarms start empty, and each beeper's
+backend drops what it inherited via its ``after_fork()`` hook, keeping
+prepared sounds. The child starts its own threads and players on its first
+sound.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from . import core, pcm_cache
+from .loader import SoundNotFoundError, load_wav
+from .pcm import output_format
+from .reporting import report_failure
+from .types import Sound
+
+logger = logging.getLogger(__name__)
+
+
+def prefork(beeper: core.Beeper | None = None) -> int:
+    """Load, decode and prepare every sound ahead of forking workers.
+
+    Call it in the parent once it is configured (``BEEP_LITE_OUTPUT_FORMAT``
+    and the like) and before any worker is forked. Failures are reported
+    like playback failures and never raised. Calling :func:`gc.freeze` right
+    before forking also keeps the garbage collector from touching the
+    inherited objects.
+
+    Args:
+        beeper: The :class:`~beep_lite.core.Beeper` whose backend should
+            prepare the sounds, by default the one behind the module-level
+            functions.
+
+    Returns:
+        Bytes of decoded audio shared with the children.
+    """
+    target = beeper if beeper is not None else core.default_beeper()
+    datas: dict[Sound, bytes] = {}
+    for sound in Sound:
+        try:
+            datas[sound] = load_wav(sound)
+        except SoundNotFoundError as e:
+            report_failure("prefork", e, logger, "Failed to load %s: %s", sound, e)
+    size = 0
+    try:
+        size = pcm_cache.pack(datas.values(), output_format())
+    except Exception as e:
+        report_failure("prefork", e, logger, "Packing sounds failed: %s", e)
+    try:
+        prepare = getattr(target._get_backend(), "prepare", None)
+        if prepare is not None:
+            for sound, data in datas.items():
+                prepare(sound, data)
+    except Exception as e:
+        report_failure("prefork", e, logger, "Preparing sounds failed: %s", e)
+    return size
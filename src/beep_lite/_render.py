@@ -0,0 +1,155 @@
+"""Offline rendering of sounds and sequences to WAV data or files.
+
+Uses the same loading, decoding and format conversion (and caches) as
+playback, so a rendered file sounds exactly like the live beep:
+
+    >>> from beep_lite import Sound, render
+    >>> data = render(Sound.OK, fmt="48000:2:2")               # WAV bytes
+    >>> render([Sound.SCAN_OK, 0.1, Sound.SCAN_OK], gain=0.5, path="double.wav")
+
+Whole notification sets are rendered with :func:`render_batch`, in a
+process pool when the set is large enough for that to pay off.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import wave
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from .loader import load_wav
+from .pcm import PcmFormat, from_samples, parse_format, silence, to_samples
+from .pcm_cache import load_pcm
+from .types import Sound
+
+# Batches smaller than this are rendered in-process: starting worker
+# processes costs more than converting a handful of short sounds.
+_POOL_THRESHOLD = 16
+
+Item = Sound | float
+"""A sound, or a pause of that many seconds."""
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """Arguments of one :func:`render` call, for :func:`render_batch`.
+
+    Attributes:
+        sounds: A sound, or a sequence of sounds and pauses in seconds.
+        gain: Linear amplitude factor; results are clipped to full scale.
+        fmt: Output format (``PcmFormat`` or ``"rate[:channels[:width]]"``),
+            by default that of the first sound.
+    """
+
+    sounds: Item | Sequence[Item]
+    gain: float = 1.0
+    fmt: PcmFormat | str | None = None
+
+
+def render(
+    sounds: Item | Sequence[Item],
+    *,
+    gain: float = 1.0,
+    fmt: PcmFormat | str | None = None,
+    path: str | os.PathLike[str] | None = None,
+) -> bytes:
+    """Render a sound or a sequence of sounds and pauses as a WAV file.
+
+    Args:
+        sounds: A :class:`~beep_lite.types.Sound`, or a sequence of sounds
+            and pauses (in seconds) played one after another.
+        gain: Linear amplitude factor; results are clipped to full scale.
+        fmt: Output format (``PcmFormat`` or ``"rate[:channels[:width]]"``),
+            by default that of the first sound.
+        path: If given, also write the WAV file there (in a single write).
+
+    Returns:
+        The WAV file data.
+
+    Raises:
+        ValueError: If ``gain`` or a pause is negative, or the format of a
+            sequence of pauses only is not given.
+        SoundNotFoundError: If a bundled WAV file is missing.
+    """
+    items = [sounds] if isinstance(sounds, (Sound, int, float)) else list(sounds)
+    if gain < 0:
+        raise ValueError(f"gain must not be negative, got {gain}")
+    target = parse_format(fmt) if isinstance(fmt, str) else fmt
+    if target is None:
+        first = next((item for item in items if isinstance(item, Sound)), None)
+        if first is None:
+            raise ValueError("fmt is required to render pauses only")
+        target = load_pcm(load_wav(first)).format
+
+    chunks: list[bytes | memoryview] = []
+    for item in items:
+        if isinstance(item, Sound):
+            chunks.append(load_pcm(load_wav(item), target).frames)
+        elif item < 0:
+            raise ValueError(f"pause must not be negative, got {item}")
+        else:
+            chunks.append(silence(target, round(target.rate * item)))
+    frames = b"".join(chunks)
+    if gain != 1.0:
+        scaled = [value * gain for value in to_samples(frames, target.width)]
+        frames = from_samples(scaled, target.width)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(target.channels)
+        writer.setsampwidth(target.width)
+        writer.setframerate(target.rate)
+        writer.writeframes(frames)
+    data = buffer.getvalue()
+    if path is not None:
+        Path(path).write_bytes(data)
+    return data
+
+
+def _render_to(path: Path, job: RenderJob) -> Path:
+    render(job.sounds, gain=job.gain, fmt=job.fmt, path=path)
+    return path
+
+
+def render_batch(
+    jobs: Mapping[str | os.PathLike[str], RenderJob | Item | Sequence[Item]],
+    *,
+    processes: int | None = None,
+) -> list[Path]:
+    """Render a set of files, in parallel worker processes if it is large.
+
+    Every file is written with a single write by the process rendering it.
+
+    Args:
+        jobs: Output path to :class:`RenderJob` (or just what to render, for
+            the default gain and format).
+        processes: Number of worker processes, by default the CPU count.
+            1 renders everything in this process.
+
+    Returns:
+        The written paths, in the order of ``jobs``.
+
+    Raises:
+        ValueError: If a job is invalid (see :func:`render`).
+    """
+    work = [
+        (Path(path), job if isinstance(job, RenderJob) else RenderJob(job))
+        for path, job in jobs.items()
+    ]
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(work) < _POOL_THRESHOLD:
+        return [_render_to(path, job) for path, job in work]
+    # Imported here: multiprocessing is heavy and only needed for big sets.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Spawned, not forked: this process may have playback threads holding
+    # locks that a forked child would inherit held.
+    with ProcessPoolExecutor(
+        max_workers=min(processes, len(work)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        return list(pool.map(_render_to, *zip(*work, strict=True)))
@@ -0,0 +1,3 @@
+"""Package version, kept in one place for hatch and the runtime."""
+
+__version__ = "0.1.3"
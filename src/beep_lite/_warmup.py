@@ -0,0 +1,112 @@
+"""Parallel warm-up of assets, backend and output device.
+
+:func:`~beep_lite.loader.preload_all` only fills the WAV bytes cache. The
+backend is still selected, its library imported, every sound decoded and the
+device opened on the first real beep - exactly when an operator is waiting.
+:func:`warmup` does all of that up front, in parallel threads.
+
+Example:
+    >>> import beep_lite
+    >>> ready = beep_lite.warmup()              # returns immediately
+    >>> ...                                     # rest of application start-up
+    >>> ready.result(timeout=2.0)               # optional: wait for it
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from . import core, selection
+from .backends import Backend
+from .loader import load_wav
+from .reporting import report_failure
+from .types import Sound
+
+logger = logging.getLogger(__name__)
+
+
+def _init_backend(beeper: core.Beeper, select_fastest: bool) -> Backend:
+    if select_fastest:
+        beeper._select_fastest()
+    backend = beeper._get_backend()
+    prime = getattr(backend, "prime", None)
+    if prime is not None:
+        try:
+            prime()
+        except Exception as e:
+            report_failure("warmup", e, logger, "Priming the device failed: %s", e)
+    return backend
+
+
+def _warm_sound(sound: Sound, backend_future: Future[Backend]) -> None:
+    try:
+        data = load_wav(sound)
+        prepare = getattr(backend_future.result(), "prepare", None)
+        if prepare is not None:
+            prepare(sound, data)
+        logger.debug("Warmed up sound: %s", sound.value)
+    except Exception as e:
+        report_failure("warmup", e, logger, "Failed to warm up %s: %s", sound.value, e)
+
+
+def warmup(
+    background: bool = True,
+    *,
+    hold_playback: bool = False,
+    timeout: float = 1.0,
+    beeper: core.Beeper | None = None,
+    select_fastest: bool | None = None,
+) -> Future[None]:
+    """Load and decode all sounds and initialise the backend and device.
+
+    Loading, decoding and backend initialisation run on parallel worker
+    threads. Failures are reported like playback failures and never raised.
+
+    Args:
+        background: If True, return immediately; otherwise return once done.
+        hold_playback: If True, sounds requested before warm-up finishes wait
+            for it (at most ``timeout`` seconds) so that they play at full
+            speed instead of competing with the warm-up.
+        timeout: Longest time a held sound waits before playing anyway.
+        beeper: The :class:`~beep_lite.core.Beeper` to warm up, by default
+            the one behind the module-level functions.
+        select_fastest: Pick the backend with the lowest measured latency
+            instead of the first available one, probing them unless a
+            ranking is cached (see :mod:`beep_lite.selection`). By default
+            only if ``BEEP_LITE_BACKEND_SELECTION=latency``.
+
+    Returns:
+        A future that completes when warm-up has finished.
+    """
+    target = beeper if beeper is not None else core.default_beeper()
+    if select_fastest is None:
+        select_fastest = selection.enabled()
+    ready: Future[None] = Future()
+    gate = threading.Event()
+    if hold_playback:
+        target._set_ready_gate(gate, timeout)
+
+    def _run() -> None:
+        sounds = list(Sound)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(sounds) + 1, thread_name_prefix="beep-lite-warmup"
+            ) as pool:
+                backend_future = pool.submit(_init_backend, target, select_fastest)
+                for sound in sounds:
+                    pool.submit(_warm_sound, sound, backend_future)
+        except Exception as e:
+            report_failure("warmup", e, logger, "Warm-up failed: %s", e)
+        finally:
+            gate.set()
+            if target._ready_gate is gate:
+                target._set_ready_gate(None)
+            ready.set_result(None)
+
+    if background:
+        threading.Thread(target=_run, name="beep-lite-warmup", daemon=True).start()
+    else:
+        _run()
+    return ready
@@ -0,0 +1,169 @@
+"""Repeating alarms that sound until acknowledged.
+
+Example:
+    >>> import beep_lite
+    >>> from beep_lite import Sound
+    >>> alarm = beep_lite.repeat(Sound.CRIT, interval=5.0)
+    >>> ...                      # operator presses "acknowledge"
+    >>> alarm.ack()
+
+Alarms run on the shared scheduler thread (see :mod:`beep_lite.scheduler`),
+so any number of them costs no extra threads. Active alarms of the same
+sound are coalesced: they beep together at the shortest interval among them
+instead of each adding its own beeps. Each alarm still counts (and stops
+after ``max_count``) only the beeps at its own interval.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from .api import play_at
+from .scheduler import ScheduledCall, get_scheduler
+from .types import Sound
+
+_lock = threading.Lock()
+# sound -> group of its active alarms
+_groups: dict[Sound, _AlarmGroup] = {}
+
+
+class Alarm:
+    """Handle of a repeating alarm created by :func:`repeat`.
+
+    Attributes:
+        sound: The sound being repeated.
+        interval: Requested seconds between beeps.
+        max_count: Number of beeps after which the alarm stops by itself, or
+            None to repeat until acknowledged.
+        count: Beeps sounded for this alarm so far.
+    """
+
+    def __init__(self, sound: Sound, interval: float, max_count: int | None) -> None:
+        self.sound = sound
+        self.interval = interval
+        self.max_count = max_count
+        self.count = 0
+        self._active = True
+        # When this alarm's next beep is due (time.monotonic())
+        self._due = 0.0
+
+    @property
+    def active(self) -> bool:
+        """True until the alarm is acknowledged or reaches ``max_count``."""
+        return self._active
+
+    def ack(self) -> None:
+        """Acknowledge the alarm so that it stops repeating.
+
+        Other alarms of the same sound keep sounding. Acknowledging twice is
+        harmless.
+        """
+        with _lock:
+            group = _groups.get(self.sound)
+            if group is not None:
+                group.remove(self)
+            self._active = False
+
+
+class _AlarmGroup:
+    """All active alarms of one sound, driven by a single scheduled call.
+
+    Must only be used with the module ``_lock`` held.
+    """
+
+    def __init__(self, sound: Sound) -> None:
+        self.sound = sound
+        self.alarms: list[Alarm] = []
+        self.call: ScheduledCall | None = None
+        # When the group last beeped; None before its first beep
+        self.last: float | None = None
+
+    def add(self, alarm: Alarm) -> None:
+        self.alarms.append(alarm)
+        if self.call is None:
+            alarm._due = time.monotonic()
+            self._schedule(alarm._due)
+            return
+        # Join the group's cadence: beep with the next group beep, or one
+        # interval after the last one if that is sooner.
+        alarm._due = self.call.when
+        if self.last is not None and self.last + alarm.interval < alarm._due:
+            alarm._due = self.last + alarm.interval
+            self.call.cancel()
+            self._schedule(alarm._due)
+
+    def remove(self, alarm: Alarm) -> None:
+        if alarm in self.alarms:
+            self.alarms.remove(alarm)
+        if not self.alarms:
+            if self.call is not None:
+                self.call.cancel()
+            del _groups[self.sound]
+
+    def _schedule(self, when: float) -> None:
+        self.call = get_scheduler().call_at(when, lambda: self._fire(when))
+
+    def _fire(self, due: float) -> None:
+        with _lock:
+            if not self.alarms:
+                return
+            # Alarms due within half the shortest interval share this beep
+            # rather than adding one of their own shortly after.
+            slack = min(alarm.interval for alarm in self.alarms) / 2
+            beep = False
+            for alarm in list(self.alarms):
+                if alarm._due > due + slack:
+                    continue
+                beep = True
+                alarm.count += 1
+                alarm._due = due + alarm.interval
+                if alarm.max_count is not None and alarm.count >= alarm.max_count:
+                    alarm._active = False
+                    self.alarms.remove(alarm)
+            if beep:
+                self.last = due
+            if self.alarms:
+                # Keep the cadence, but do not try to catch up on missed beeps.
+                upcoming = min(alarm._due for alarm in self.alarms)
+                self._schedule(max(upcoming, time.monotonic()))
+            else:
+                self.call = None
+                del _groups[self.sound]
+        # Nothing is due if the alarm this call was scheduled for was acked.
+        if beep:
+            # Plays right away; the sound's maximum age counts from ``due``.
+            play_at(self.sound, due)
+
+
+def repeat(
+    sound: Sound = Sound.CRIT, interval: float = 5.0, max_count: int | None = None
+) -> Alarm:
+    """Play a sound now and then every ``interval`` seconds until acknowledged.
+
+    Never raises exceptions - playback errors are reported as rate-limited
+    warnings.
+
+    Args:
+        sound: The sound to repeat.
+        interval: Seconds between beeps.
+        max_count: Stop by itself after this many beeps; None repeats until
+            :meth:`Alarm.ack` is called.
+
+    Returns:
+        The alarm handle.
+
+    Raises:
+        ValueError: If ``interval`` or ``max_count`` is not positive.
+    """
+    if interval <= 0:
+        raise ValueError(f"interval must be positive, got {interval}")
+    if max_count is not None and max_count < 1:
+        raise ValueError(f"max_count must be at least 1, got {max_count}")
+    alarm = Alarm(sound, interval, max_count)
+    with _lock:
+        group = _groups.get(sound)
+        if group is None:
+            group = _groups[sound] = _AlarmGroup(sound)
+        group.add(alarm)
+    return alarm
@@ -11,125 +11,161 @@ Example:
     >>> beep.play(Sound.SCAN_OK)  # Play using enum
 """
 
-import logging
+import os
 
-from .core import play_sound
+from .core import default_beeper
+from .scheduler import ScheduledCall
 from .types import Sound
 
-logger = logging.getLogger(__name__)
-
 
 def ok() -> None:
     """Play the OK/success notification sound.
 
     Use this for normal completion of operations.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.OK)
-    except Exception as e:
-        logger.warning(f"Failed to play OK sound: {e}")
+    default_beeper().ok()
 
 
 def ng() -> None:
     """Play the NG/error notification sound.
 
     Use this for errors or failures.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.NG)
-    except Exception as e:
-        logger.warning(f"Failed to play NG sound: {e}")
+    default_beeper().ng()
 
 
 def warn() -> None:
     """Play the warning notification sound.
 
     Use this for warnings that need attention.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.WARN)
-    except Exception as e:
-        logger.warning(f"Failed to play WARN sound: {e}")
+    default_beeper().warn()
 
 
 def crit() -> None:
     """Play the critical/urgent notification sound.
 
     Use this for critical situations requiring immediate attention.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.CRIT)
-    except Exception as e:
-        logger.warning(f"Failed to play CRIT sound: {e}")
+    default_beeper().crit()
 
 
 def moo() -> None:
     """Play the 'moo' notification sound.
 
     A playful low-frequency notification sound.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.MOO)
-    except Exception as e:
-        logger.warning(f"Failed to play MOO sound: {e}")
+    default_beeper().moo()
 
 
 def mew() -> None:
     """Play the 'mew' notification sound.
 
     A light high-frequency notification sound.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.MEW)
-    except Exception as e:
-        logger.warning(f"Failed to play MEW sound: {e}")
+    default_beeper().mew()
 
 
 def scan_ok() -> None:
     """Play the scan success notification sound.
 
     Use this for successful barcode/QR scans.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.SCAN_OK)
-    except Exception as e:
-        logger.warning(f"Failed to play SCAN_OK sound: {e}")
+    default_beeper().scan_ok()
 
 
 def scan_ng() -> None:
     """Play the scan failure notification sound.
 
     Use this for failed barcode/QR scans.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
     """
-    try:
-        play_sound(Sound.SCAN_NG)
-    except Exception as e:
-        logger.warning(f"Failed to play SCAN_NG sound: {e}")
+    default_beeper().scan_ng()
 
 
-def play(sound: Sound) -> None:
+def play(sound: Sound, *, block: bool = False, timeout: float | None = None) -> None:
     """Play a notification sound by Sound enum.
 
     This is the generic play function that accepts any Sound enum value.
-    Never raises exceptions - errors are logged as warnings.
+    Never raises exceptions - errors are reported as rate-limited warnings.
 
     Args:
         sound: The Sound enum value to play.
+        block: If True, return only once the sound has finished playing.
+        timeout: With ``block``, the longest time to wait in seconds.
 
     Example:
         >>> from beep_lite import play, Sound
         >>> play(Sound.OK)
-        >>> play(Sound.SCAN_NG)
+        >>> play(Sound.SCAN_NG, block=True, timeout=1.0)
+    """
+    default_beeper().play(sound, block=block, timeout=timeout)
+
+
+def play_file(
+    path: str | os.PathLike[str], *, block: bool = False, timeout: float | None = None
+) -> None:
+    """Play a WAV file, e.g. a recorded announcement.
+
+    Files larger than ``beep_lite.stream.STREAM_THRESHOLD`` are streamed:
+    they are read and played chunk by chunk, so memory use does not grow with
+    their length. Smaller ones are decoded once and cached like the built-in
+    sounds.
+    Never raises exceptions - errors are reported as rate-limited warnings.
+
+    Args:
+        path: The WAV file.
+        block: If True, return only once the file has finished playing.
+        timeout: With ``block``, the longest time to wait in seconds.
+
+    Example:
+        >>> from beep_lite import play_file
+        >>> play_file("announcements/line-stop.wav")
+    """
+    default_beeper().play_file(path, block=block, timeout=timeout)
+
+
+def play_at(sound: Sound, t: float) -> ScheduledCall:
+    """Schedule a notification sound at a ``time.monotonic()`` timestamp.
+
+    All scheduled sounds share one scheduler thread. Timestamps in the past
+    play as soon as possible. The sound's maximum age (see ``set_max_age``)
+    counts from ``t``.
+    Never raises exceptions - errors are reported as rate-limited warnings.
+
+    Args:
+        sound: The Sound enum value to play.
+        t: When to play, on the ``time.monotonic()`` clock.
+
+    Returns:
+        A handle whose ``cancel()`` stops the sound if it has not played yet.
+
+    Example:
+        >>> import time
+        >>> from beep_lite import play_at, Sound
+        >>> handle = play_at(Sound.WARN, time.monotonic() + 5.0)
+        >>> handle.cancel()
+    """
+    return default_beeper().play_at(sound, t)
+
+
+def play_after(sound: Sound, delay: float) -> ScheduledCall:
+    """Schedule a notification sound ``delay`` seconds from now.
+
+    Never raises exceptions - errors are reported as rate-limited warnings.
+
+    Args:
+        sound: The Sound enum value to play.
+        delay: Seconds to wait before playing.
+
+    Returns:
+        A handle whose ``cancel()`` stops the sound if it has not played yet.
     """
-    try:
-        play_sound(sound)
-    except Exception as e:
-        logger.warning(f"Failed to play {sound.value} sound: {e}")
+    return default_beeper().play_after(sound, delay)
@@ -1,26 +1,109 @@
 """Backend implementations for sound playback."""
 
+import logging
 from typing import Protocol
 
 from ..types import Sound
 
+logger = logging.getLogger(__name__)
+
+
+class PlaybackListener(Protocol):
+    """Receives the outcome of playback attempts from a backend.
+
+    Backends swallow their own errors (often on a worker thread), so this is
+    how the health layer learns that a device has gone away.
+    """
+
+    def playback_succeeded(self) -> None:
+        """Called after a sound was handed to the device successfully."""
+        ...
+
+    def playback_failed(self, error: BaseException) -> None:
+        """Called when a playback attempt failed.
+
+        Args:
+            error: The exception the backend caught.
+        """
+        ...
+
+
+class ProbeListener:
+    """Listener remembering whether a probe playback failed.
+
+    Attributes:
+        error: The exception of the last failed attempt, or None.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a listener that has seen no failure."""
+        self.error: BaseException | None = None
+
+    def playback_succeeded(self) -> None:
+        """Ignore successful attempts."""
+
+    def playback_failed(self, error: BaseException) -> None:
+        """Remember ``error``."""
+        self.error = error
+
+
+class CompletionSignal(Protocol):
+    """Set by a backend once a sound has finished playing (or failed)."""
+
+    def set(self) -> None:
+        """Signal completion. Called exactly once per play."""
+        ...
+
 
 class Backend(Protocol):
     """Protocol for sound playback backends.
 
-    All backend implementations must conform to this interface.
+    All backend implementations must conform to this interface; plugin
+    backends (see :mod:`beep_lite.plugins`) may also take just
+    ``play(sound, data)``, and are then not passed any keywords. Backends may
+    additionally provide any of these optional members:
+
+    * ``listener``: writable attribute; if set, every attempt is reported to
+      it as a :class:`PlaybackListener`.
+    * ``prepare(sound, data)``: decode/convert a sound ahead of time so the
+      first ``play`` of it is as fast as later ones.
+    * ``prime()``: open or warm up the output device without being audible.
+    * ``close()``: release processes, threads or device handles.
+    * ``play_stream(stream, *, block=False, done=None)``: play a
+      :class:`~beep_lite.stream.PcmStream` (a long file) chunk by chunk,
+      without holding all of it in memory. Takes ``done`` like ``play``.
+    * ``after_fork()``: called in a forked child process; forget the
+      threads, processes and device handles inherited from the parent
+      without touching them, but keep prepared sounds. Candidate backends
+      without it are created again in the child on first use.
+    * ``checks_staleness``: class attribute; if True, non-blocking ``play``
+      calls also pass ``enqueued`` (``time.monotonic()`` of the request) and
+      ``limits`` (the beeper's per-sound maximum ages, or None) keywords.
+      Backends that queue sounds check them with
+      :func:`beep_lite.staleness.is_stale` when a sound leaves the queue, so
+      a backlog cannot make a sound play later than its maximum age.
+    * ``signals_completion``: class attribute; if True, ``play`` also accepts
+      a ``done`` keyword (any object with a ``set()`` method, usually a
+      ``threading.Event``) and calls ``done.set()`` once the sound has
+      finished playing or failed, without blocking the caller.
+    * ``signals_start``: class attribute; if True, ``play`` also accepts a
+      ``started`` keyword, set like ``done`` but as soon as the device has
+      taken the sound and is playing it (or it failed or was dropped). Used
+      to measure a backend's start latency (see :mod:`beep_lite.selection`).
     """
 
-    def play(self, sound: Sound, data: bytes) -> None:
+    def play(self, sound: Sound, data: bytes, *, block: bool = False) -> None:
         """Play a sound asynchronously.
 
         Args:
             sound: The sound type to play.
             data: The WAV file data as bytes.
+            block: If True, return only once playback has finished.
 
         Note:
-            This method should not block the calling thread.
-            Implementations should handle errors gracefully without raising.
+            Unless ``block`` is set, this method should not block the calling
+            thread. Implementations should handle errors gracefully without
+            raising.
         """
         ...
 
@@ -31,3 +114,18 @@ class Backend(Protocol):
             True if the backend can be used, False otherwise.
         """
         ...
+
+
+def close_backend(backend: Backend | None) -> None:
+    """Call a backend's optional ``close()``, logging instead of raising.
+
+    Args:
+        backend: The backend to close; None and backends without ``close``
+            are ignored.
+    """
+    close = getattr(backend, "close", None)
+    if close is not None:
+        try:
+            close()
+        except Exception as e:
+            logger.debug("Closing backend failed: %s", e)
@@ -1,33 +1,169 @@
 """Fallback backend using terminal bell."""
 
+from __future__ import annotations
+
 import logging
 import sys
+import threading
+import time
 
+from ..reporting import report_failure
+from ..stream import PcmStream
 from ..types import Sound
+from . import CompletionSignal, PlaybackListener
 
 logger = logging.getLogger(__name__)
 
+# Bells requested within this long of the last one are merged into one.
+_COALESCE_SECONDS = 0.05
+# Longest time play(block=True) waits for a stalled stderr.
+_BLOCK_TIMEOUT = 1.0
+
 
 class FallbackBackend:
     """Fallback backend using terminal bell.
 
     This backend works on any platform but only produces a simple beep.
     It ignores the actual sound type and just outputs the bell character.
+
+    The bell is written by a background thread, so a stderr piped to a slow
+    or stalled reader never holds up the caller. Bells requested while one
+    is being written, or within ``_COALESCE_SECONDS`` after it, are merged
+    into a single bell (terminals merge them anyway). When stderr is not a
+    terminal nothing is written at all.
     """
 
-    def play(self, sound: Sound, data: bytes) -> None:
-        """Play a terminal bell sound.
+    listener: PlaybackListener | None = None
+    signals_completion = True
+
+    def __init__(self) -> None:
+        """Initialize the fallback backend."""
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        # Callers of play(block=True) waiting for the next bell to be written
+        self._waiters: list[threading.Event] = []
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        # (stream, whether it is a terminal), re-checked if stderr is replaced
+        self._tty: tuple[object, bool] = (None, False)
+
+    def _stderr_is_tty(self) -> bool:
+        stream = sys.stderr
+        checked, tty = self._tty
+        if checked is not stream or stream is None:
+            try:
+                tty = stream is not None and stream.isatty()
+            except (AttributeError, ValueError, OSError):
+                tty = False
+            self._tty = (stream, tty)
+        return tty
+
+    def play(
+        self,
+        sound: Sound,
+        data: bytes,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+    ) -> None:
+        """Request a terminal bell.
 
         Args:
             sound: The sound type (ignored, only bell is played).
             data: The WAV file data (ignored).
+            block: If True, wait (at most one second) until the bell has been
+                written.
+            done: Set once the bell has been handed to the writer thread, or
+                skipped. The bell itself has no duration.
         """
+        try:
+            if not self._stderr_is_tty():
+                logger.debug("stderr is not a terminal, skipping bell")
+                return
+            waiter = threading.Event() if block else None
+            with self._lock:
+                if waiter is not None:
+                    self._waiters.append(waiter)
+                if self._thread is None:
+                    self._stop = threading.Event()
+                    self._thread = threading.Thread(
+                        target=self._run,
+                        args=(self._stop, self._wake),
+                        name="beep-lite-bell",
+                        daemon=True,
+                    )
+                    self._thread.start()
+                self._wake.set()
+            if waiter is not None and not waiter.wait(_BLOCK_TIMEOUT):
+                logger.debug("Timed out waiting for the bell to be written")
+        finally:
+            if done is not None:
+                done.set()
+
+    def play_stream(
+        self,
+        stream: PcmStream,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+    ) -> None:
+        """Ring the bell for a long sound; its audio is not read.
+
+        Args:
+            stream: The sound (ignored).
+            block: If True, wait until the bell has been written.
+            done: Set once the bell has been handed over, or skipped.
+        """
+        self.play(Sound.OK, b"", block=block, done=done)
+
+    def _run(self, stop: threading.Event, wake: threading.Event) -> None:
+        while True:
+            wake.wait()
+            if stop.is_set():
+                return
+            # Everything requested up to here is served by this one bell.
+            wake.clear()
+            with self._lock:
+                waiters, self._waiters = self._waiters, []
+            self._ring()
+            for waiter in waiters:
+                waiter.set()
+            time.sleep(_COALESCE_SECONDS)
+
+    def _ring(self) -> None:
         try:
             # Output bell character to stderr to avoid interfering with stdout
             sys.stderr.write("\a")
             sys.stderr.flush()
         except Exception as e:
-            logger.warning(f"Fallback bell failed: {e}")
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure("fallback", e, logger, "Fallback bell failed: %s", e)
+        else:
+            if self.listener is not None:
+                self.listener.playback_succeeded()
+
+    def after_fork(self) -> None:
+        """Forget the parent's writer thread and pending bells."""
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._waiters = []
+        self._thread = None
+        self._stop = threading.Event()
+
+    def close(self) -> None:
+        """Stop the writer thread; pending bells are dropped."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop.set()
+            self._wake.set()
+            # The next writer must not ring for requests made before close.
+            self._wake = threading.Event()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.set()
+        if thread is not None:
+            thread.join(timeout=_BLOCK_TIMEOUT)
 
     def is_available(self) -> bool:
         """Check if fallback is available.
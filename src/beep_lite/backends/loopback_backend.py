@@ -0,0 +1,265 @@
+"""Virtual output device that reports when each sound becomes audible.
+
+A stand-in for a sound card plus loopback capture, for measuring end-to-end
+latency on hosts without audio hardware (see
+``benchmarks/bench_latency_slo.py``). Sounds are decoded like on a real
+backend, handed to a device thread the way a backend hands buffers to an
+audio server, and scanned for their first non-silent sample. The time that
+sample would reach the speaker is recorded as an :class:`Onset`.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ..pcm import Pcm, PcmFormat, convert, output_format
+from ..pcm_cache import load_pcm
+from ..reporting import report_failure
+from ..scheduler import get_scheduler
+from ..types import Sound
+from . import CompletionSignal, PlaybackListener
+
+logger = logging.getLogger(__name__)
+
+# sound, calling thread, accepted at, PCM, first audible frame, done, finished,
+# started
+_Item = tuple[
+    Sound,
+    int,
+    float,
+    Pcm,
+    int | None,
+    CompletionSignal | None,
+    threading.Event | None,
+    CompletionSignal | None,
+]
+
+
+@dataclass(frozen=True)
+class Onset:
+    """When a played sound became audible.
+
+    Attributes:
+        sound: The sound played.
+        caller: ``threading.get_ident()`` of the thread that called ``play``.
+        accepted: ``time.monotonic()`` when ``play`` was called.
+        audible: ``time.monotonic()`` when its first non-silent sample
+            reached the (virtual) speaker.
+    """
+
+    sound: Sound
+    caller: int
+    accepted: float
+    audible: float
+
+
+def first_audible_frame(pcm: Pcm, threshold: float = 0.0) -> int | None:
+    """Return the index of the first frame louder than ``threshold``.
+
+    Args:
+        pcm: The audio to scan.
+        threshold: Fraction of full scale a sample must exceed (0.0: any
+            sample that is not exactly silent).
+
+    Returns:
+        The frame index, or None if the audio is silent throughout.
+    """
+    fmt = pcm.format
+    if fmt.width != 2:
+        pcm = convert(pcm, PcmFormat(rate=fmt.rate, channels=fmt.channels, width=2))
+    samples = array("h", pcm.frames)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    limit = int(threshold * 32767)
+    for index, sample in enumerate(samples):
+        if abs(sample) > limit:
+            return index // fmt.channels
+    return None
+
+
+class LoopbackBackend:
+    """Backend that plays into a virtual device and timestamps the output.
+
+    The device mixes like an audio server: every sound starts as soon as the
+    device thread takes it, without waiting for the others. Its onset is the
+    time the device took it, plus ``latency`` (the device's own buffering),
+    plus the silence before its first audible sample. Sounds that are silent
+    throughout are not recorded.
+
+    Attributes:
+        onsets: The most recent onsets, oldest first.
+    """
+
+    listener: PlaybackListener | None = None
+    signals_completion = True
+    signals_start = True
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        *,
+        threshold: float = 0.0,
+        on_audible: Callable[[Onset], None] | None = None,
+        history: int = 1024,
+    ) -> None:
+        """Initialize the loopback backend.
+
+        Args:
+            latency: Seconds of device buffering added to every onset.
+            threshold: Fraction of full scale that counts as audible.
+            on_audible: Called on the device thread with every onset.
+            history: How many onsets :attr:`onsets` remembers.
+        """
+        self._latency = latency
+        self._threshold = threshold
+        self._on_audible = on_audible
+        self._output_format = output_format()
+        self.onsets: deque[Onset] = deque(maxlen=history)
+        # id(WAV data) -> (WAV data, PCM, first audible frame)
+        self._decoded: dict[int, tuple[bytes, Pcm, int | None]] = {}
+        self._queue: queue.SimpleQueue[_Item | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def _decode(self, data: bytes) -> tuple[Pcm, int | None]:
+        cached = self._decoded.get(id(data))
+        if cached is not None and cached[0] is data:
+            return cached[1], cached[2]
+        pcm = load_pcm(data, self._output_format)
+        first = first_audible_frame(pcm, self._threshold)
+        self._decoded[id(data)] = (data, pcm, first)
+        return pcm, first
+
+    def prepare(self, sound: Sound, data: bytes) -> None:
+        """Decode a sound and find its onset ahead of time."""
+        self._decode(data)
+
+    def prime(self) -> None:
+        """Start the device thread."""
+        self._ensure_thread()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name="beep-lite-loopback", daemon=True
+                )
+                thread.start()
+                self._thread = thread
+
+    def play(
+        self,
+        sound: Sound,
+        data: bytes,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+        started: CompletionSignal | None = None,
+    ) -> None:
+        """Hand a sound to the virtual device.
+
+        Args:
+            sound: The sound type to play.
+            data: The WAV file data as bytes.
+            block: If True, return only once the sound has finished.
+            done: Set once the sound has finished playing, or failed.
+            started: Set when the device starts the sound, or it failed.
+        """
+        accepted = time.monotonic()
+        try:
+            pcm, first = self._decode(data)
+            self._ensure_thread()
+        except Exception as e:
+            for signal in (started, done):
+                if signal is not None:
+                    signal.set()
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure(
+                "loopback",
+                e,
+                logger,
+                "loopback playback failed for %s: %s",
+                sound.value,
+                e,
+            )
+            return
+        finished = threading.Event() if block else None
+        item = (
+            sound,
+            threading.get_ident(),
+            accepted,
+            pcm,
+            first,
+            done,
+            finished,
+            started,
+        )
+        self._queue.put(item)
+        if self.listener is not None:
+            self.listener.playback_succeeded()
+        if finished is not None:
+            finished.wait()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._drain()
+                return
+            sound, caller, accepted, pcm, first, done, finished, started = item
+            start = time.monotonic() + self._latency
+            if started is not None:
+                get_scheduler().call_at(start, started.set)
+            if first is not None:
+                onset = Onset(sound, caller, accepted, start + first / pcm.format.rate)
+                self.onsets.append(onset)
+                if self._on_audible is not None:
+                    try:
+                        self._on_audible(onset)
+                    except Exception:
+                        logger.exception("Loopback onset callback failed")
+            end = start + pcm.duration
+            for signal in (done, finished):
+                if signal is not None:
+                    get_scheduler().call_at(end, signal.set)
+
+    def _drain(self) -> None:
+        """Release the waiters of sounds the device will not take any more."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                for signal in item[5:]:
+                    if signal is not None:
+                        signal.set()
+
+    def is_available(self) -> bool:
+        """The virtual device is always available."""
+        return True
+
+    def close(self) -> None:
+        """Stop the device thread; sounds it has not taken yet are dropped."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=1.0)
+
+    def after_fork(self) -> None:
+        """Forget the parent's device thread; keep decoded sounds."""
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
@@ -0,0 +1,177 @@
+"""Virtual output device that plays nothing, for tests and headless hosts."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from ..pcm_cache import load_pcm
+from ..reporting import report_failure
+from ..scheduler import get_scheduler
+from ..stream import PcmStream
+from ..types import Sound
+from . import CompletionSignal, PlaybackListener
+
+logger = logging.getLogger(__name__)
+
+
+class NullBackend:
+    """Backend that accepts sounds like a real device but outputs nothing.
+
+    Sounds "play" one after another for their real duration, as on a device
+    with its own queue: blocking plays return and completion signals are set
+    only once a sound has finished. ``latency`` adds a start-up delay to
+    every sound, to simulate a slow output.
+
+    Streamed files are read completely (as fast as they can be read) and
+    queued like a sound of the same duration.
+
+    Attributes:
+        played: The most recent sounds accepted, oldest first.
+        streamed: The most recent streamed files, oldest first.
+    """
+
+    listener: PlaybackListener | None = None
+    signals_completion = True
+    signals_start = True
+
+    def __init__(self, latency: float = 0.0, history: int = 1024) -> None:
+        """Initialize the null backend.
+
+        Args:
+            latency: Extra seconds before each sound starts.
+            history: How many sounds :attr:`played` remembers.
+        """
+        self._latency = latency
+        self.played: deque[Sound] = deque(maxlen=history)
+        self.streamed: deque[Path] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._busy_until = 0.0
+        # id(WAV data) -> (WAV data, duration)
+        self._durations: dict[int, tuple[bytes, float]] = {}
+
+    def _duration(self, data: bytes) -> float:
+        cached = self._durations.get(id(data))
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        duration = load_pcm(data, None).duration
+        self._durations[id(data)] = (data, duration)
+        return duration
+
+    def play(
+        self,
+        sound: Sound,
+        data: bytes,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+        started: CompletionSignal | None = None,
+    ) -> None:
+        """Accept a sound and signal completion after its duration.
+
+        Args:
+            sound: The sound type to play.
+            data: The WAV file data as bytes.
+            block: If True, return only once the sound has finished.
+            done: Set once the sound has finished playing, or failed.
+            started: Set when the sound starts (after ``latency`` and the
+                sounds before it), or failed.
+        """
+        try:
+            duration = self._duration(data)
+            with self._lock:
+                start = max(time.monotonic(), self._busy_until) + self._latency
+                self._busy_until = end = start + duration
+                self.played.append(sound)
+        except Exception as e:
+            for signal in (started, done):
+                if signal is not None:
+                    signal.set()
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure(
+                "null", e, logger, "null playback failed for %s: %s", sound.value, e
+            )
+            return
+        if self.listener is not None:
+            self.listener.playback_succeeded()
+        if started is not None:
+            get_scheduler().call_at(start, started.set)
+        if block:
+            time.sleep(max(0.0, end - time.monotonic()))
+            if done is not None:
+                done.set()
+        elif done is not None:
+            get_scheduler().call_at(end, done.set)
+
+    def play_stream(
+        self,
+        stream: PcmStream,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+    ) -> None:
+        """Read a long sound chunk by chunk and signal completion after it.
+
+        Args:
+            stream: The sound, from :func:`beep_lite.stream.open_stream`.
+            block: If True, return only once the sound has finished.
+            done: Set once the sound has finished playing, or failed.
+        """
+        with self._lock:
+            start = max(time.monotonic(), self._busy_until) + self._latency
+            self._busy_until = end = start + stream.duration
+            self.streamed.append(stream.path)
+        if block:
+            self._consume(stream, end, block, done)
+        else:
+            threading.Thread(
+                target=self._consume,
+                args=(stream, end, block, done),
+                name="beep-lite-null-stream",
+                daemon=True,
+            ).start()
+
+    def _consume(
+        self,
+        stream: PcmStream,
+        end: float,
+        block: bool,
+        done: CompletionSignal | None,
+    ) -> None:
+        try:
+            for _chunk in stream:
+                pass
+        except Exception as e:
+            if done is not None:
+                done.set()
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure(
+                "null", e, logger, "null streaming failed for %s: %s", stream.path, e
+            )
+            return
+        if self.listener is not None:
+            self.listener.playback_succeeded()
+        if block:
+            time.sleep(max(0.0, end - time.monotonic()))
+            if done is not None:
+                done.set()
+        elif done is not None:
+            get_scheduler().call_at(end, done.set)
+
+    def after_fork(self) -> None:
+        """Start the child with an idle output and its own lock."""
+        self._lock = threading.Lock()
+        self._busy_until = 0.0
+
+    def is_available(self) -> bool:
+        """The null backend is always available.
+
+        Returns:
+            True.
+        """
+        return True
@@ -0,0 +1,610 @@
+"""Backend streaming raw PCM to command-line players (aplay, pw-play, paplay).
+
+Used on Linux hosts where the simpleaudio C extension cannot be built.
+Instead of paying fork+exec per beep, a small pool of long-lived player
+processes is kept per PCM format and sounds are written to their stdin.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+
+from ..pcm import Pcm, PcmFormat, output_format, silence
+from ..pcm_cache import load_pcm
+from ..reporting import report_failure
+from ..scheduler import get_scheduler
+from ..staleness import count_drop, is_stale
+from ..stream import PcmStream
+from ..types import Sound
+from . import CompletionSignal, PlaybackListener
+
+logger = logging.getLogger(__name__)
+
+_ALSA_FORMATS = {1: "U8", 2: "S16_LE", 3: "S24_3LE", 4: "S32_LE"}
+_PIPEWIRE_FORMATS = {1: "u8", 2: "s16", 3: "s24", 4: "s32"}
+_PULSE_FORMATS = {1: "u8", 2: "s16le", 3: "s24le", 4: "s32le"}
+
+# aplay only writes whole periods and blocks on stdin until a period is full,
+# so every sound is padded with silence up to this granularity (seconds).
+_PAD_SECONDS = 0.05
+
+# Seconds a blocking play waits beyond the sound's duration before it gives
+# up on a player that does not take its audio.
+_WAIT_SLACK = 2.0
+
+# Sounds waiting for one player beyond this many are dropped: by the time
+# they could start they would be late, and the backlog would only grow.
+_MAX_QUEUED = 16
+
+# Format of the bundled assets, used to start a player before the first beep.
+_DEFAULT_FORMAT = PcmFormat(rate=16000, channels=1, width=2)
+
+# Players inherited from the parent process, kept referenced in a forked
+# child so that their pipe objects are never finalised (and flushed) there.
+_abandoned: list[_PlayerProcess] = []
+
+
+def _aplay_command(fmt: PcmFormat) -> list[str]:
+    return [
+        "aplay",
+        "-q",
+        "-t",
+        "raw",
+        "-f",
+        _ALSA_FORMATS[fmt.width],
+        "-r",
+        str(fmt.rate),
+        "-c",
+        str(fmt.channels),
+        "-F",
+        "10000",
+        "-B",
+        str(int(_PAD_SECONDS * 1_000_000)),
+        "-",
+    ]
+
+
+def _pw_play_command(fmt: PcmFormat) -> list[str]:
+    return [
+        "pw-play",
+        "--raw",
+        "--rate",
+        str(fmt.rate),
+        "--channels",
+        str(fmt.channels),
+        "--format",
+        _PIPEWIRE_FORMATS[fmt.width],
+        "-",
+    ]
+
+
+def _paplay_command(fmt: PcmFormat) -> list[str]:
+    return [
+        "paplay",
+        "--raw",
+        f"--rate={fmt.rate}",
+        f"--channels={fmt.channels}",
+        f"--format={_PULSE_FORMATS[fmt.width]}",
+    ]
+
+
+PLAYERS: dict[str, Callable[[PcmFormat], list[str]]] = {
+    "aplay": _aplay_command,
+    "pw-play": _pw_play_command,
+    "paplay": _paplay_command,
+}
+"""Supported players in order of preference, mapped to their command lines."""
+
+_DEVICE_OPTIONS: dict[str, Callable[[str], list[str]]] = {
+    "aplay": lambda device: ["-D", device],
+    "pw-play": lambda device: ["--target", device],
+    "paplay": lambda device: [f"--device={device}"],
+}
+
+
+def find_player() -> str | None:
+    """Return the first supported player found on ``PATH``.
+
+    The ``BEEP_LITE_PLAYER`` environment variable restricts the search to a
+    single player name.
+    """
+    wanted = os.environ.get("BEEP_LITE_PLAYER")
+    names = [wanted] if wanted else list(PLAYERS)
+    for name in names:
+        if name in PLAYERS and shutil.which(name):
+            return name
+    return None
+
+
+def _block_size(fmt: PcmFormat) -> int:
+    """Bytes in one ``_PAD_SECONDS`` block of ``fmt``."""
+    return max(1, int(fmt.rate * _PAD_SECONDS)) * fmt.frame_size
+
+
+def _pad(pcm: Pcm) -> bytes:
+    """Pad PCM with silence to a whole number of ``_PAD_SECONDS`` blocks."""
+    fmt = pcm.format
+    missing = -len(pcm.frames) % _block_size(fmt)
+    return b"".join((pcm.frames, silence(fmt, missing // fmt.frame_size)))
+
+
+def _pad_stream(stream: PcmStream) -> Iterator[bytes | memoryview]:
+    """Yield a stream's chunks, then the silence that :func:`_pad` would add."""
+    size = 0
+    for chunk in stream:
+        size += len(chunk)
+        yield chunk
+    missing = -size % _block_size(stream.format)
+    if missing:
+        yield silence(stream.format, missing // stream.format.frame_size)
+
+
+# What a player's writer thread writes: one buffer, or a stream of chunks.
+_Payload = bytes | Iterable[bytes | memoryview]
+# Returns True (and counts the drop) if a queued sound is too old to play.
+_StaleCheck = Callable[[], bool]
+# payload, done, when it will have played, stale check, started
+_Item = tuple[
+    _Payload,
+    CompletionSignal | None,
+    float,
+    _StaleCheck | None,
+    CompletionSignal | None,
+]
+
+
+class _PlayerProcess:
+    """One long-lived player process fed by a dedicated writer thread."""
+
+    def __init__(
+        self, command: list[str], report: Callable[[BaseException | None], None]
+    ) -> None:
+        self._command = command
+        self._report = report
+        self._queue: queue.SimpleQueue[_Item | None] = queue.SimpleQueue()
+        # Start signal of the sound being written, until its first write
+        self._started: CompletionSignal | None = None
+        self._proc = self._spawn()
+        self.busy_until = 0.0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _spawn(self) -> subprocess.Popen[bytes]:
+        return subprocess.Popen(
+            self._command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @property
+    def pid(self) -> int:
+        return self._proc.pid
+
+    @property
+    def alive(self) -> bool:
+        """True while the writer thread is running."""
+        return self._thread.is_alive()
+
+    @property
+    def backlog(self) -> int:
+        """Number of sounds waiting for the writer thread."""
+        return self._queue.qsize()
+
+    def submit(
+        self,
+        chunk: _Payload,
+        done: CompletionSignal | None,
+        until: float = 0.0,
+        stale: _StaleCheck | None = None,
+        started: CompletionSignal | None = None,
+    ) -> None:
+        """Queue ``chunk``; ``done`` is set at ``until`` once it has been written.
+
+        ``chunk`` may also be an iterable of chunks, written one after the
+        other as the player consumes them. ``until`` is the monotonic time
+        the player will have finished playing it. ``started`` is set once the
+        player has accepted the first write. Both are set right away if
+        writing fails, or if ``stale()`` returns True when the writer takes
+        the chunk (it is then not written at all).
+        """
+        self._queue.put((chunk, done, until, stale, started))
+
+    def _write(self, chunk: _Payload) -> None:
+        stdin = self._proc.stdin
+        assert stdin is not None
+        if isinstance(chunk, bytes):
+            stdin.write(chunk)
+        else:
+            # A stream that failed part-way resumes where it stopped.
+            for piece in chunk:
+                stdin.write(piece)
+                if self._started is not None:
+                    stdin.flush()
+                    self._signal_started()
+        stdin.flush()
+        self._signal_started()
+
+    def _signal_started(self) -> None:
+        started, self._started = self._started, None
+        if started is not None:
+            started.set()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            chunk, done, until, stale, started = item
+            self._started = started
+            if stale is not None and stale():
+                logger.debug("Dropped a sound that went stale in the queue")
+                self._signal_started()
+                if done is not None:
+                    done.set()
+                continue
+            error: BaseException | None = None
+            try:
+                self._deliver(chunk)
+            except Exception as e:
+                # Anything else (a stream that cannot be read, ...) fails
+                # this sound only; the thread keeps serving the queue.
+                error = e
+                report_failure(
+                    "pipe", e, logger, "%s playback failed: %s", self._command[0], e
+                )
+            finally:
+                self._signal_started()
+                if done is not None:
+                    self._finish(done, until if error is None else 0.0)
+            self._report(error)
+
+    def _deliver(self, chunk: _Payload) -> None:
+        """Write ``chunk``, restarting the player once if it has died."""
+        try:
+            if self._proc.poll() is not None:
+                raise BrokenPipeError("player exited")
+            self._write(chunk)
+        except (OSError, ValueError) as e:
+            # The player died (device gone, killed, ...): recycle it and
+            # retry once on the fresh process.
+            logger.debug("Player %s died (%s), restarting", self._command[0], e)
+            self._restart()
+            self._write(chunk)
+
+    @staticmethod
+    def _finish(done: CompletionSignal, until: float) -> None:
+        """Set ``done`` at ``until`` without holding up the writer thread."""
+        if until > time.monotonic():
+            get_scheduler().call_at(until, done.set)
+        else:
+            done.set()
+
+    def _restart(self) -> None:
+        self._terminate()
+        self._proc = self._spawn()
+
+    def _terminate(self) -> None:
+        try:
+            if self._proc.stdin is not None:
+                self._proc.stdin.close()
+        except OSError:
+            pass
+        if self._proc.poll() is None:
+            self._proc.terminate()
+
+    def abandon(self) -> None:
+        """Let go of a player inherited through fork, without touching it.
+
+        The parent still owns the process and writes to its stdin. The
+        child's copy of the pipe is pointed at ``os.devnull`` so that it
+        neither keeps the player alive nor can write to it; the file object
+        (whose lock a parent thread may have held at fork time) is not used.
+        """
+        stdin = self._proc.stdin
+        if stdin is None:
+            return
+        try:
+            null = os.open(os.devnull, os.O_WRONLY)
+            try:
+                os.dup2(null, stdin.fileno())
+            finally:
+                os.close(null)
+        except (OSError, ValueError) as e:
+            logger.debug("Could not release inherited player pipe: %s", e)
+        _abandoned.append(self)
+
+    def close(self) -> None:
+        """Stop the writer thread and let the player drain and exit."""
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
+        if not self._thread.is_alive():
+            # Release the waiters of sounds a dead writer never took.
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    continue
+                for signal in (item[1], item[4]):
+                    if signal is not None:
+                        signal.set()
+        try:
+            if self._proc.stdin is not None:
+                self._proc.stdin.close()
+        except OSError:
+            pass
+
+
+class PipeBackend:
+    """Backend driving a command-line player through stdin pipes.
+
+    Keeps up to ``pool_size`` player processes per PCM format so that
+    overlapping sounds are mixed by the sound server instead of queueing.
+    Processes that exit are replaced transparently. Each player queues at
+    most ``_MAX_QUEUED`` sounds; beyond that, and for sounds that have gone
+    stale in the queue, sounds are dropped and counted.
+    """
+
+    listener: PlaybackListener | None = None
+    signals_completion = True
+    signals_start = True
+    checks_staleness = True
+
+    def __init__(
+        self, player: str | None = None, pool_size: int = 2, device: str | None = None
+    ) -> None:
+        """Initialize the pipe backend.
+
+        Args:
+            player: Player name from :data:`PLAYERS`, auto-detected if omitted.
+            pool_size: Maximum number of player processes per PCM format.
+            device: Output device for the player (see
+                :func:`beep_lite.devices.list_devices`), or None for the
+                system default.
+
+        Raises:
+            ImportError: If no supported player is installed.
+        """
+        name = player or find_player()
+        if name is None or name not in PLAYERS or not shutil.which(name):
+            raise ImportError(
+                "No command-line player found. Install alsa-utils (aplay), "
+                "pipewire (pw-play) or pulseaudio-utils (paplay)"
+            )
+        self._player = name
+        self._device = device
+        self._base_command = PLAYERS[name]
+        self._pool_size = max(1, pool_size)
+        self._output_format = output_format()
+        self._pools: dict[PcmFormat, list[_PlayerProcess]] = {}
+        # sound -> (source WAV, format, padded frames, duration)
+        self._decoded: dict[Sound, tuple[bytes, PcmFormat, bytes, float]] = {}
+        # id(PCM) -> (PCM, padded frames); sounds with identical audio share one
+        self._padded: dict[int, tuple[Pcm, bytes]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def player(self) -> str:
+        """Name of the player executable in use."""
+        return self._player
+
+    @property
+    def device(self) -> str | None:
+        """Output device, or None for the system default."""
+        return self._device
+
+    def _command(self, fmt: PcmFormat) -> list[str]:
+        command = self._base_command(fmt)
+        if self._device is None:
+            return command
+        return [command[0], *_DEVICE_OPTIONS[self._player](self._device), *command[1:]]
+
+    def _prepare(self, sound: Sound, data: bytes) -> tuple[PcmFormat, bytes, float]:
+        cached = self._decoded.get(sound)
+        if cached is not None and cached[0] is data:
+            return cached[1], cached[2], cached[3]
+        pcm = load_pcm(data, self._output_format)
+        shared = self._padded.get(id(pcm))
+        if shared is not None and shared[0] is pcm:
+            padded = shared[1]
+        else:
+            padded = _pad(pcm)
+            self._padded[id(pcm)] = (pcm, padded)
+        self._decoded[sound] = (data, pcm.format, padded, pcm.duration)
+        return pcm.format, padded, pcm.duration
+
+    def _acquire(self, fmt: PcmFormat, duration: float) -> tuple[_PlayerProcess, float]:
+        """Pick a player for ``fmt``; also return when it will have played it."""
+        with self._lock:
+            pool = self._pools.setdefault(fmt, [])
+            for dead in [w for w in pool if not w.alive]:
+                logger.debug("Replacing %s player %d", self._player, dead.pid)
+                pool.remove(dead)
+                dead.close()
+            now = time.monotonic()
+            worker = next((w for w in pool if w.busy_until <= now), None)
+            if worker is None and len(pool) < self._pool_size:
+                worker = _PlayerProcess(self._command(fmt), self._report)
+                pool.append(worker)
+            if worker is None:
+                worker = min(pool, key=lambda w: w.busy_until)
+            worker.busy_until = max(worker.busy_until, now) + duration
+            return worker, worker.busy_until
+
+    def prepare(self, sound: Sound, data: bytes) -> None:
+        """Decode and pad a sound ahead of its first playback.
+
+        Args:
+            sound: The sound type to prepare.
+            data: The WAV file data as bytes.
+        """
+        self._prepare(sound, data)
+
+    def prime(self) -> None:
+        """Start a player for the bundled sounds' format with a block of silence."""
+        fmt = self._output_format or _DEFAULT_FORMAT
+        done = threading.Event()
+        worker, _ = self._acquire(fmt, 0.0)
+        worker.submit(silence(fmt, _block_size(fmt) // fmt.frame_size), done)
+        if not done.wait(_PAD_SECONDS + _WAIT_SLACK):
+            logger.debug("%s player did not start in time", self._player)
+
+    def play(
+        self,
+        sound: Sound,
+        data: bytes,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+        enqueued: float | None = None,
+        limits: Mapping[Sound, float | None] | None = None,
+        started: CompletionSignal | None = None,
+    ) -> None:
+        """Stream a sound to an idle player process.
+
+        Args:
+            sound: The sound type to play.
+            data: The WAV file data as bytes.
+            block: If True, wait until the sound has been written and played.
+            done: Set once the sound has finished playing, or failed.
+            enqueued: When the sound was requested; it is dropped if it is
+                stale by the time the player's writer takes it.
+            limits: Per-sound maximum ages overriding the global ones.
+            started: Set once the player has accepted the first of the
+                sound, or it failed.
+        """
+        try:
+            fmt, frames, duration = self._prepare(sound, data)
+            stale = None
+            if enqueued is not None:
+                stale = functools.partial(is_stale, sound, enqueued, limits=limits)
+            self._submit(fmt, frames, duration, block, done, sound, stale, started)
+        except Exception as e:
+            if started is not None:
+                started.set()
+            if done is not None:
+                done.set()
+            self._report(e)
+            report_failure(
+                "pipe",
+                e,
+                logger,
+                "%s playback failed for %s: %s",
+                self._player,
+                sound.value,
+                e,
+            )
+
+    def play_stream(
+        self,
+        stream: PcmStream,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+    ) -> None:
+        """Stream a long sound to an idle player process, chunk by chunk.
+
+        The player's writer thread writes each chunk as the player takes it,
+        so only the chunks being written and read ahead are in memory. The
+        player is busy for the whole sound; other sounds use the rest of the
+        pool.
+
+        Args:
+            stream: The sound, from :func:`beep_lite.stream.open_stream`.
+            block: If True, wait until the sound has been written and played.
+            done: Set once the sound has finished playing, or failed.
+        """
+        try:
+            stream = stream.to(self._output_format)
+            self._submit(
+                stream.format, _pad_stream(stream), stream.duration, block, done
+            )
+        except Exception as e:
+            if done is not None:
+                done.set()
+            self._report(e)
+            report_failure(
+                "pipe",
+                e,
+                logger,
+                "%s streaming failed for %s: %s",
+                self._player,
+                stream.path,
+                e,
+            )
+
+    def _submit(
+        self,
+        fmt: PcmFormat,
+        payload: _Payload,
+        duration: float,
+        block: bool,
+        done: CompletionSignal | None,
+        sound: Sound | None = None,
+        stale: _StaleCheck | None = None,
+        started: CompletionSignal | None = None,
+    ) -> None:
+        worker, until = self._acquire(fmt, duration)
+        if not block and worker.backlog >= _MAX_QUEUED:
+            logger.debug("%s backlog full, dropping a sound", self._player)
+            if sound is not None:
+                count_drop(sound)
+            for signal in (started, done):
+                if signal is not None:
+                    signal.set()
+            return
+        finished = threading.Event() if block else None
+        worker.submit(
+            payload, finished if finished is not None else done, until, stale, started
+        )
+        if finished is not None:
+            if not finished.wait(max(0.0, until - time.monotonic()) + _WAIT_SLACK):
+                logger.debug("Timed out waiting for %s to play", self._player)
+            if done is not None:
+                done.set()
+
+    def _report(self, error: BaseException | None) -> None:
+        listener = self.listener
+        if listener is None:
+            return
+        if error is None:
+            listener.playback_succeeded()
+        else:
+            listener.playback_failed(error)
+
+    def after_fork(self) -> None:
+        """Release the parent's players; the child starts its own on demand.
+
+        Decoded and padded sounds are kept.
+        """
+        pools, self._pools = self._pools, {}
+        self._lock = threading.Lock()
+        for pool in pools.values():
+            for worker in pool:
+                worker.abandon()
+
+    def close(self) -> None:
+        """Shut down all player processes."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for worker in pool:
+                worker.close()
+
+    def is_available(self) -> bool:
+        """Check if a supported player is installed.
+
+        Returns:
+            True if a player executable is on PATH, False otherwise.
+        """
+        return find_player() is not None
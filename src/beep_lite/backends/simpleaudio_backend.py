@@ -1,22 +1,62 @@
 """Simpleaudio backend implementation."""
 
-import io
+import functools
 import logging
+import queue
 import threading
-import wave
+from collections.abc import Mapping
 
+from ..pcm import Pcm, output_format
+from ..pcm_cache import load_pcm
+from ..reporting import report_failure
+from ..scheduler import get_scheduler
+from ..staleness import count_drop, is_stale
+from ..stream import PcmStream
 from ..types import Sound
+from . import CompletionSignal, PlaybackListener
 
 logger = logging.getLogger(__name__)
 
+# sound, WAV data, done, requested at, maximum ages, started
+_Item = tuple[
+    Sound,
+    bytes,
+    CompletionSignal | None,
+    float | None,
+    Mapping[Sound, float | None] | None,
+    CompletionSignal | None,
+]
+
+# A sound still playing at its expected end (the device started it late) is
+# checked once more after this long, and then considered finished anyway.
+_OVERRUN_SECONDS = 0.05
+# Sounds waiting for the worker beyond this many are dropped: by the time they
+# could start they would be late, and the backlog would only grow.
+_MAX_QUEUED = 64
+
 
 class SimpleaudioBackend:
     """Backend using simpleaudio library.
 
     This backend works on Windows, macOS, and Linux.
     Requires simpleaudio to be installed: pip install simpleaudio
+
+    ``WaveObject.play()`` returns as soon as playback has started, so all
+    non-blocking sounds are started by one worker thread per backend rather
+    than a thread per beep. Completion is checked on the shared scheduler at
+    the time each sound is expected to end, and once more shortly after if
+    it is still playing then. When sounds are requested faster
+    than they can be started, the excess is dropped and counted (see
+    :func:`beep_lite.dropped_counts`) instead of queueing without bound, and
+    sounds that have waited past their maximum age are dropped when the
+    worker takes them.
     """
 
+    listener: PlaybackListener | None = None
+    signals_completion = True
+    signals_start = True
+    checks_staleness = True
+
     def __init__(self) -> None:
         """Initialize the simpleaudio backend."""
         try:
@@ -28,26 +68,218 @@ class SimpleaudioBackend:
                 "simpleaudio is not installed. "
                 "Install it with: pip install simpleaudio"
             ) from e
+        self._output_format = output_format()
+        # sound -> (source WAV, decoded WaveObject, duration)
+        self._wave_objects: dict[Sound, tuple[bytes, object, float]] = {}
+        # id(PCM) -> (PCM, WaveObject); sounds with identical audio share one
+        self._by_pcm: dict[int, tuple[Pcm, object]] = {}
+        self._queue: queue.SimpleQueue[_Item | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _wave_object(self, sound: Sound, data: bytes):  # noqa: ANN202
+        """Return the decoded WaveObject for a sound and its duration.
+
+        Each sound is decoded only once. The PCM comes from the persistent
+        cache, so a fresh process neither parses the WAV file nor converts
+        it again.
+        """
+        cached = self._wave_objects.get(sound)
+        if cached is not None and cached[0] is data:
+            return cached[1], cached[2]
+        pcm = load_pcm(data, self._output_format)
+        shared = self._by_pcm.get(id(pcm))
+        if shared is not None and shared[0] is pcm:
+            wave_obj = shared[1]
+        else:
+            fmt = pcm.format
+            wave_obj = self._simpleaudio.WaveObject(
+                pcm.frames, fmt.channels, fmt.width, fmt.rate
+            )
+            self._by_pcm[id(pcm)] = (pcm, wave_obj)
+        self._wave_objects[sound] = (data, wave_obj, pcm.duration)
+        return wave_obj, pcm.duration
+
+    def prepare(self, sound: Sound, data: bytes) -> None:
+        """Decode a sound ahead of its first playback.
+
+        Args:
+            sound: The sound type to prepare.
+            data: The WAV file data as bytes.
+        """
+        self._wave_object(sound, data)
+
+    def prime(self) -> None:
+        """Open the output device by playing a few milliseconds of silence."""
+        silence = self._simpleaudio.WaveObject(b"\x00" * 320, 1, 2, 16000)
+        silence.play().wait_done()
 
-    def play(self, sound: Sound, data: bytes) -> None:
+    def play(
+        self,
+        sound: Sound,
+        data: bytes,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+        enqueued: float | None = None,
+        limits: Mapping[Sound, float | None] | None = None,
+        started: CompletionSignal | None = None,
+    ) -> None:
         """Play a sound asynchronously using simpleaudio.
 
         Args:
             sound: The sound type to play.
             data: The WAV file data as bytes.
+            block: If True, play on the calling thread and wait until done.
+            done: Set once the sound has finished playing, or failed.
+            enqueued: When the sound was requested; it is dropped if it is
+                stale by the time the worker takes it.
+            limits: Per-sound maximum ages overriding the global ones.
+            started: Set once the device is playing the sound, or it failed.
         """
+        if block:
+            self._play_now(sound, data, done, started, block=True)
+            return
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="beep-lite-simpleaudio", daemon=True
+                    )
+                    self._thread.start()
+        if self._queue.qsize() >= _MAX_QUEUED:
+            logger.debug("Playback backlog full, dropping %s", sound.value)
+            count_drop(sound)
+            for signal in (started, done):
+                if signal is not None:
+                    signal.set()
+            return
+        self._queue.put((sound, data, done, enqueued, limits, started))
 
-        def _play_thread() -> None:
-            try:
-                with wave.open(io.BytesIO(data), "rb") as wav_reader:
-                    wave_obj = self._simpleaudio.WaveObject.from_wave_read(wav_reader)
-                    wave_obj.play()
-            except Exception as e:
-                logger.warning(f"simpleaudio playback failed for {sound.value}: {e}")
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            sound, data, done, enqueued, limits, started = item
+            if enqueued is not None and is_stale(sound, enqueued, limits=limits):
+                logger.debug("Dropped %s that went stale in the queue", sound.value)
+                for signal in (started, done):
+                    if signal is not None:
+                        signal.set()
+                continue
+            self._play_now(sound, data, done, started)
 
-        # Play in a separate thread to avoid blocking
-        thread = threading.Thread(target=_play_thread, daemon=True)
-        thread.start()
+    def _play_now(
+        self,
+        sound: Sound,
+        data: bytes,
+        done: CompletionSignal | None,
+        started: CompletionSignal | None = None,
+        *,
+        block: bool = False,
+    ) -> None:
+        try:
+            wave_obj, duration = self._wave_object(sound, data)
+            # Returns once the device is playing the sound.
+            play_obj = wave_obj.play()
+            if started is not None:
+                started.set()
+                started = None
+            if block:
+                play_obj.wait_done()
+        except Exception as e:
+            for signal in (started, done):
+                if signal is not None:
+                    signal.set()
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure(
+                "simpleaudio",
+                e,
+                logger,
+                "simpleaudio playback failed for %s: %s",
+                sound.value,
+                e,
+            )
+            return
+        if done is not None:
+            if block:
+                done.set()
+            else:
+                get_scheduler().call_later(
+                    duration, functools.partial(_finish, play_obj, done, retry=True)
+                )
+        if self.listener is not None:
+            self.listener.playback_succeeded()
+
+    def play_stream(
+        self,
+        stream: PcmStream,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+    ) -> None:
+        """Play a long sound chunk by chunk, on a thread of its own.
+
+        simpleaudio cannot append to a buffer that is playing, so each chunk
+        is started when the previous one has finished (the next one is read
+        meanwhile); there may be a gap of a few milliseconds between chunks.
+
+        Args:
+            stream: The sound, from :func:`beep_lite.stream.open_stream`.
+            block: If True, play on the calling thread and wait until done.
+            done: Set once the sound has finished playing, or failed.
+        """
+        if block:
+            self._stream_now(stream, done)
+            return
+        threading.Thread(
+            target=self._stream_now,
+            args=(stream, done),
+            name="beep-lite-simpleaudio-stream",
+            daemon=True,
+        ).start()
+
+    def _stream_now(self, stream: PcmStream, done: CompletionSignal | None) -> None:
+        try:
+            stream = stream.to(self._output_format)
+            fmt = stream.format
+            for chunk in stream:
+                self._simpleaudio.play_buffer(
+                    chunk, fmt.channels, fmt.width, fmt.rate
+                ).wait_done()
+        except Exception as e:
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure(
+                "simpleaudio",
+                e,
+                logger,
+                "simpleaudio streaming failed for %s: %s",
+                stream.path,
+                e,
+            )
+        else:
+            if self.listener is not None:
+                self.listener.playback_succeeded()
+        finally:
+            if done is not None:
+                done.set()
+
+    def after_fork(self) -> None:
+        """Forget the parent's worker thread and queue; keep decoded sounds."""
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Stop the worker thread once the sounds queued so far have started."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=1.0)
 
     def is_available(self) -> bool:
         """Check if simpleaudio is available.
@@ -61,3 +293,17 @@ class SimpleaudioBackend:
             return True
         except ImportError:
             return False
+
+
+def _finish(play_obj: object, done: CompletionSignal, *, retry: bool) -> None:
+    """Set ``done`` if ``play_obj`` has stopped, else check once more if ``retry``."""
+    try:
+        playing = play_obj.is_playing() is True  # type: ignore[attr-defined]
+    except Exception:
+        playing = False
+    if playing and retry:
+        get_scheduler().call_later(
+            _OVERRUN_SECONDS, functools.partial(_finish, play_obj, done, retry=False)
+        )
+    else:
+        done.set()
@@ -1,23 +1,57 @@
 """Windows winsound backend implementation."""
 
+import hashlib
+import io
 import logging
+import os
 import sys
 import tempfile
-import threading
+import time
+import wave
 from pathlib import Path
 
+from ..reporting import report_failure
+from ..scheduler import get_scheduler
+from ..stream import PcmStream
 from ..types import Sound
+from . import CompletionSignal, PlaybackListener
 
 logger = logging.getLogger(__name__)
 
+# Sound files not used for this long are removed at start-up. Their
+# modification time is refreshed on use, at most every _TOUCH_SECONDS.
+_STALE_SECONDS = 7 * 24 * 3600
+_TOUCH_SECONDS = 24 * 3600
+# Partial writes older than this are left over from a crash; younger ones may
+# belong to another process writing right now.
+_TMP_STALE_SECONDS = 3600
+
+
+def _duration(data: bytes) -> float:
+    """Length of a WAV payload in seconds, or 0.0 if it cannot be parsed."""
+    try:
+        with wave.open(io.BytesIO(data), "rb") as reader:
+            return reader.getnframes() / reader.getframerate()
+    except (wave.Error, EOFError, ZeroDivisionError):
+        return 0.0
+
 
 class WinsoundBackend:
     """Backend using Windows winsound module.
 
     This backend is only available on Windows and has zero external dependencies.
     Uses SND_ASYNC for non-blocking playback.
+
+    ``PlaySound`` with ``SND_MEMORY`` does not support ``SND_ASYNC``, so each
+    distinct WAV payload is written once to ``<tmp>/beep_lite/<sha256>.wav``
+    and played from there. Files are never rewritten in place, so one that
+    winsound is still reading cannot be truncated.
     """
 
+    listener: PlaybackListener | None = None
+    signals_completion = True
+    signals_start = True
+
     def __init__(self) -> None:
         """Initialize the winsound backend."""
         if sys.platform != "win32":
@@ -29,29 +63,190 @@ class WinsoundBackend:
         self._winsound = winsound
         self._temp_dir = Path(tempfile.gettempdir()) / "beep_lite"
         self._temp_dir.mkdir(exist_ok=True)
-        self._lock = threading.Lock()
+        # id(WAV data) -> (WAV data, materialised file, duration, last touched);
+        # lock-free reads
+        self._paths: dict[int, tuple[bytes, Path, float, float]] = {}
+        self._remove_stale_files()
+
+    def _remove_stale_files(self) -> None:
+        """Delete sounds unused for a week and partial writes of crashed runs.
+
+        Files with any other name are left alone.
+        """
+        now = time.time()
+        for path in self._temp_dir.iterdir():
+            if path.suffix == ".wav" and len(path.stem) == 64:
+                cutoff = now - _STALE_SECONDS
+            elif path.suffix == ".tmp":
+                cutoff = now - _TMP_STALE_SECONDS
+            else:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                # In use by another process, or already gone.
+                continue
+
+    def _materialise(self, data: bytes) -> Path:
+        """Write ``data`` to its content-named file unless it already exists."""
+        path = self._temp_dir / f"{hashlib.sha256(data).hexdigest()}.wav"
+        if not (path.is_file() and path.stat().st_size == len(data)):
+            fd, tmp = tempfile.mkstemp(dir=self._temp_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError:
+                Path(tmp).unlink(missing_ok=True)
+                # Another process won the race and its copy is being played.
+                if not path.is_file():
+                    raise
+        else:
+            self._touch(path)
+        self._paths[id(data)] = (data, path, _duration(data), time.monotonic())
+        return path
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark a sound file as in use, so start-up clean-up keeps it."""
+        try:
+            os.utime(path)
+        except OSError as e:
+            logger.debug("Could not touch %s: %s", path, e)
+
+    def _path(self, data: bytes) -> Path:
+        cached = self._paths.get(id(data))
+        if cached is not None and cached[0] is data:
+            path = cached[1]
+            if time.monotonic() - cached[3] > _TOUCH_SECONDS:
+                self._touch(path)
+                self._paths[id(data)] = (*cached[:3], time.monotonic())
+            return path
+        return self._materialise(data)
+
+    def _finish(self, data: bytes, done: CompletionSignal) -> None:
+        """Set ``done`` when an asynchronously started sound has played.
+
+        winsound does not report completion, so this goes by the length of
+        the sound.
+        """
+        cached = self._paths.get(id(data))
+        duration = cached[2] if cached is not None and cached[0] is data else 0.0
+        if duration > 0:
+            get_scheduler().call_later(duration, done.set)
+        else:
+            done.set()
+
+    def prepare(self, sound: Sound, data: bytes) -> None:
+        """Write a sound's file ahead of its first playback.
 
-    def play(self, sound: Sound, data: bytes) -> None:
+        Args:
+            sound: The sound type to prepare.
+            data: The WAV file data as bytes.
+        """
+        self._path(data)
+
+    def play(
+        self,
+        sound: Sound,
+        data: bytes,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+        started: CompletionSignal | None = None,
+    ) -> None:
         """Play a sound asynchronously using winsound.
 
         Args:
             sound: The sound type to play.
             data: The WAV file data as bytes.
+            block: If True, drop SND_ASYNC so the call returns when done.
+            done: Set once the sound has finished playing, or failed.
+            started: Set once ``PlaySound`` has begun the sound (it returns
+                then with SND_ASYNC), or failed.
         """
         try:
-            # winsound.PlaySound with SND_MEMORY doesn't work well with SND_ASYNC
-            # So we write to a temp file and play from there
-            temp_file = self._temp_dir / f"{sound.value}.wav"
+            path = self._path(data)
+            flags = self._winsound.SND_FILENAME | self._winsound.SND_NODEFAULT
+            if not block:
+                flags |= self._winsound.SND_ASYNC
+            try:
+                self._winsound.PlaySound(str(path), flags)
+            except RuntimeError:
+                if path.is_file():
+                    raise
+                # Removed behind our back (temp cleaner): write it again.
+                self._winsound.PlaySound(str(self._materialise(data)), flags)
+        except Exception as e:
+            if started is not None:
+                started.set()
+            if done is not None:
+                done.set()
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure(
+                "winsound",
+                e,
+                logger,
+                "winsound playback failed for %s: %s",
+                sound.value,
+                e,
+            )
+        else:
+            if started is not None:
+                started.set()
+            if done is not None:
+                if block:
+                    done.set()
+                else:
+                    self._finish(data, done)
+            if self.listener is not None:
+                self.listener.playback_succeeded()
 
-            with self._lock:
-                temp_file.write_bytes(data)
+    def play_stream(
+        self,
+        stream: PcmStream,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+    ) -> None:
+        """Play a long sound straight from its file.
 
-            self._winsound.PlaySound(
-                str(temp_file),
-                self._winsound.SND_FILENAME | self._winsound.SND_ASYNC,
-            )
+        ``PlaySound`` with ``SND_FILENAME`` reads the file itself as it
+        plays, so nothing is loaded here.
+
+        Args:
+            stream: The sound, from :func:`beep_lite.stream.open_stream`.
+            block: If True, drop SND_ASYNC so the call returns when done.
+            done: Set once the sound has finished playing, or failed.
+        """
+        try:
+            flags = self._winsound.SND_FILENAME | self._winsound.SND_NODEFAULT
+            if not block:
+                flags |= self._winsound.SND_ASYNC
+            self._winsound.PlaySound(str(stream.path), flags)
         except Exception as e:
-            logger.warning(f"winsound playback failed for {sound.value}: {e}")
+            if done is not None:
+                done.set()
+            if self.listener is not None:
+                self.listener.playback_failed(e)
+            report_failure(
+                "winsound",
+                e,
+                logger,
+                "winsound playback failed for %s: %s",
+                stream.path,
+                e,
+            )
+        else:
+            if done is not None:
+                if block or stream.duration <= 0:
+                    done.set()
+                else:
+                    get_scheduler().call_later(stream.duration, done.set)
+            if self.listener is not None:
+                self.listener.playback_succeeded()
 
     def is_available(self) -> bool:
         """Check if winsound is available.
@@ -0,0 +1,144 @@
+"""Command-line entry point: ``beep-lite`` / ``python -m beep_lite``.
+
+Plays one sound or a sequence and exits as soon as playback has finished,
+so shell scripts no longer need ``sleep`` after ``python -c "..."``.
+
+Example:
+    $ beep-lite ng
+    $ beep-lite ok ok --gap 0.1
+    $ beep-lite --daemon-client scan_ok
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+from collections.abc import Sequence
+
+from .types import Sound
+
+
+def _parse_sound(text: str) -> Sound:
+    """Convert a command-line word (``ok``, ``SCAN_OK``, ``scan-ok``) to a Sound."""
+    try:
+        return Sound(text.strip().lower().replace("-", "_"))
+    except ValueError:
+        choices = ", ".join(sound.value for sound in Sound)
+        raise argparse.ArgumentTypeError(
+            f"unknown sound {text!r} (choose from {choices})"
+        ) from None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="beep-lite",
+        description="Play beep-lite notification sounds and wait for them.",
+    )
+    parser.add_argument(
+        "sounds",
+        nargs="*",
+        type=_parse_sound,
+        metavar="SOUND",
+        help="sound(s) to play in order",
+    )
+    parser.add_argument(
+        "--gap",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="pause between consecutive sounds (default: 0)",
+    )
+    parser.add_argument(
+        "--daemon-client",
+        action="store_true",
+        help="hand the sounds to a running 'beep-lite --serve' daemon, "
+        "playing locally if none is reachable",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="run the playback daemon in the foreground",
+    )
+    parser.add_argument(
+        "--address",
+        default=None,
+        help="daemon socket path or host:port (default: platform specific)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="list the available sounds and exit",
+    )
+    return parser
+
+
+def _play_local(sounds: Sequence[Sound], gap: float) -> int:
+    import time
+
+    from .core import play_sound
+
+    status = 0
+    for index, sound in enumerate(sounds):
+        if index and gap > 0:
+            time.sleep(gap)
+        try:
+            play_sound(sound, block=True)
+        except Exception as e:
+            print(f"beep-lite: failed to play {sound.value}: {e}", file=sys.stderr)
+            status = 1
+    return status
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command-line interface.
+
+    Args:
+        argv: Arguments without the program name, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit status.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for sound in Sound:
+            print(sound.value)
+        return 0
+
+    if args.serve:
+        from .daemon import serve
+
+        try:
+            with contextlib.suppress(KeyboardInterrupt):
+                serve(args.address)
+        except OSError as e:
+            print(f"beep-lite: cannot serve: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    if not args.sounds:
+        parser.error("at least one SOUND is required")
+    if args.gap < 0:
+        parser.error("--gap must not be negative")
+
+    if args.daemon_client:
+        from .daemon import send
+
+        try:
+            send(
+                [sound.value for sound in args.sounds],
+                address=args.address,
+                gap=args.gap,
+            )
+            return 0
+        except OSError:
+            # No daemon running: still beep, just slower.
+            pass
+
+    return _play_local(args.sounds, args.gap)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
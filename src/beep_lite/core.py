@@ -1,94 +1,588 @@
-"""Core playback logic and backend selection."""
+"""Core playback logic and backend selection.
+
+All playback state (backend, warm-up gate, in-flight sounds, staleness
+limits) lives on :class:`Beeper` instances. The module-level functions here
+and in :mod:`beep_lite.api` are bound to a default instance. Separate
+instances, e.g. one per tenant of a gateway, each get their own backend and
+settings but share the immutable WAV and decoded PCM caches.
+
+Thread safety: the playback path takes no lock that all callers share, so
+it scales across cores on free-threaded Python. Shared state follows three
+rules:
+
+* One-time initialisation (backend selection, the scheduler) is guarded by
+  a lock, checked again inside it.
+* Caches are read without a lock and filled with ``setdefault`` under one.
+  They only ever hold immutable values (or tuples that bundle a value with
+  the key object it was made from), so a reader sees either nothing or a
+  complete entry; two threads missing at once may both compute it.
+* Per-call bookkeeping is spread over per-thread shards (in-flight sounds)
+  or only written when it changes (health counters).
+"""
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import os
 import sys
+import threading
+import time
+import weakref
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
 
+from . import scheduler
 from .backends import Backend
 from .loader import load_wav
+from .reporting import report_failure
+from .scheduler import ScheduledCall, get_scheduler
+from .staleness import is_stale
 from .types import Sound
 
+if TYPE_CHECKING:
+    from .health import BackendFactory
+
 logger = logging.getLogger(__name__)
 
-# Module-level backend instance (lazy initialization)
-_backend: Backend | None = None
+# Seconds to wait for in-flight sounds at interpreter exit (None: don't)
+_exit_timeout: float | None = None
+# Every live Beeper, for the exit flush
+_instances: weakref.WeakSet[Beeper] = weakref.WeakSet()
+_instances_lock = threading.Lock()
 
+# In-flight sounds are tracked in this many sets per beeper, each calling
+# thread using its own, so concurrent callers do not contend on one lock.
+_INFLIGHT_SHARDS = 16
+_thread_slot = threading.local()
+_next_slot = itertools.count()
 
-def _select_backend() -> Backend:
-    """Select the best available backend for the current platform.
+
+def _winsound_backend() -> Backend:
+    from .backends.winsound_backend import WinsoundBackend
+
+    return WinsoundBackend()
+
+
+def _simpleaudio_backend() -> Backend:
+    from .backends.simpleaudio_backend import SimpleaudioBackend
+
+    return SimpleaudioBackend()
+
+
+def _pipe_backend() -> Backend:
+    from .backends.pipe_backend import PipeBackend
+
+    return PipeBackend()
+
+
+def _fallback_backend() -> Backend:
+    from .backends.fallback_backend import FallbackBackend
+
+    return FallbackBackend()
+
+
+def _backend_candidates() -> list[tuple[str, BackendFactory]]:
+    """List the backends to try on the current platform, best first.
 
     Priority:
     1. Windows: winsound (zero dependencies)
     2. All platforms: simpleaudio (if installed)
-    3. Fallback: terminal bell
+    3. Linux: aplay / pw-play / paplay through stdin pipes (if installed)
+    4. Fallback: terminal bell
+
+    Plugin backends (see :mod:`beep_lite.plugins`) are placed by their
+    priority, after built-ins of the same priority, and are not imported
+    here.
 
     Returns:
-        An instance of the selected backend.
+        ``(name, factory)`` pairs. Factories raise ImportError when the
+        backend cannot be used here; the last one never does.
     """
-    # Windows: prefer winsound
+    from . import plugins
+
+    ranked: list[tuple[int, str, BackendFactory]] = []
     if sys.platform == "win32":
-        try:
-            from .backends.winsound_backend import WinsoundBackend
+        ranked.append((10, "winsound", _winsound_backend))
+    ranked.append((20, "simpleaudio", _simpleaudio_backend))
+    if sys.platform.startswith("linux"):
+        ranked.append((30, "pipe", _pipe_backend))
+    names = {name for _, name, _ in ranked} | {"fallback"}
+    for info in plugins.discover():
+        if not info.supports():
+            continue
+        if info.name in names:
+            logger.warning("Ignoring backend plugin with taken name %r", info.name)
+            continue
+        names.add(info.name)
+        ranked.append((info.priority, info.name, plugins.factory(info)))
+    ranked.sort(key=lambda entry: entry[0])
+    candidates = [(name, factory) for _, name, factory in ranked]
+    candidates.append(("fallback", _fallback_backend))
+    return candidates
+
 
-            backend = WinsoundBackend()
-            logger.debug("Selected winsound backend")
-            return backend
+def _select_backend() -> Backend:
+    """Select the best available backend for the current platform.
+
+    Returns:
+        An instance of the first candidate from :func:`_backend_candidates`
+        that can be created.
+    """
+    for name, factory in _backend_candidates():
+        try:
+            backend = factory()
         except ImportError:
-            logger.debug("winsound not available")
+            logger.debug("%s backend not available", name)
+            continue
+        logger.debug("Selected %s backend", name)
+        return backend
+    raise RuntimeError("No playback backend available")  # pragma: no cover
 
-    # Try simpleaudio (cross-platform)
+
+def _shard_index() -> int:
+    """Return the calling thread's in-flight shard, assigned round-robin."""
     try:
-        from .backends.simpleaudio_backend import SimpleaudioBackend
+        return _thread_slot.index
+    except AttributeError:
+        # A rare duplicate from a racing next() only makes two threads share.
+        index = _thread_slot.index = next(_next_slot) % _INFLIGHT_SHARDS
+        return index
+
+
+class _Completion(threading.Event):
+    """Completion signal handed to the backend; tracks in-flight sounds.
+
+    ``set.add`` and ``set.discard`` are atomic, so the shard needs no lock of
+    its own.
+    """
+
+    def __init__(self, inflight: set[_Completion]) -> None:
+        super().__init__()
+        self._inflight = inflight
+        inflight.add(self)
 
-        backend = SimpleaudioBackend()
-        logger.debug("Selected simpleaudio backend")
+    def set(self) -> None:
+        self._inflight.discard(self)
+        super().set()
+
+
+class Beeper:
+    """Sound player with its own backend, settings and in-flight queue.
+
+    The module-level functions (``beep_lite.ok()`` and friends) use a default
+    instance. Create more for components that need different settings; WAV
+    data and decoded audio are cached once per process and shared by all of
+    them, while backend-level state (players, device handles) is not.
+
+    Example:
+        >>> from beep_lite import Beeper, Sound
+        >>> quiet_hall = Beeper(max_age={Sound.SCAN_OK: 0.3})
+        >>> quiet_hall.scan_ok()
+    """
+
+    def __init__(
+        self,
+        backend: Backend | None = None,
+        *,
+        candidates: Sequence[tuple[str, BackendFactory]] | None = None,
+        max_age: Mapping[Sound, float | None] | None = None,
+    ) -> None:
+        """Initialize a beeper.
+
+        Args:
+            backend: Backend to play through. By default the best available
+                one is chosen on first use, with failover (see
+                :class:`~beep_lite.health.ResilientBackend`).
+            candidates: ``(name, factory)`` pairs to choose from instead of
+                the platform defaults. Ignored if ``backend`` is given.
+            max_age: Per-sound maximum request age in seconds, overriding
+                :func:`beep_lite.staleness.set_max_age` (None: never drop).
+        """
+        self._backend = backend
+        self._candidates = candidates
+        self._max_age = dict(max_age) if max_age is not None else None
+        self._backend_lock = threading.Lock()
+        # Set by warm-up to hold playback until the first beep can be fast
+        self._ready_gate: threading.Event | None = None
+        self._ready_timeout = 0.0
+        # Completions of sounds that have been started but not finished yet
+        self._inflight: tuple[set[_Completion], ...] = tuple(
+            set() for _ in range(_INFLIGHT_SHARDS)
+        )
+        with _instances_lock:
+            _instances.add(self)
+
+    def _get_backend(self) -> Backend:
+        """Get the backend instance, initializing if necessary.
+
+        Returns:
+            The backend instance.
+        """
+        backend = self._backend
+        if backend is None:
+            # Failover, plugins and latency ranking are only imported once a
+            # sound is played, which keeps ``import beep_lite`` cheap.
+            from . import selection
+            from .health import ResilientBackend
+
+            with self._backend_lock:
+                if self._backend is None:
+                    candidates = self._candidates or _backend_candidates()
+                    if selection.enabled():
+                        candidates = selection.rank(candidates, probe=False)
+                    self._backend = ResilientBackend(candidates)
+                backend = self._backend
         return backend
-    except ImportError:
-        logger.debug("simpleaudio not available")
 
-    # Fallback to terminal bell
-    from .backends.fallback_backend import FallbackBackend
+    def _select_fastest(self, refresh: bool = False) -> None:
+        """Order the candidate backends by measured latency before first use.
 
-    logger.debug("Selected fallback backend (terminal bell)")
-    return FallbackBackend()
+        Does nothing once a backend has been created (the ranking is still
+        cached for the next start), or if one was given explicitly.
+        """
+        if self._backend is not None:
+            return
+        from . import selection
 
+        ranked = selection.rank(
+            self._candidates or _backend_candidates(), refresh=refresh
+        )
+        with self._backend_lock:
+            if self._backend is None:
+                self._candidates = ranked
 
-def _get_backend() -> Backend:
-    """Get the backend instance, initializing if necessary.
+    def _reset_backend(self) -> None:
+        """Close the backend so that the next sound selects a fresh one."""
+        with self._backend_lock:
+            backend, self._backend = self._backend, None
+        close = getattr(backend, "close", None)
+        if close is not None:
+            close()
+
+    def _set_ready_gate(
+        self, gate: threading.Event | None, timeout: float = 0.0
+    ) -> None:
+        """Make :meth:`play_sound` wait for ``gate`` (at most ``timeout`` s).
+
+        Used by :func:`beep_lite.warmup` so that sounds requested
+        during start-up play once everything is warm instead of racing the
+        warm-up. Pass ``None`` to remove the gate.
+        """
+        self._ready_timeout = timeout
+        self._ready_gate = gate
+
+    def set_max_age(self, sound: Sound, seconds: float | None) -> None:
+        """Override the maximum request age of ``sound`` for this beeper.
+
+        Args:
+            sound: The sound to configure.
+            seconds: Maximum age in seconds, or None to never drop the sound.
+        """
+        if self._max_age is None:
+            self._max_age = {}
+        self._max_age[sound] = seconds
+
+    def play_sound(
+        self,
+        sound: Sound,
+        *,
+        block: bool = False,
+        enqueued: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Play a sound using the selected backend.
+
+        This is the core playback function. It loads the WAV data
+        and delegates to the appropriate backend. Requests older than the
+        sound's maximum age (see :func:`beep_lite.staleness.set_max_age`) are
+        dropped before any of that work.
+
+        Args:
+            sound: The sound to play.
+            block: If True, return only once the backend has finished playing.
+            enqueued: When the sound was requested (``time.monotonic()``),
+                defaults to now.
+            timeout: With ``block``, the longest time to wait for the sound to
+                finish. The wait ends early when the backend signals completion.
+
+        Raises:
+            SoundNotFoundError: If the WAV file cannot be found.
+            Exception: If playback fails (backend-specific).
+        """
+        if enqueued is None:
+            enqueued = time.monotonic()
+        gate = self._ready_gate
+        if gate is not None and not gate.wait(self._ready_timeout):
+            logger.debug("Warm-up not finished, playing %s anyway", sound.value)
+        if is_stale(sound, enqueued, limits=self._max_age):
+            logger.debug("Dropped stale %s request", sound.value)
+            return
+        data = load_wav(sound)
+        backend = self._get_backend()
+        if block and (
+            timeout is None or getattr(backend, "signals_completion", False) is not True
+        ):
+            # Cheapest wait: backends play such sounds on the calling thread.
+            backend.play(sound, data, block=True)
+            logger.debug("Playing sound: %s", sound.value)
+            return
+        # Queueing backends check the request's age again when they dequeue it.
+        kwargs: dict[str, object] = {}
+        if getattr(backend, "checks_staleness", False) is True:
+            kwargs["enqueued"] = enqueued
+            kwargs["limits"] = self._max_age
+        if getattr(backend, "signals_completion", False) is not True:
+            backend.play(sound, data, **kwargs)
+        else:
+            done = _Completion(self._inflight[_shard_index()])
+            try:
+                backend.play(sound, data, done=done, **kwargs)
+            except BaseException:
+                done.set()
+                raise
+            if block and not done.wait(timeout):
+                logger.debug("Timed out waiting for %s to finish", sound.value)
+        logger.debug("Playing sound: %s", sound.value)
+
+    def _play_safely(
+        self,
+        sound: Sound,
+        enqueued: float | None = None,
+        *,
+        block: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Play a sound, reporting (rate-limited) instead of raising on failure."""
+        try:
+            if block:
+                self.play_sound(sound, block=True, timeout=timeout)
+            elif enqueued is None:
+                self.play_sound(sound)
+            else:
+                self.play_sound(sound, enqueued=enqueued)
+        except Exception as e:
+            report_failure(
+                "api", e, logger, "Failed to play %s sound: %s", sound.name, e
+            )
+
+    def play(
+        self, sound: Sound, *, block: bool = False, timeout: float | None = None
+    ) -> None:
+        """Play a sound; never raises. See :func:`beep_lite.api.play`."""
+        self._play_safely(sound, block=block, timeout=timeout)
+
+    def play_file(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        block: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Play a WAV file of any length; never raises.
+
+        Large files are streamed in constant memory (see
+        :mod:`beep_lite.stream`); small ones are played like a sound on
+        backends that cannot stream. See :func:`beep_lite.api.play_file`.
+        """
+        from .stream import FILE, StreamingUnsupported, open_stream
+
+        done = _Completion(self._inflight[_shard_index()])
+        try:
+            stream = open_stream(path)
+            backend = self._get_backend()
+            play_stream = getattr(backend, "play_stream", None)
+            if play_stream is not None:
+                play_stream(stream, done=done)
+            elif stream.data is None:
+                raise StreamingUnsupported(f"{type(backend).__name__} cannot stream")
+            elif getattr(backend, "signals_completion", False) is True:
+                backend.play(FILE, stream.data, done=done)  # type: ignore[arg-type, call-arg]
+            else:
+                backend.play(FILE, stream.data, block=block)  # type: ignore[arg-type]
+                done.set()
+        except Exception as e:
+            done.set()
+            report_failure("api", e, logger, "Failed to play %s: %s", path, e)
+            return
+        if block and not done.wait(timeout):
+            logger.debug("Timed out waiting for %s to finish", path)
+
+    def ok(self) -> None:
+        """Play the OK/success sound; never raises."""
+        self._play_safely(Sound.OK)
+
+    def ng(self) -> None:
+        """Play the NG/error sound; never raises."""
+        self._play_safely(Sound.NG)
+
+    def warn(self) -> None:
+        """Play the warning sound; never raises."""
+        self._play_safely(Sound.WARN)
+
+    def crit(self) -> None:
+        """Play the critical/urgent sound; never raises."""
+        self._play_safely(Sound.CRIT)
+
+    def moo(self) -> None:
+        """Play the 'moo' sound; never raises."""
+        self._play_safely(Sound.MOO)
+
+    def mew(self) -> None:
+        """Play the 'mew' sound; never raises."""
+        self._play_safely(Sound.MEW)
+
+    def scan_ok(self) -> None:
+        """Play the scan success sound; never raises."""
+        self._play_safely(Sound.SCAN_OK)
+
+    def scan_ng(self) -> None:
+        """Play the scan failure sound; never raises."""
+        self._play_safely(Sound.SCAN_NG)
+
+    def play_at(self, sound: Sound, t: float) -> ScheduledCall:
+        """Schedule a sound at a ``time.monotonic()`` timestamp.
+
+        See :func:`beep_lite.api.play_at`; all beepers share one scheduler
+        thread.
+        """
+        return get_scheduler().call_at(
+            t, functools.partial(self._play_safely, sound, t)
+        )
+
+    def play_after(self, sound: Sound, delay: float) -> ScheduledCall:
+        """Schedule a sound ``delay`` seconds from now."""
+        return self.play_at(sound, time.monotonic() + delay)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until every sound started so far has finished playing.
+
+        Args:
+            timeout: Longest total time to wait, in seconds.
+
+        Returns:
+            True if all sounds finished, False if the timeout expired first.
+        """
+        deadline = time.monotonic() + timeout
+        return all(
+            done.wait(max(0.0, deadline - time.monotonic())) for done in self._pending()
+        )
+
+    def _pending(self) -> list[_Completion]:
+        """Completions of the sounds started but not finished yet."""
+        return [done for shard in self._inflight for done in shard.copy()]
+
+    def close(self) -> None:
+        """Release the backend. The beeper can still be used afterwards."""
+        self._reset_backend()
+
+    def _after_fork(self) -> None:
+        """Drop state inherited through fork that belongs to the parent."""
+        self._backend_lock = threading.Lock()
+        self._ready_gate = None
+        self._inflight = tuple(set() for _ in range(_INFLIGHT_SHARDS))
+        after_fork = getattr(self._backend, "after_fork", None)
+        if after_fork is not None:
+            after_fork()
+
+
+_default = Beeper()
+"""Instance behind the module-level functions."""
+
+# Module-level entry points, bound to the default instance so that they cost
+# no more than before per call.
+_get_backend = _default._get_backend
+_reset_backend = _default._reset_backend
+_set_ready_gate = _default._set_ready_gate
+play_sound = _default.play_sound
+
+
+def default_beeper() -> Beeper:
+    """Return the :class:`Beeper` used by the module-level functions."""
+    return _default
+
+
+def flush(timeout: float = 1.0) -> bool:
+    """Wait until every sound started so far has finished playing.
+
+    Covers sounds played through the module-level functions; use
+    :meth:`Beeper.flush` for other instances.
+
+    Args:
+        timeout: Longest total time to wait, in seconds.
 
     Returns:
-        The backend instance.
+        True if all sounds finished, False if the timeout expired first.
     """
-    global _backend
-    if _backend is None:
-        _backend = _select_backend()
-    return _backend
+    return _default.flush(timeout)
+
+
+def _flush_at_exit() -> None:
+    timeout = _exit_timeout
+    if timeout is None:
+        return
+    deadline = time.monotonic() + timeout
+    with _instances_lock:
+        beepers = list(_instances)
+    for beeper in beepers:
+        if not beeper.flush(max(0.0, deadline - time.monotonic())):
+            logger.debug("Exiting with sounds still playing")
+            return
 
 
-def _reset_backend() -> None:
-    """Reset the backend instance.
+# Modules whose ``_lock`` another parent thread may hold at fork time
+_FORK_LOCKED = (
+    "alarm",
+    "loader",
+    "pcm_cache",
+    "plugins",
+    "reporting",
+    "staleness",
+    "stream",
+)
 
-    Useful for testing or when changing backends at runtime.
+
+def _after_fork_in_child() -> None:
+    """Drop the parent's threads and locks in a forked child; keep the caches.
+
+    Modules that are imported lazily are only reset if the parent loaded
+    them; otherwise the child starts with fresh ones anyway.
     """
-    global _backend
-    _backend = None
+    global _instances_lock
+    for name in _FORK_LOCKED:
+        module = sys.modules.get(f"{__package__}.{name}")
+        if module is not None:
+            module._lock = threading.Lock()
+    alarm = sys.modules.get(f"{__package__}.alarm")
+    if alarm is not None:
+        alarm._groups.clear()
+    scheduler._default_lock = threading.Lock()
+    scheduler._default = None
+    _instances_lock = threading.Lock()
+    for beeper in list(_instances):
+        beeper._after_fork()
 
 
-def play_sound(sound: Sound) -> None:
-    """Play a sound using the selected backend.
+def flush_on_exit(timeout: float | None = 1.0) -> None:
+    """Let sounds that are still playing finish when the interpreter exits.
 
-    This is the core playback function. It loads the WAV data
-    and delegates to the appropriate backend.
+    Applies to every :class:`Beeper`.
 
     Args:
-        sound: The sound to play.
-
-    Raises:
-        SoundNotFoundError: If the WAV file cannot be found.
-        Exception: If playback fails (backend-specific).
+        timeout: Longest time to hold up exit, in seconds. None turns the
+            exit flush off again.
     """
-    data = load_wav(sound)
-    backend = _get_backend()
-    backend.play(sound, data)
-    logger.debug(f"Playing sound: {sound.value}")
+    global _exit_timeout
+    if timeout is not None and _exit_timeout is None:
+        import atexit
+
+        atexit.unregister(_flush_at_exit)
+        atexit.register(_flush_at_exit)
+    _exit_timeout = timeout
+
+
+# Registered here rather than in beep_lite.prefork so that every process that
+# imports beep_lite is covered, whether or not it calls prefork().
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
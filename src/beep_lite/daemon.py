@@ -0,0 +1,194 @@
+"""Tiny local playback daemon and its client.
+
+A long-running ``beep-lite --serve`` process keeps the backend and the WAV
+cache warm. Short-lived callers (cron jobs, shell pipelines) then only pay for
+a socket round trip instead of importing and initializing the audio stack.
+
+Wire protocol (one request per connection, UTF-8, newline terminated)::
+
+    <gap-seconds> <sound> [<sound> ...]\\n   ->   ok\\n | error <message>\\n
+
+The reply is sent as soon as the request has been accepted, so clients never
+wait for playback itself.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+DEFAULT_PORT = 47800
+"""TCP port used on platforms without Unix domain sockets."""
+
+_MAX_REQUEST = 4096
+
+
+def default_address() -> str:
+    """Return the default daemon address for this platform.
+
+    Returns:
+        ``host:port`` on Windows, otherwise the path of a Unix domain socket
+        in ``$XDG_RUNTIME_DIR``, or else in a ``beep-lite-<uid>`` directory
+        under the temp directory that only the user can enter.
+    """
+    if sys.platform == "win32" or not hasattr(socket, "AF_UNIX"):
+        return f"127.0.0.1:{DEFAULT_PORT}"
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return str(Path(runtime_dir) / "beep_lite.sock")
+    private_dir = Path(tempfile.gettempdir()) / f"beep-lite-{os.getuid()}"
+    return str(private_dir / "beep_lite.sock")
+
+
+def _private_dir(path: Path) -> None:
+    """Create ``path`` with mode 0700, or check that an existing one is private.
+
+    Raises:
+        OSError: If the directory is a symlink, belongs to another user or is
+            open to other users.
+    """
+    path.mkdir(mode=0o700, exist_ok=True)
+    info = path.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise OSError(f"{path} is not a private directory of this user")
+
+
+def _claim_socket_path(path: Path) -> None:
+    """Remove a stale socket left at ``path`` by a daemon that has exited.
+
+    Raises:
+        OSError: If a daemon is still listening there, or the path is not a
+            socket.
+    """
+    try:
+        info = path.lstat()
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(info.st_mode):
+        raise OSError(f"{path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(1.0)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink(missing_ok=True)
+            return
+    raise OSError(f"a beep-lite daemon is already listening on {path}")
+
+
+def _parse_address(address: str) -> tuple[int, str | tuple[str, int]]:
+    """Split an address string into a socket family and a socket address."""
+    host, sep, port = address.rpartition(":")
+    if sep and host and port.isdigit():
+        return socket.AF_INET, (host, int(port))
+    return socket.AF_UNIX, address
+
+
+def send(
+    sounds: Sequence[str],
+    *,
+    address: str | None = None,
+    gap: float = 0.0,
+    timeout: float = 1.0,
+) -> None:
+    """Ask a running daemon to play a sequence of sounds.
+
+    Args:
+        sounds: Sound names (``Sound.value``) to play in order.
+        address: Daemon address, defaults to :func:`default_address`.
+        gap: Pause in seconds between consecutive sounds.
+        timeout: Connect/reply timeout in seconds.
+
+    Raises:
+        OSError: If the daemon cannot be reached or rejects the request.
+    """
+    family, addr = _parse_address(address or default_address())
+    request = f"{gap:g} {' '.join(sounds)}\n".encode()
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(addr)
+        sock.sendall(request)
+        reply = sock.makefile("rb").readline().decode().strip()
+    if reply != "ok":
+        raise OSError(f"beep-lite daemon rejected request: {reply or 'no reply'}")
+
+
+def serve(address: str | None = None) -> None:
+    """Run the playback daemon until interrupted.
+
+    Args:
+        address: Address to listen on, defaults to :func:`default_address`.
+
+    Raises:
+        OSError: If the address is in use, e.g. by another daemon.
+    """
+    import logging
+    import socketserver
+    import threading
+    import time
+
+    from .core import _get_backend, play_sound
+    from .loader import preload_all
+    from .reporting import report_failure
+    from .types import Sound
+
+    logger = logging.getLogger(__name__)
+
+    def _play_sequence(sounds: list[Sound], gap: float) -> None:
+        for index, sound in enumerate(sounds):
+            if index and gap > 0:
+                time.sleep(gap)
+            try:
+                play_sound(sound, block=True)
+            except Exception as e:
+                report_failure(
+                    "daemon", e, logger, "Daemon failed to play %s: %s", sound.value, e
+                )
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            line = self.rfile.readline(_MAX_REQUEST).decode(errors="replace")
+            try:
+                gap_text, *names = line.split()
+                gap = float(gap_text)
+                sounds = [Sound(name) for name in names]
+            except ValueError as e:
+                self.wfile.write(f"error {e}\n".encode())
+                return
+            self.wfile.write(b"ok\n")
+            # Playback of one request must not hold up other clients.
+            threading.Thread(
+                target=_play_sequence, args=(sounds, gap), daemon=True
+            ).start()
+
+    family, addr = _parse_address(address or default_address())
+    server: socketserver.BaseServer
+    if family == socket.AF_INET:
+        server = socketserver.ThreadingTCPServer(addr, _Handler)
+    else:
+        path = Path(str(addr))
+        if address is None and not os.environ.get("XDG_RUNTIME_DIR"):
+            _private_dir(path.parent)
+        _claim_socket_path(path)
+        server = socketserver.ThreadingUnixStreamServer(str(path), _Handler)
+    server.daemon_threads = True
+    # Warm up only once the address is ours; requests wait in the backlog.
+    preload_all()
+    _get_backend()
+
+    logger.info("beep-lite daemon listening on %s", address or default_address())
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if family != socket.AF_INET:
+            Path(str(addr)).unlink(missing_ok=True)
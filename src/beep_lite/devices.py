@@ -0,0 +1,148 @@
+"""Output device enumeration and per-device beepers.
+
+On Linux the command-line players used by the pipe backend can be pointed at
+a specific output, so one process can drive several speakers:
+
+    >>> from beep_lite import devices
+    >>> [d.name for d in devices.list_devices()]
+    ['default', 'hw:CARD=Station1,DEV=0', 'hw:CARD=Station2,DEV=0']
+    >>> station1 = devices.open_device("hw:CARD=Station1,DEV=0")
+    >>> station1.ok()
+
+Each device gets its own :class:`~beep_lite.core.Beeper`, and with it its own
+player processes and writer threads, so a slow or unplugged speaker never
+delays sounds on another one. See :class:`beep_lite.routing.Router` for
+choosing a device per sound or per station.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import shutil
+import subprocess
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from .core import Beeper
+from .types import Sound
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a listing command before giving up on it.
+_LIST_TIMEOUT = 2.0
+
+
+@dataclass(frozen=True)
+class Device:
+    """An output device a player can be pointed at.
+
+    Attributes:
+        name: Identifier passed to the player (ALSA PCM name or sink name).
+        description: Human-readable description, may be empty.
+        player: Player executable the name is meant for.
+    """
+
+    name: str
+    description: str
+    player: str
+
+
+def _run(command: list[str]) -> str:
+    """Return the output of a listing command, or "" if it cannot be run."""
+    if shutil.which(command[0]) is None:
+        return ""
+    try:
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            timeout=_LIST_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("%s failed: %s", command[0], e)
+        return ""
+    return result.stdout
+
+
+def _alsa_devices(output: str) -> list[Device]:
+    """Parse ``aplay -L``: names unindented, descriptions indented below."""
+    devices: list[Device] = []
+    name: str | None = None
+    lines: list[str] = []
+    for line in [*output.splitlines(), ""]:
+        if line[:1].isspace():
+            lines.append(line.strip())
+            continue
+        if name is not None:
+            devices.append(Device(name, ", ".join(lines), "aplay"))
+        name, lines = (line.strip() or None), []
+    return devices
+
+
+def _pulse_devices(output: str, player: str) -> list[Device]:
+    """Parse ``pactl list short sinks``: ``id name driver format state``."""
+    devices = []
+    for line in output.splitlines():
+        fields = line.split("\t")
+        if len(fields) >= 2:
+            devices.append(Device(fields[1], "", player))
+    return devices
+
+
+def list_devices(player: str | None = None) -> list[Device]:
+    """List the outputs the given (or auto-detected) player can play to.
+
+    Never raises: when the player or its listing tool is missing, or the
+    listing fails, the result is empty.
+
+    Args:
+        player: Player name from :data:`beep_lite.backends.pipe_backend.PLAYERS`,
+            auto-detected if omitted.
+
+    Returns:
+        The devices in the order the system lists them.
+    """
+    from .backends.pipe_backend import find_player
+
+    player = player or find_player()
+    if player == "aplay":
+        return _alsa_devices(_run(["aplay", "-L"]))
+    if player in ("pw-play", "paplay"):
+        # PipeWire serves the PulseAudio API too, and its node names are the
+        # sink names.
+        return _pulse_devices(_run(["pactl", "list", "short", "sinks"]), player)
+    return []
+
+
+def open_device(
+    device: str | Device,
+    *,
+    player: str | None = None,
+    pool_size: int = 2,
+    max_age: Mapping[Sound, float | None] | None = None,
+) -> Beeper:
+    """Create a beeper that plays through one output device.
+
+    The player processes are started on the first sound (or by
+    :func:`beep_lite.warmup` with ``beeper=``). Sounds are not redirected to
+    another device if this one fails; failures are reported like any other
+    playback error.
+
+    Args:
+        device: A :class:`Device` or the device name to pass to the player.
+        player: Player name, by default the device's or the auto-detected one.
+        pool_size: Maximum number of player processes per PCM format.
+        max_age: Per-sound maximum request age, as for :class:`Beeper`.
+
+    Returns:
+        A new beeper bound to the device.
+    """
+    from .backends.pipe_backend import PipeBackend
+
+    if isinstance(device, Device):
+        player = player or device.player
+        device = device.name
+    factory = functools.partial(PipeBackend, player, pool_size, device)
+    return Beeper(candidates=[(f"pipe:{device}", factory)], max_age=max_age)
@@ -0,0 +1,404 @@
+"""Backend health tracking with a circuit breaker and automatic failover.
+
+The selected backend used to be cached forever, so an unplugged USB headset
+meant every beep failed (and logged) until the process restarted.
+:class:`ResilientBackend` wraps the candidate backends in priority order:
+
+* consecutive failures are counted per backend;
+* after ``failure_threshold`` failures its circuit opens and sounds go to the
+  next candidate without touching the broken device;
+* a background thread re-probes the broken backend with a silent sound,
+  backing off exponentially, and closes the circuit once it works again.
+
+The last candidate (the terminal bell) is the last resort and never opens.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+from .backends import Backend, CompletionSignal, ProbeListener, close_backend
+from .pcm import PcmFormat, silent_wav
+from .stream import FILE, PcmStream, StreamingUnsupported
+from .types import Sound
+
+logger = logging.getLogger(__name__)
+
+BackendFactory = Callable[[], Backend]
+"""Zero-argument callable creating a backend, raising ImportError if absent."""
+
+_PROBE_FORMAT = PcmFormat(rate=16000, channels=1, width=2)
+
+
+@dataclass(frozen=True)
+class BackendStatus:
+    """Snapshot of one candidate backend's health.
+
+    Attributes:
+        name: Candidate name (``"simpleaudio"``, ``"fallback"``, ...).
+        state: ``"idle"`` (not created yet), ``"closed"`` (healthy),
+            ``"open"`` (failing, skipped) or ``"unavailable"`` (not installed).
+        failures: Consecutive failures since the last success.
+        backoff: Seconds until the next re-probe while open.
+    """
+
+    name: str
+    state: str
+    failures: int
+    backoff: float
+
+
+class _Slot:
+    """Circuit state of one candidate backend."""
+
+    def __init__(self, name: str, factory: BackendFactory) -> None:
+        self.name = name
+        self.factory = factory
+        self.backend: Backend | None = None
+        self.unavailable = False
+        self.open = False
+        self.failures = 0
+        self.backoff = 0.0
+
+
+class _SlotListener:
+    """Routes a backend's playback outcomes to its slot."""
+
+    def __init__(self, owner: ResilientBackend, slot: _Slot) -> None:
+        self._owner = owner
+        self._slot = slot
+
+    def playback_succeeded(self) -> None:
+        self._owner._record_success(self._slot)
+
+    def playback_failed(self, error: BaseException) -> None:
+        self._owner._record_failure(self._slot, error)
+
+
+class ResilientBackend:
+    """Backend wrapper adding health tracking and failover.
+
+    Conforms to the :class:`~beep_lite.backends.Backend` protocol itself, so
+    the core playback path does not need to know about it.
+    """
+
+    signals_completion = True
+    checks_staleness = True
+
+    def __init__(
+        self,
+        candidates: Sequence[tuple[str, BackendFactory]],
+        *,
+        failure_threshold: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            candidates: ``(name, factory)`` pairs in priority order. The last
+                one is the last resort and must not fail to construct.
+            failure_threshold: Consecutive failures that open a circuit.
+            backoff: Initial delay in seconds before re-probing.
+            max_backoff: Upper bound for the exponential re-probe delay.
+        """
+        if not candidates:
+            raise ValueError("At least one backend candidate is required")
+        self._slots = [_Slot(name, factory) for name, factory in candidates]
+        self._failure_threshold = max(1, failure_threshold)
+        self._base_backoff = backoff
+        self._max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        # Result of the last selection, read without the lock by every play;
+        # reset to None under the lock whenever a slot changes state.
+        self._active: tuple[_Slot, Backend] | None = None
+
+    def _attach(self, slot: _Slot, backend: Backend) -> None:
+        if hasattr(backend, "listener"):
+            backend.listener = _SlotListener(self, slot)  # type: ignore[attr-defined]
+
+    def _current(self) -> tuple[_Slot, Backend]:
+        """Return the highest-priority healthy backend, creating it if needed."""
+        active = self._active
+        if active is not None:
+            return active
+        failed: list[tuple[_Slot, Exception]] = []
+        try:
+            with self._lock:
+                for slot in self._slots:
+                    if slot.unavailable or slot.open:
+                        continue
+                    if slot.backend is None:
+                        try:
+                            backend = slot.factory()
+                        except ImportError as e:
+                            logger.debug("%s backend not available: %s", slot.name, e)
+                            slot.unavailable = True
+                            continue
+                        except Exception as e:
+                            # Installed but broken (e.g. no device right now).
+                            if slot is self._slots[-1]:
+                                raise
+                            slot.open = True
+                            slot.backoff = self._base_backoff
+                            failed.append((slot, e))
+                            continue
+                        self._attach(slot, backend)
+                        slot.backend = backend
+                        logger.debug("Selected %s backend", slot.name)
+                    active = self._active = (slot, slot.backend)
+                    return active
+            raise RuntimeError("No playback backend available")
+        finally:
+            for slot, error in failed:
+                self._start_probe(slot, error)
+
+    @property
+    def active_name(self) -> str:
+        """Name of the backend that the next sound will be played with."""
+        return self._current()[0].name
+
+    def play(
+        self,
+        sound: Sound,
+        data: bytes,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+        enqueued: float | None = None,
+        limits: Mapping[Sound, float | None] | None = None,
+    ) -> None:
+        """Play a sound on the highest-priority healthy backend.
+
+        Args:
+            sound: The sound type to play.
+            data: The WAV file data as bytes.
+            block: If True, return only once playback has finished.
+            done: Set once the sound has finished playing, or failed. For
+                backends that cannot report completion it is set as soon as
+                playback has been started.
+            enqueued: When the sound was requested, passed on to backends
+                that check staleness when they dequeue it.
+            limits: Per-sound maximum ages to check it against.
+        """
+        slot, backend = self._current()
+        # Only the keywords a backend declares are passed on.
+        kwargs: dict[str, object] = {}
+        if block:
+            kwargs["block"] = True
+        signals = done is not None and (
+            getattr(backend, "signals_completion", False) is True
+        )
+        if signals:
+            kwargs["done"] = done
+        if (
+            enqueued is not None
+            and not block
+            and getattr(backend, "checks_staleness", False) is True
+        ):
+            kwargs["enqueued"] = enqueued
+            kwargs["limits"] = limits
+        try:
+            backend.play(sound, data, **kwargs)
+        except Exception as e:
+            if done is not None:
+                done.set()
+            self._record_failure(slot, e)
+            raise
+        if done is not None and not signals:
+            done.set()
+
+    def play_stream(
+        self,
+        stream: PcmStream,
+        *,
+        block: bool = False,
+        done: CompletionSignal | None = None,
+    ) -> None:
+        """Stream a long sound on the highest-priority healthy backend.
+
+        Small files (those the stream holds whole) are played like a sound
+        on backends that cannot stream.
+
+        Args:
+            stream: The sound, from :func:`beep_lite.stream.open_stream`.
+            block: If True, return only once playback has finished.
+            done: Set once the sound has finished playing, or failed.
+
+        Raises:
+            StreamingUnsupported: If that backend cannot stream and the file
+                is too large to play whole.
+        """
+        slot, backend = self._current()
+        play_stream = getattr(backend, "play_stream", None)
+        if play_stream is None:
+            if stream.data is not None:
+                self.play(FILE, stream.data, block=block, done=done)  # type: ignore[arg-type]
+                return
+            if done is not None:
+                done.set()
+            raise StreamingUnsupported(f"The {slot.name} backend cannot stream")
+        try:
+            play_stream(stream, block=block, done=done)
+        except Exception as e:
+            if done is not None:
+                done.set()
+            self._record_failure(slot, e)
+            raise
+
+    def prepare(self, sound: Sound, data: bytes) -> None:
+        """Let the active backend decode a sound ahead of time, if it can.
+
+        Args:
+            sound: The sound type to prepare.
+            data: The WAV file data as bytes.
+        """
+        prepare = getattr(self._current()[1], "prepare", None)
+        if prepare is not None:
+            prepare(sound, data)
+
+    def prime(self) -> None:
+        """Let the active backend open its output device, if it can."""
+        slot, backend = self._current()
+        prime = getattr(backend, "prime", None)
+        if prime is None:
+            return
+        try:
+            prime()
+        except Exception as e:
+            self._record_failure(slot, e)
+            raise
+
+    def is_available(self) -> bool:
+        """Check if any candidate backend is usable.
+
+        Returns:
+            Always True, as the last-resort candidate always works.
+        """
+        return True
+
+    def _record_success(self, slot: _Slot) -> None:
+        # Only written on change: every play reports here, from any thread.
+        if slot.failures:
+            slot.failures = 0
+
+    def _record_failure(self, slot: _Slot, error: BaseException) -> None:
+        with self._lock:
+            slot.failures += 1
+            if (
+                slot.open
+                or slot.failures < self._failure_threshold
+                or slot is self._slots[-1]
+            ):
+                return
+            slot.open = True
+            slot.backoff = self._base_backoff
+            stale, slot.backend = slot.backend, None
+            self._active = None
+        close_backend(stale)
+        self._start_probe(slot, error)
+
+    def _start_probe(self, slot: _Slot, error: BaseException) -> None:
+        logger.warning(
+            "%s backend is failing (%s); failing over until it recovers",
+            slot.name,
+            error,
+        )
+        threading.Thread(
+            target=self._probe_loop,
+            args=(slot,),
+            name=f"beep-lite-probe-{slot.name}",
+            daemon=True,
+        ).start()
+
+    def _probe_loop(self, slot: _Slot) -> None:
+        while not self._closed.wait(slot.backoff):
+            backend = self._probe(slot)
+            if backend is not None:
+                with self._lock:
+                    self._attach(slot, backend)
+                    slot.backend = backend
+                    slot.failures = 0
+                    slot.backoff = 0.0
+                    slot.open = False
+                    self._active = None
+                logger.info("%s backend recovered", slot.name)
+                return
+            slot.backoff = min(slot.backoff * 2, self._max_backoff)
+
+    def _probe(self, slot: _Slot) -> Backend | None:
+        """Create a fresh backend and play silence through it."""
+        try:
+            backend = slot.factory()
+        except Exception as e:
+            logger.debug("Probe of %s backend failed: %s", slot.name, e)
+            return None
+        probe = ProbeListener()
+        if hasattr(backend, "listener"):
+            backend.listener = probe  # type: ignore[attr-defined]
+        try:
+            backend.play(Sound.OK, silent_wav(_PROBE_FORMAT, 0.01), block=True)
+        except Exception as e:
+            probe.error = e
+        if probe.error is not None:
+            logger.debug("Probe of %s backend failed: %s", slot.name, probe.error)
+            close_backend(backend)
+            return None
+        return backend
+
+    def status(self) -> list[BackendStatus]:
+        """Return the health of every candidate in priority order."""
+        with self._lock:
+            return [
+                BackendStatus(
+                    name=slot.name,
+                    state=(
+                        "unavailable"
+                        if slot.unavailable
+                        else (
+                            "open"
+                            if slot.open
+                            else "idle" if slot.backend is None else "closed"
+                        )
+                    ),
+                    failures=slot.failures,
+                    backoff=slot.backoff,
+                )
+                for slot in self._slots
+            ]
+
+    def after_fork(self) -> None:
+        """Reset inherited threads and locks in a forked child.
+
+        Healthy backends are kept if they can reset themselves too (see
+        :class:`~beep_lite.backends.Backend`), otherwise created again on
+        first use. Probe threads do not survive fork, so open circuits are
+        closed and their backends retried from scratch.
+        """
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._active = None
+        for slot in self._slots:
+            after_fork = getattr(slot.backend, "after_fork", None)
+            if slot.open or after_fork is None:
+                slot.backend = None
+                slot.open = False
+                slot.failures = 0
+                slot.backoff = 0.0
+            else:
+                after_fork()
+
+    def close(self) -> None:
+        """Stop re-probing and release all backends."""
+        self._closed.set()
+        with self._lock:
+            backends = [slot.backend for slot in self._slots]
+            for slot in self._slots:
+                slot.backend = None
+            self._active = None
+        for backend in backends:
+            close_backend(backend)
@@ -1,13 +1,46 @@
-"""WAV file loader using importlib.resources."""
+"""WAV file loader using importlib.resources.
+
+Loaded files are interned by content hash: sounds whose WAV files are
+byte-identical share one ``bytes`` object, and therefore one decoded and one
+converted PCM buffer further down (see :mod:`beep_lite.pcm_cache`).
+"""
 
 import logging
-from functools import lru_cache
+import threading
+from dataclasses import dataclass
 from importlib import resources
 
 from .types import Sound
 
 logger = logging.getLogger(__name__)
 
+_lock = threading.Lock()
+# sound -> its interned WAV data; read without the lock on every play
+_loaded: dict[Sound, bytes] = {}
+# sha256 of WAV data -> the single bytes object shared by all sounds with it
+_blobs: dict[str, bytes] = {}
+# sound -> sha256 of its WAV data, for memory accounting
+_digests: dict[Sound, str] = {}
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """In-process memory used by the sound caches.
+
+    Attributes:
+        sounds: Number of sounds whose WAV data is cached.
+        buffers: Distinct WAV contents among them.
+        wav_bytes: Bytes held for WAV data.
+        pcm_bytes: Bytes held for decoded and converted PCM.
+        saved_bytes: Bytes not held because sounds share identical audio.
+    """
+
+    sounds: int
+    buffers: int
+    wav_bytes: int
+    pcm_bytes: int
+    saved_bytes: int
+
 
 class SoundNotFoundError(Exception):
     """Raised when a sound file cannot be found."""
@@ -15,12 +48,12 @@ class SoundNotFoundError(Exception):
     pass
 
 
-@lru_cache(maxsize=16)
 def load_wav(sound: Sound) -> bytes:
     """Load a WAV file from the assets directory.
 
     Uses importlib.resources for reliable resource loading,
-    compatible with PyInstaller and other packaging tools.
+    compatible with PyInstaller and other packaging tools. Each file is read
+    once; later calls are a lock-free dictionary lookup.
 
     Args:
         sound: The sound to load.
@@ -31,6 +64,9 @@ def load_wav(sound: Sound) -> bytes:
     Raises:
         SoundNotFoundError: If the WAV file cannot be found.
     """
+    data = _loaded.get(sound)
+    if data is not None:
+        return data
     filename = f"{sound.value}.wav"
 
     try:
@@ -38,30 +74,79 @@ def load_wav(sound: Sound) -> bytes:
         assets = resources.files("beep_lite") / "assets"
         wav_file = assets / filename
 
-        return wav_file.read_bytes()
+        data = wav_file.read_bytes()
     except FileNotFoundError as e:
         raise SoundNotFoundError(f"WAV file not found: {filename}") from e
     except Exception as e:
         raise SoundNotFoundError(f"Failed to load WAV file {filename}: {e}") from e
+    return _intern(sound, data)
+
+
+def _intern(sound: Sound, data: bytes) -> bytes:
+    """Cache ``data`` for ``sound`` as the shared bytes object of its content."""
+    import hashlib
+
+    digest = hashlib.sha256(data).hexdigest()
+    with _lock:
+        _digests[sound] = digest
+        return _loaded.setdefault(sound, _blobs.setdefault(digest, data))
 
 
 def preload_all() -> None:
     """Preload all sound files into cache.
 
     Call this at application startup to avoid latency on first play.
-    Errors are logged but not raised.
+    Errors are logged but not raised. See :func:`beep_lite.warmup` to also
+    decode the sounds and initialise the backend, in the background.
     """
     for sound in Sound:
         try:
             load_wav(sound)
-            logger.debug(f"Preloaded sound: {sound.value}")
+            logger.debug("Preloaded sound: %s", sound.value)
         except SoundNotFoundError as e:
-            logger.warning(f"Failed to preload {sound.value}: {e}")
+            logger.warning("Failed to preload %s: %s", sound.value, e)
 
 
-def clear_cache() -> None:
+def clear_cache(disk: bool = False) -> None:
     """Clear the sound cache.
 
     Useful for testing or when sound files have been updated.
+
+    Args:
+        disk: Also delete the persistent on-disk PCM cache.
+    """
+    from . import pcm_cache
+
+    with _lock:
+        _loaded.clear()
+        _blobs.clear()
+        _digests.clear()
+    if disk:
+        pcm_cache.purge()
+    else:
+        pcm_cache.clear_memory()
+
+
+def cache_stats() -> CacheStats:
+    """Report how much memory the sound caches hold and how much sharing saves.
+
+    Returns:
+        Current usage of the WAV and PCM caches of this process.
     """
-    load_wav.cache_clear()
+    from . import pcm_cache
+
+    with _lock:
+        digests = list(_digests.values())
+        wav_sizes = {digest: len(blob) for digest, blob in _blobs.items()}
+    pcm_sizes = pcm_cache.memory_usage()
+    wav_bytes = sum(wav_sizes.values())
+    pcm_bytes = sum(pcm_sizes.values())
+    # What the caches would hold if every sound kept its own copies.
+    unshared = sum(wav_sizes.get(d, 0) + pcm_sizes.get(d, 0) for d in digests)
+    return CacheStats(
+        sounds=len(digests),
+        buffers=len(set(digests)),
+        wav_bytes=wav_bytes,
+        pcm_bytes=pcm_bytes,
+        saved_bytes=max(0, unshared - wav_bytes - pcm_bytes),
+    )
@@ -0,0 +1,149 @@
+"""Build-time manifest of the bundled sounds.
+
+``assets/manifest.json`` records the format, length and content hash of every
+bundled WAV file. It is regenerated by the build hook (``hatch_build.py``) and
+can be refreshed by hand with::
+
+    python -m beep_lite.manifest [ASSETS_DIR]
+
+At run time it answers timing questions in O(1) without opening any audio:
+
+    >>> import beep_lite
+    >>> beep_lite.duration(beep_lite.Sound.CRIT)
+    0.21
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .types import Sound
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SoundInfo:
+    """Format and length of a bundled sound.
+
+    Attributes:
+        rate: Sample rate in Hz.
+        channels: Number of channels.
+        width: Bytes per sample.
+        frames: Number of frames.
+        duration: Length in seconds.
+        sha256: Hex digest of the WAV file.
+    """
+
+    rate: int
+    channels: int
+    width: int
+    frames: int
+    duration: float
+    sha256: str
+
+
+def build_manifest(assets_dir: Path) -> dict[str, Any]:
+    """Describe every WAV file in ``assets_dir``.
+
+    Args:
+        assets_dir: Directory containing the ``<sound>.wav`` files.
+
+    Returns:
+        The manifest as a JSON-serialisable dict.
+    """
+    import hashlib
+    import wave
+
+    sounds: dict[str, dict[str, Any]] = {}
+    for path in sorted(assets_dir.glob("*.wav")):
+        data = path.read_bytes()
+        with wave.open(str(path), "rb") as reader:
+            rate = reader.getframerate()
+            frames = reader.getnframes()
+            sounds[path.stem] = {
+                "rate": rate,
+                "channels": reader.getnchannels(),
+                "width": reader.getsampwidth(),
+                "frames": frames,
+                "duration": frames / rate,
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+    return {"version": MANIFEST_VERSION, "sounds": sounds}
+
+
+def write_manifest(assets_dir: Path) -> Path:
+    """Regenerate ``manifest.json`` in ``assets_dir``.
+
+    Args:
+        assets_dir: Directory containing the ``<sound>.wav`` files.
+
+    Returns:
+        Path of the written manifest.
+    """
+    import json
+
+    path = assets_dir / MANIFEST_NAME
+    text = json.dumps(build_manifest(assets_dir), indent=2, sort_keys=True)
+    path.write_text(text + "\n", encoding="utf-8")
+    return path
+
+
+@lru_cache(maxsize=1)
+def _sounds() -> dict[str, SoundInfo]:
+    import json
+    from importlib import resources
+
+    text = (resources.files("beep_lite") / "assets" / MANIFEST_NAME).read_text(
+        encoding="utf-8"
+    )
+    return {
+        name: SoundInfo(**fields) for name, fields in json.loads(text)["sounds"].items()
+    }
+
+
+def info(sound: Sound) -> SoundInfo:
+    """Return the manifest entry of a bundled sound.
+
+    Args:
+        sound: The :class:`~beep_lite.types.Sound` to look up.
+
+    Returns:
+        Its format, length and content hash.
+
+    Raises:
+        KeyError: If the sound is not in the manifest.
+    """
+    return _sounds()[sound.value]
+
+
+def duration(sound: Sound) -> float:
+    """Return how long a bundled sound plays, in seconds.
+
+    Reads the build-time manifest; no audio data is loaded or parsed.
+
+    Args:
+        sound: The :class:`~beep_lite.types.Sound` to look up.
+
+    Returns:
+        The duration in seconds.
+
+    Example:
+        >>> from beep_lite import duration, Sound
+        >>> duration(Sound.OK)
+        0.08
+    """
+    return info(sound).duration
+
+
+if __name__ == "__main__":
+    assets = (
+        Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent / "assets"
+    )
+    print(write_manifest(assets))
@@ -0,0 +1,244 @@
+"""Raw PCM helpers shared by backends that do not take WAV files directly."""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import wave
+from array import array
+from dataclasses import dataclass
+
+OUTPUT_FORMAT_ENV = "BEEP_LITE_OUTPUT_FORMAT"
+"""Environment variable forcing an output format, e.g. ``48000:2:2``."""
+
+
+@dataclass(frozen=True)
+class PcmFormat:
+    """Sample layout of a raw PCM stream.
+
+    Attributes:
+        rate: Frames per second.
+        channels: Interleaved channel count.
+        width: Bytes per sample (2 for 16-bit).
+    """
+
+    rate: int
+    channels: int
+    width: int
+
+    @property
+    def frame_size(self) -> int:
+        """Bytes per frame (all channels of one sample instant)."""
+        return self.channels * self.width
+
+
+@dataclass(frozen=True)
+class Pcm:
+    """Decoded, ready-to-play audio.
+
+    Attributes:
+        format: Sample layout of ``frames``.
+        frames: Interleaved little-endian sample data. May be a read-only
+            ``memoryview`` (e.g. of a memory-mapped cache file).
+    """
+
+    format: PcmFormat
+    frames: bytes | memoryview
+
+    @property
+    def duration(self) -> float:
+        """Playback time in seconds."""
+        return len(self.frames) / (self.format.frame_size * self.format.rate)
+
+
+def decode_wav(data: bytes) -> Pcm:
+    """Decode an uncompressed WAV file into raw PCM.
+
+    Args:
+        data: The WAV file data as bytes.
+
+    Returns:
+        The decoded PCM.
+
+    Raises:
+        wave.Error: If the data is not a supported WAV file.
+        EOFError: If the data is truncated.
+    """
+    with wave.open(io.BytesIO(data), "rb") as reader:
+        fmt = PcmFormat(
+            rate=reader.getframerate(),
+            channels=reader.getnchannels(),
+            width=reader.getsampwidth(),
+        )
+        frames = reader.readframes(reader.getnframes())
+    return Pcm(format=fmt, frames=frames)
+
+
+def silence(fmt: PcmFormat, frames: int) -> bytes:
+    """Return ``frames`` frames of silence (0x80 for unsigned 8-bit audio).
+
+    Args:
+        fmt: Sample layout of the silence.
+        frames: Number of frames.
+
+    Returns:
+        The raw PCM data.
+    """
+    return (b"\x80" if fmt.width == 1 else b"\x00") * (frames * fmt.frame_size)
+
+
+def silent_wav(fmt: PcmFormat, seconds: float) -> bytes:
+    """Build a WAV file containing only silence.
+
+    Used to probe backends without making an audible sound.
+
+    Args:
+        fmt: Sample layout of the generated file.
+        seconds: Length of the silence.
+
+    Returns:
+        The WAV file data as bytes.
+    """
+    frames = max(1, int(fmt.rate * seconds))
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(fmt.channels)
+        writer.setsampwidth(fmt.width)
+        writer.setframerate(fmt.rate)
+        writer.writeframes(silence(fmt, frames))
+    return buffer.getvalue()
+
+
+def parse_format(text: str) -> PcmFormat:
+    """Parse ``rate[:channels[:width]]`` (defaults: mono, 16-bit).
+
+    Args:
+        text: Format specification such as ``"48000:2:2"``.
+
+    Returns:
+        The parsed format.
+
+    Raises:
+        ValueError: If the text is not a valid format specification.
+    """
+    parts = [int(part) for part in text.split(":")]
+    if not 1 <= len(parts) <= 3:
+        raise ValueError(f"Invalid PCM format: {text!r}")
+    rate = parts[0]
+    channels = parts[1] if len(parts) > 1 else 1
+    width = parts[2] if len(parts) > 2 else 2
+    if rate <= 0 or channels <= 0 or width not in (1, 2, 3, 4):
+        raise ValueError(f"Invalid PCM format: {text!r}")
+    return PcmFormat(rate=rate, channels=channels, width=width)
+
+
+def output_format() -> PcmFormat | None:
+    """Return the output format forced via ``BEEP_LITE_OUTPUT_FORMAT``, if any.
+
+    Backends convert every sound to this format before playback, for output
+    devices that only accept one fixed format.
+    """
+    text = os.environ.get(OUTPUT_FORMAT_ENV)
+    return parse_format(text) if text else None
+
+
+def to_samples(frames: bytes | memoryview, width: int) -> list[float]:
+    """Decode little-endian PCM into floats in [-1.0, 1.0).
+
+    Args:
+        frames: Interleaved PCM data.
+        width: Bytes per sample.
+
+    Returns:
+        One float per sample, channels still interleaved.
+    """
+    if width == 1:
+        return [(value - 128) / 128.0 for value in bytes(frames)]
+    if width in (2, 4):
+        samples = array("h" if width == 2 else "i")
+        if samples.itemsize == width:
+            samples.frombytes(frames)
+            if sys.byteorder == "big":
+                samples.byteswap()
+            scale = float(1 << (8 * width - 1))
+            return [value / scale for value in samples]
+    raw = bytes(frames)
+    scale = float(1 << (8 * width - 1))
+    return [
+        int.from_bytes(raw[i : i + width], "little", signed=True) / scale
+        for i in range(0, len(raw), width)
+    ]
+
+
+def from_samples(samples: list[float], width: int) -> bytes:
+    """Encode floats in [-1.0, 1.0] as little-endian PCM.
+
+    Values outside that range are clipped to full scale.
+
+    Args:
+        samples: One float per sample, channels interleaved.
+        width: Bytes per sample.
+
+    Returns:
+        The PCM data.
+    """
+    top = (1 << (8 * width - 1)) - 1
+    ints = [max(-top - 1, min(top, round(value * (top + 1)))) for value in samples]
+    if width == 1:
+        return bytes(value + 128 for value in ints)
+    if width in (2, 4):
+        out = array("h" if width == 2 else "i")
+        if out.itemsize == width:
+            out.extend(ints)
+            if sys.byteorder == "big":
+                out.byteswap()
+            return out.tobytes()
+    return b"".join(value.to_bytes(width, "little", signed=True) for value in ints)
+
+
+def convert(pcm: Pcm, fmt: PcmFormat) -> Pcm:
+    """Convert PCM to another rate, channel count and sample width.
+
+    Pure Python (no numpy): channels are averaged down or duplicated up and
+    the rate is changed by linear interpolation, which is plenty for short
+    notification tones.
+
+    Args:
+        pcm: The source audio.
+        fmt: The target format.
+
+    Returns:
+        The converted audio (``pcm`` itself if the format already matches).
+    """
+    src = pcm.format
+    if src == fmt:
+        return pcm
+    samples = to_samples(pcm.frames, src.width)
+    count = len(samples) // src.channels
+    # Split into per-channel lists, then map to the target channel count.
+    channels = [samples[c :: src.channels][:count] for c in range(src.channels)]
+    if fmt.channels == 1 and src.channels > 1:
+        channels = [
+            [sum(frame) / src.channels for frame in zip(*channels, strict=True)]
+        ]
+    else:
+        channels = [channels[c % src.channels] for c in range(fmt.channels)]
+
+    if fmt.rate != src.rate and count > 1:
+        new_count = max(1, round(count * fmt.rate / src.rate))
+        step = (count - 1) / max(1, new_count - 1)
+        resampled = []
+        for channel in channels:
+            out = []
+            for i in range(new_count):
+                position = i * step
+                left = int(position)
+                right = min(left + 1, count - 1)
+                frac = position - left
+                out.append(channel[left] + (channel[right] - channel[left]) * frac)
+            resampled.append(out)
+        channels = resampled
+
+    interleaved = [value for frame in zip(*channels, strict=True) for value in frame]
+    return Pcm(format=fmt, frames=from_samples(interleaved, fmt.width))
@@ -0,0 +1,253 @@
+"""Persistent on-disk cache of decoded (and converted) PCM.
+
+Short-lived processes would otherwise parse every WAV file and, with a forced
+output format, resample it again on each start. Entries are written once per
+content hash and target format, then memory-mapped by every later process.
+
+Layout::
+
+    <cache dir>/<package version>/pcm/<sha256 of WAV>-<rate>-<channels>-<width>.pcm
+
+Each file is a 16-byte header (magic, rate, channels, width) followed by the
+raw frames. The cache directory defaults to the platform's user cache
+directory and can be changed with ``BEEP_LITE_CACHE_DIR``;
+``BEEP_LITE_DISK_CACHE=0`` disables it. Files played with
+:func:`beep_lite.play_file` are cached too, so the entries of each version
+are kept within :data:`MAX_DISK_BYTES`, least recently used first out.
+
+:func:`pack` moves the in-process entries into one anonymous shared memory
+mapping, so that pre-forked worker processes read the parent's pages instead
+of each holding their own copies (see :func:`beep_lite.prefork`).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from ._version import __version__
+from .pcm import Pcm, PcmFormat, convert, decode_wav
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "BEEP_LITE_CACHE_DIR"
+DISK_CACHE_ENV = "BEEP_LITE_DISK_CACHE"
+
+MAX_DISK_BYTES = 64 * 1024 * 1024
+"""On-disk entries of one package version are pruned beyond this many bytes."""
+
+_HEADER = struct.Struct("<6sIHH")
+_MAGIC = b"BLPCM1"
+
+_lock = threading.Lock()
+# (WAV digest, target format or None for native) -> decoded PCM
+_memory: dict[tuple[str, PcmFormat | None], Pcm] = {}
+
+
+def cache_dir() -> Path:
+    """Return the beep-lite user cache directory (not created).
+
+    ``BEEP_LITE_CACHE_DIR`` wins; otherwise ``%LOCALAPPDATA%`` on Windows,
+    ``~/Library/Caches`` on macOS and ``$XDG_CACHE_HOME`` (``~/.cache``)
+    elsewhere.
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or tempfile.gettempdir()
+        return Path(base) / "beep_lite" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "beep_lite"
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "beep_lite"
+
+
+def disk_cache_enabled() -> bool:
+    """Return False if ``BEEP_LITE_DISK_CACHE=0`` turns the disk cache off."""
+    return os.environ.get(DISK_CACHE_ENV, "1") != "0"
+
+
+def _entry_path(digest: str, fmt: PcmFormat | None) -> Path:
+    suffix = "native" if fmt is None else f"{fmt.rate}-{fmt.channels}-{fmt.width}"
+    return cache_dir() / __version__ / "pcm" / f"{digest}-{suffix}.pcm"
+
+
+def _read_entry(path: Path) -> Pcm | None:
+    """Memory-map a cache entry, or return None if it is missing or invalid."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapped) < _HEADER.size:
+        mapped.close()
+        return None
+    magic, rate, channels, width = _HEADER.unpack_from(mapped)
+    if magic != _MAGIC:
+        mapped.close()
+        return None
+    fmt = PcmFormat(rate=rate, channels=channels, width=width)
+    with contextlib.suppress(OSError):
+        os.utime(path)  # mark it recently used for _prune()
+    return Pcm(format=fmt, frames=memoryview(mapped)[_HEADER.size :])
+
+
+def _write_entry(path: Path, pcm: Pcm) -> None:
+    """Write an entry atomically so concurrent processes never see a partial one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fmt = pcm.format
+    header = _HEADER.pack(_MAGIC, fmt.rate, fmt.channels, fmt.width)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header + bytes(pcm.frames))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _prune(directory: Path) -> None:
+    """Delete the least recently used entries beyond :data:`MAX_DISK_BYTES`."""
+    try:
+        entries = [
+            (info.st_mtime_ns, info.st_size, entry.path)
+            for entry in os.scandir(directory)
+            if entry.name.endswith(".pcm")
+            for info in (entry.stat(),)
+        ]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= MAX_DISK_BYTES:
+            return
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def load_pcm(data: bytes, fmt: PcmFormat | None = None) -> Pcm:
+    """Return ready-to-play PCM for a WAV file, using the caches.
+
+    Looks in the in-process cache, then memory-maps the on-disk entry, and
+    only decodes (and converts) the WAV data if neither has it.
+
+    Args:
+        data: The WAV file data as bytes.
+        fmt: Target format, or None to keep the file's own format.
+
+    Returns:
+        The decoded PCM. Its ``frames`` may be a read-only memoryview.
+
+    Raises:
+        wave.Error: If the data is not a supported WAV file.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    key = (digest, fmt)
+    cached = _memory.get(key)
+    if cached is not None:
+        return cached
+
+    use_disk = disk_cache_enabled()
+    path = _entry_path(digest, fmt) if use_disk else None
+    pcm = _read_entry(path) if path is not None else None
+    if pcm is None:
+        pcm = decode_wav(data)
+        if fmt is not None:
+            pcm = convert(pcm, fmt)
+        if path is not None:
+            try:
+                _write_entry(path, pcm)
+            except OSError as e:
+                logger.debug("Could not write PCM cache entry %s: %s", path, e)
+            else:
+                _prune(path.parent)
+    with _lock:
+        return _memory.setdefault(key, pcm)
+
+
+def pack(datas: Iterable[bytes], fmt: PcmFormat | None = None) -> int:
+    """Move the PCM of the given WAV files into one shared, read-only arena.
+
+    Every file is decoded (through the caches) and its frames copied into a
+    single anonymous ``mmap``; the in-process cache entries are replaced by
+    read-only views of it. The mapping is shared, not copied, by processes
+    forked afterwards, and the views hold no per-sample objects, so reading
+    them never writes to the shared pages.
+
+    Args:
+        datas: WAV file data, e.g. the bundled sounds.
+        fmt: Target format the backends will ask for, or None for native.
+
+    Returns:
+        The size of the arena in bytes (0 if there was nothing to pack).
+
+    Raises:
+        wave.Error: If one of the files is not a supported WAV file.
+    """
+    entries: dict[tuple[str, PcmFormat | None], Pcm] = {}
+    for data in datas:
+        key = (hashlib.sha256(data).hexdigest(), fmt)
+        if key not in entries:
+            entries[key] = load_pcm(data, fmt)
+    total = sum(len(pcm.frames) for pcm in entries.values())
+    if not total:
+        return 0
+    arena = mmap.mmap(-1, total)
+    view = memoryview(arena).toreadonly()
+    offset = 0
+    packed: dict[tuple[str, PcmFormat | None], Pcm] = {}
+    for key, pcm in entries.items():
+        end = offset + len(pcm.frames)
+        arena[offset:end] = pcm.frames
+        packed[key] = Pcm(format=pcm.format, frames=view[offset:end])
+        offset = end
+    with _lock:
+        _memory.update(packed)
+    logger.debug("Packed %d PCM buffers into a %d-byte arena", len(packed), total)
+    return total
+
+
+def memory_usage() -> dict[str, int]:
+    """Return the bytes of PCM held in this process, per WAV content hash.
+
+    Every target format of one WAV file is included in its total.
+    """
+    usage: dict[str, int] = {}
+    with _lock:
+        for (digest, _fmt), pcm in _memory.items():
+            usage[digest] = usage.get(digest, 0) + len(pcm.frames)
+    return usage
+
+
+def clear_memory() -> None:
+    """Forget all PCM held in this process (on-disk entries are kept)."""
+    with _lock:
+        _memory.clear()
+
+
+def purge() -> None:
+    """Delete the on-disk PCM entries of every beep-lite version."""
+    clear_memory()
+    root = cache_dir()
+    if not root.is_dir():
+        return
+    for version_dir in root.iterdir():
+        pcm_dir = version_dir / "pcm"
+        if pcm_dir.is_dir():
+            shutil.rmtree(pcm_dir, ignore_errors=True)
+    logger.debug("Purged PCM cache at %s", root)
@@ -0,0 +1,395 @@
+"""Third-party backends discovered through entry points.
+
+A package adds a backend by declaring an entry point in the
+``beep_lite.backends`` group. Its name is the candidate name and its value a
+backend factory, usually the backend class:
+
+.. code-block:: toml
+
+    [project.entry-points."beep_lite.backends"]
+    netspeaker = "acme_beep.netspeaker:NetSpeakerBackend"
+
+Two optional class attributes of the factory place it among the
+candidates:
+
+* ``priority``: lower is tried first. The built-in backends are winsound
+  (10), simpleaudio (20) and the pipe players (30); the terminal bell always
+  comes last. Defaults to 50.
+* ``platforms``: ``sys.platform`` prefixes the backend is offered on, all
+  platforms if empty or missing.
+
+They are read from the plugin's source without importing it, so they must
+be literals assigned in the body of the factory class itself; anything
+else (inherited values, factory functions, compiled modules) gets the
+defaults.
+
+Calling the factory returns the backend. The minimum it needs is the
+original protocol, ``play(sound, data)`` and ``is_available()``; everything
+else in :class:`~beep_lite.backends.Backend` is optional, and ``play`` is
+only passed the keywords its signature accepts. Like the built-in
+factories, the factory should raise :class:`ImportError` if the backend
+cannot work on this host; any error while importing the plugin is treated
+the same way.
+
+A plugin is imported only when its backend is first created, i.e. when it
+is selected. Reading entry points means importing :mod:`importlib.metadata`
+and scanning every installed distribution, which takes tens of
+milliseconds. The result is cached in the user cache directory, keyed by the
+modification times of the ``sys.path`` directories (installing or removing
+a package changes them), so later processes only ``stat`` a few directories.
+``BEEP_LITE_PLUGINS=0`` turns discovery off.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import importlib
+import inspect
+import logging
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import pcm_cache
+from ._version import __version__
+from .backends import Backend
+from .types import Sound
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "beep_lite.backends"
+PLUGINS_ENV = "BEEP_LITE_PLUGINS"
+
+DEFAULT_PRIORITY = 50
+"""Priority of plugins whose factory does not give one."""
+
+# play() keywords each optional capability relies on
+_CAPABILITIES = {
+    "signals_completion": ("done",),
+    "signals_start": ("started",),
+    "checks_staleness": ("enqueued", "limits"),
+}
+_ALL_KEYWORDS = frozenset({"block"}.union(*_CAPABILITIES.values()))
+
+_lock = threading.Lock()
+# Plugins found in this process, sorted by priority; None until discovered
+_discovered: list[PluginInfo] | None = None
+
+
+@dataclass(frozen=True)
+class PluginInfo:
+    """A plugin backend, as declared by its entry point and factory.
+
+    Attributes:
+        name: Candidate name, as shown by the health status.
+        target: The entry point value, ``"module:attribute"``.
+        priority: Position among the candidates; lower is tried first.
+        platforms: ``sys.platform`` prefixes it is offered on, empty for all.
+    """
+
+    name: str
+    target: str
+    priority: int = DEFAULT_PRIORITY
+    platforms: tuple[str, ...] = ()
+
+    def supports(self, platform: str | None = None) -> bool:
+        """Return True if the plugin is offered on ``platform`` (default: this one)."""
+        platform = platform or sys.platform
+        return not self.platforms or platform.startswith(self.platforms)
+
+
+def _resolve(target: str) -> Callable[[], Backend]:
+    """Import the factory an entry point value names.
+
+    Raises:
+        ImportError: If it cannot be imported, for whatever reason.
+    """
+    module_name, _, attribute = target.partition(":")
+    try:
+        factory = importlib.import_module(module_name.strip())
+        for part in attribute.strip().split("."):
+            factory = getattr(factory, part)
+    except ImportError:
+        raise
+    except Exception as e:
+        raise ImportError(f"{target} failed to load: {e}") from e
+    return factory
+
+
+def _source(module_name: str) -> str | None:
+    """Return the source of a module without importing it (or its parents).
+
+    Asks the import system's finders, as :func:`importlib.util.find_spec`
+    does, but walks down the package path itself instead of importing each
+    parent package. Returns None if the module or its source is not found.
+    """
+    path = None
+    spec = None
+    name = ""
+    for part in module_name.split("."):
+        name = f"{name}.{part}" if name else part
+        spec = None
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is not None and (spec := find_spec(name, path)):
+                break
+        if spec is None:
+            return None
+        path = spec.submodule_search_locations
+    get_source = getattr(spec.loader, "get_source", None) if spec else None
+    return get_source(name) if get_source is not None else None
+
+
+def _class_attributes(target: str) -> dict[str, ast.expr]:
+    """Return the values assigned in the body of the class ``target`` names.
+
+    Empty if the class or its source cannot be found or parsed.
+    """
+    module_name, _, attribute = target.partition(":")
+    try:
+        source = _source(module_name.strip())
+        body = ast.parse(source).body if source is not None else []
+    except Exception as e:
+        logger.debug("Cannot read the source of %s: %s", module_name, e)
+        return {}
+    for part in attribute.strip().split("."):
+        classes = [n for n in body if isinstance(n, ast.ClassDef) and n.name == part]
+        if not classes:
+            return {}
+        body = classes[-1].body
+    values: dict[str, ast.expr] = {}
+    for node in body:
+        if isinstance(node, ast.Assign):
+            for name in node.targets:
+                if isinstance(name, ast.Name):
+                    values[name.id] = node.value
+        elif (
+            isinstance(node, ast.AnnAssign)
+            and node.value is not None
+            and isinstance(node.target, ast.Name)
+        ):
+            values[node.target.id] = node.value
+    return values
+
+
+def _inspect(name: str, target: str) -> PluginInfo | None:
+    """Build a :class:`PluginInfo` from an entry point, or None if invalid.
+
+    Reads ``priority`` and ``platforms`` from the source of the factory
+    class without importing the plugin. A plugin whose source cannot be
+    found keeps the defaults and shows up as unavailable if it cannot be
+    imported once it is tried.
+    """
+    name, target = name.strip(), target.strip()
+    if not name or ":" in name or ":" not in target:
+        logger.warning("Ignoring backend plugin %r = %r", name, target)
+        return None
+    values = _class_attributes(target)
+    priority: object = DEFAULT_PRIORITY
+    platforms: object = ()
+    try:
+        if "priority" in values:
+            priority = ast.literal_eval(values["priority"])
+        if "platforms" in values:
+            platforms = ast.literal_eval(values["platforms"])
+    except (ValueError, TypeError, SyntaxError, RecursionError):
+        priority = None
+    if isinstance(platforms, str):
+        platforms = (platforms,)
+    if (
+        not isinstance(priority, int)
+        or isinstance(priority, bool)
+        or not isinstance(platforms, (tuple, list))
+        or not all(isinstance(p, str) for p in platforms)
+    ):
+        logger.warning(
+            "Ignoring backend plugin %s: priority must be an int literal and "
+            "platforms a tuple of string literals",
+            name,
+        )
+        return None
+    return PluginInfo(name, target, priority, tuple(platforms))
+
+
+def _scan() -> list[PluginInfo]:
+    """Read every entry point in the group and inspect its factory's source."""
+    from importlib.metadata import entry_points
+
+    found = entry_points(group=ENTRY_POINT_GROUP)
+    return [info for ep in found if (info := _inspect(ep.name, ep.value))]
+
+
+def _path_key() -> str:
+    """Fingerprint of ``sys.path``; changes when packages are (un)installed."""
+    stamps = []
+    for entry in sys.path:
+        if entry in ("", "."):
+            # The working directory; its mtime changes with every file
+            # written there, and it rarely holds installed distributions.
+            stamps.append(entry)
+            continue
+        try:
+            stamps.append(f"{entry}\0{os.stat(entry or '.').st_mtime_ns}")
+        except OSError:
+            stamps.append(entry)
+    return hashlib.sha256("\n".join(stamps).encode()).hexdigest()
+
+
+def _cache_path() -> Path:
+    return pcm_cache.cache_dir() / __version__ / "plugins.json"
+
+
+def _read_cache(key: str) -> list[PluginInfo] | None:
+    import json
+
+    try:
+        entry = json.loads(_cache_path().read_text(encoding="utf-8"))
+        if entry["key"] != key:
+            return None
+        return [
+            PluginInfo(str(name), str(target), int(priority), tuple(platforms))
+            for name, target, priority, platforms in entry["plugins"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(key: str, found: list[PluginInfo]) -> None:
+    import json
+
+    path = _cache_path()
+    plugins = [[p.name, p.target, p.priority, list(p.platforms)] for p in found]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "plugins": plugins}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.debug("Could not write plugin cache %s: %s", path, e)
+
+
+def discover(refresh: bool = False) -> list[PluginInfo]:
+    """List the installed backend plugins.
+
+    Nothing is imported: metadata comes from the plugins' source.
+
+    Args:
+        refresh: Scan the installed distributions again, ignoring the
+            in-process and on-disk caches.
+
+    Returns:
+        The plugins for all platforms, sorted by priority. Empty if
+        ``BEEP_LITE_PLUGINS=0``.
+    """
+    global _discovered
+    if os.environ.get(PLUGINS_ENV, "1") == "0":
+        return []
+    found = _discovered
+    if found is not None and not refresh:
+        return found
+    with _lock:
+        if _discovered is not None and not refresh:
+            return _discovered
+        use_disk = pcm_cache.disk_cache_enabled()
+        key = _path_key() if use_disk else ""
+        plugins = _read_cache(key) if use_disk and not refresh else None
+        if plugins is None:
+            try:
+                plugins = _scan()
+            except Exception as e:
+                logger.warning("Could not read backend plugins: %s", e)
+                plugins = []
+            if use_disk:
+                _write_cache(key, plugins)
+        _discovered = sorted(plugins, key=lambda info: info.priority)
+        return _discovered
+
+
+class _KeywordFilter:
+    """Passes a plugin's ``play`` only the keywords its signature accepts.
+
+    Optional capabilities whose keywords it does not accept are reported as
+    absent; every other attribute is the plugin's own.
+    """
+
+    def __init__(self, backend: Backend, accepted: frozenset[str]) -> None:
+        self.__dict__["_backend"] = backend
+        self.__dict__["_accepted"] = accepted
+
+    def play(self, sound: Sound, data: bytes, **kwargs: object) -> None:
+        accepted = self._accepted
+        self._backend.play(
+            sound, data, **{k: v for k, v in kwargs.items() if k in accepted}
+        )
+
+    def is_available(self) -> bool:
+        return self._backend.is_available()
+
+    def __getattr__(self, name: str) -> object:
+        keywords = _CAPABILITIES.get(name)
+        if keywords is not None and not self._accepted.issuperset(keywords):
+            return False
+        return getattr(self._backend, name)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        setattr(self._backend, name, value)
+
+
+def _accepted_keywords(play: Callable[..., None]) -> frozenset[str] | None:
+    """Return the keywords ``play`` accepts, or None if it takes any."""
+    try:
+        parameters = inspect.signature(play).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(p.kind is p.VAR_KEYWORD for p in parameters):
+        return None
+    return frozenset(
+        p.name
+        for p in parameters
+        if p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD)
+    )
+
+
+def _load(info: PluginInfo) -> Backend:
+    """Import a plugin and create its backend.
+
+    Backends whose ``play`` does not accept all the keywords beep-lite may
+    pass (``block``, ``done``, ...) are wrapped so that it only gets those
+    it does.
+
+    Raises:
+        ImportError: If the plugin cannot be imported or is not usable here.
+    """
+    try:
+        factory = _resolve(info.target)
+    except ImportError as e:
+        raise ImportError(f"Backend plugin {info.name}: {e}") from e
+    backend = factory()
+    accepted = _accepted_keywords(backend.play)
+    if accepted is None or accepted.issuperset(_ALL_KEYWORDS):
+        return backend
+    logger.debug("Backend plugin %s accepts only %s", info.name, sorted(accepted))
+    return _KeywordFilter(backend, accepted)
+
+
+def factory(info: PluginInfo) -> functools.partial[Backend]:
+    """Return a factory that imports the plugin only when it is called.
+
+    Args:
+        info: The plugin, from :func:`discover`.
+
+    Returns:
+        A zero-argument callable creating the backend.
+    """
+    return functools.partial(_load, info)
@@ -0,0 +1,92 @@
+"""Rate-limited failure reporting.
+
+Playback failures are swallowed by design, but logging every one of them
+floods log pipelines during a device outage (one record per beep, each with
+an eagerly formatted message). All failure paths go through
+:func:`report_failure` instead, which
+
+* counts every failure per ``(source, exception type)``;
+* formats lazily, via logging's ``%s`` arguments;
+* logs at most one record per kind and interval, and adds a
+  "suppressed N similar" note to the next record of that kind.
+
+Example:
+    >>> import beep_lite
+    >>> beep_lite.error_counts()
+    {'simpleaudio:OSError': 412}
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+_interval = 10.0
+_lock = threading.Lock()
+# (source, exception type) -> failure count since the last reset
+_counts: dict[tuple[str, type[BaseException]], int] = {}
+# (source, exception type) -> [time of the last emitted record, suppressed]
+_windows: dict[tuple[str, type[BaseException]], list[float]] = {}
+
+
+def set_log_interval(seconds: float) -> None:
+    """Set how often a failure of the same kind may be logged.
+
+    Args:
+        seconds: Minimum time between two records of one kind. ``0`` logs
+            every failure.
+    """
+    global _interval
+    _interval = max(0.0, seconds)
+
+
+def report_failure(
+    source: str,
+    error: BaseException,
+    logger: logging.Logger,
+    msg: str,
+    *args: object,
+) -> None:
+    """Count a failure and log it unless a similar one was logged recently.
+
+    Args:
+        source: Short name of the failing component (``"api"``, ``"pipe"``).
+        error: The exception that was caught.
+        logger: Logger of the calling module.
+        msg: ``%``-style message, only formatted if actually emitted.
+        *args: Arguments for ``msg``.
+    """
+    key = (source, type(error))
+    now = time.monotonic()
+    with _lock:
+        _counts[key] = _counts.get(key, 0) + 1
+        window = _windows.get(key)
+        if window is not None and now - window[0] < _interval:
+            window[1] += 1
+            return
+        suppressed = int(window[1]) if window is not None else 0
+        _windows[key] = [now, 0]
+    if suppressed:
+        logger.warning(msg + " (suppressed %d similar)", *args, suppressed)
+    else:
+        logger.warning(msg, *args)
+
+
+def error_counts() -> dict[str, int]:
+    """Return how many failures were reported, per kind.
+
+    Returns:
+        Mapping of ``"<source>:<ExceptionType>"`` to failure count since
+        start-up or the last :func:`reset_error_counts`.
+    """
+    with _lock:
+        items = list(_counts.items())
+    return {f"{source}:{exc.__name__}": count for (source, exc), count in items}
+
+
+def reset_error_counts() -> None:
+    """Reset failure counters and rate-limit windows."""
+    with _lock:
+        _counts.clear()
+        _windows.clear()
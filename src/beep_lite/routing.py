@@ -0,0 +1,155 @@
+"""Routing sounds to one of several outputs.
+
+Example:
+    >>> from beep_lite import Router, Sound, devices
+    >>> router = Router(
+    ...     {
+    ...         "line1": devices.open_device("hw:CARD=Station1,DEV=0"),
+    ...         "line2": devices.open_device("hw:CARD=Station2,DEV=0"),
+    ...         "hall": devices.open_device("hw:CARD=Siren,DEV=0"),
+    ...     }
+    ... )
+    >>> router.route_station("station-1", "line1")
+    >>> router.route_station("station-2", "line2")
+    >>> router.route_sound(Sound.CRIT, "hall")
+    >>> router.play(Sound.SCAN_OK, station="station-1")   # line1
+    >>> router.play(Sound.CRIT, station="station-2")      # hall
+
+A sound is played on the output of its station rule if there is one, then
+on that of its sound rule, then on the default output. Every output is an
+independent :class:`~beep_lite.core.Beeper`, so one that is slow or broken
+does not hold up the others.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Hashable, Mapping
+
+from .core import Beeper, default_beeper
+from .types import Sound
+
+
+class Router:
+    """Plays each sound on the output chosen by station and sound rules."""
+
+    def __init__(
+        self, outputs: Mapping[str, Beeper], default: str | None = None
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            outputs: Beepers by output name, e.g. one per
+                :func:`beep_lite.devices.open_device`.
+            default: Output for sounds no rule matches. By default they are
+                played on the default beeper, like ``beep_lite.play()``.
+
+        Raises:
+            KeyError: If ``default`` is not one of ``outputs``.
+        """
+        self._outputs = dict(outputs)
+        if default is not None and default not in self._outputs:
+            raise KeyError(f"Unknown output: {default!r}")
+        self._default = default
+        self._lock = threading.Lock()
+        self._by_station: dict[Hashable, str] = {}
+        self._by_sound: dict[Sound, str] = {}
+
+    @property
+    def outputs(self) -> dict[str, Beeper]:
+        """The outputs by name."""
+        return dict(self._outputs)
+
+    def _check(self, output: str | None) -> None:
+        if output is not None and output not in self._outputs:
+            raise KeyError(f"Unknown output: {output!r}")
+
+    def route_station(self, station: Hashable, output: str | None) -> None:
+        """Send every sound of ``station`` to ``output`` (None: remove the rule).
+
+        Args:
+            station: Any key the caller passes as ``station`` to :meth:`play`.
+            output: Name of the output.
+
+        Raises:
+            KeyError: If ``output`` is not one of the outputs.
+        """
+        self._check(output)
+        with self._lock:
+            if output is None:
+                self._by_station.pop(station, None)
+            else:
+                self._by_station[station] = output
+
+    def route_sound(self, sound: Sound, output: str | None) -> None:
+        """Send ``sound`` to ``output`` unless a station rule applies.
+
+        Args:
+            sound: The sound to route.
+            output: Name of the output, or None to remove the rule.
+
+        Raises:
+            KeyError: If ``output`` is not one of the outputs.
+        """
+        self._check(output)
+        with self._lock:
+            if output is None:
+                self._by_sound.pop(sound, None)
+            else:
+                self._by_sound[sound] = output
+
+    def resolve(self, sound: Sound, station: Hashable | None = None) -> Beeper:
+        """Return the beeper that :meth:`play` would use.
+
+        Args:
+            sound: The sound to play.
+            station: The caller's station key, if any.
+
+        Returns:
+            The beeper of the matching output.
+        """
+        name = None
+        if station is not None:
+            name = self._by_station.get(station)
+        if name is None:
+            name = self._by_sound.get(sound, self._default)
+        return default_beeper() if name is None else self._outputs[name]
+
+    def play(
+        self,
+        sound: Sound,
+        station: Hashable | None = None,
+        *,
+        block: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Play a sound on its routed output; never raises.
+
+        Args:
+            sound: The sound to play.
+            station: The caller's station key, matched against station rules.
+            block: If True, return once the sound has finished playing.
+            timeout: With ``block``, the longest time to wait.
+        """
+        self.resolve(sound, station).play(sound, block=block, timeout=timeout)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until every sound started on any output has finished playing.
+
+        Args:
+            timeout: Longest total time to wait, in seconds.
+
+        Returns:
+            True if all sounds finished, False if the timeout expired first.
+        """
+        deadline = time.monotonic() + timeout
+        return all(
+            beeper.flush(max(0.0, deadline - time.monotonic()))
+            for beeper in self._outputs.values()
+        )
+
+    def close(self) -> None:
+        """Close every output's backend (player processes, threads)."""
+        for beeper in self._outputs.values():
+            beeper.close()
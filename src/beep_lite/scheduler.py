@@ -0,0 +1,232 @@
+"""Heap-based timer running scheduled sounds on a single thread.
+
+A ``threading.Timer`` per delayed beep costs a thread each. :class:`Scheduler`
+keeps all pending calls in one heap ordered by due time (``time.monotonic``)
+and runs them from one daemon thread, so thousands of pending sounds cost one
+thread and ``O(log n)`` per insert. Cancellation is ``O(1)``: cancelled
+entries are skipped when they reach the top of the heap.
+
+Backends set the completion of every non-blocking sound from here, so new
+calls do not take the scheduler's lock: each thread appends to an inbox of
+its own, which the worker moves into the heap. The lock is only taken to wake
+the worker, when a call is due before the time it is waiting for.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from .reporting import report_failure
+
+logger = logging.getLogger(__name__)
+
+_PENDING = 0
+_DONE = 1
+_CANCELLED = 2
+
+# New calls are appended to one of this many inboxes, each thread using its
+# own, so threads scheduling concurrently do not contend on one lock.
+_INBOXES = 16
+_thread_slot = threading.local()
+_next_slot = itertools.count()
+
+
+def _inbox_index() -> int:
+    """Return the calling thread's inbox, assigned round-robin."""
+    try:
+        return _thread_slot.index
+    except AttributeError:
+        # A rare duplicate from a racing next() only makes two threads share.
+        index = _thread_slot.index = next(_next_slot) % _INBOXES
+        return index
+
+
+class ScheduledCall:
+    """Handle for a call queued on a :class:`Scheduler`.
+
+    Attributes:
+        when: Due time on the ``time.monotonic()`` clock.
+    """
+
+    __slots__ = ("when", "_callback", "_state", "_scheduler")
+
+    def __init__(
+        self, when: float, callback: Callable[[], None], scheduler: Scheduler
+    ) -> None:
+        self.when = when
+        self._callback = callback
+        self._state = _PENDING
+        self._scheduler = scheduler
+
+    @property
+    def pending(self) -> bool:
+        """True until the call has run or been cancelled."""
+        return self._state == _PENDING
+
+    @property
+    def cancelled(self) -> bool:
+        """True if :meth:`cancel` stopped the call before it ran."""
+        return self._state == _CANCELLED
+
+    def cancel(self) -> bool:
+        """Cancel the call if it has not run yet.
+
+        Returns:
+            True if the call was pending and will now never run.
+        """
+        return self._scheduler._cancel(self)
+
+
+class Scheduler:
+    """Runs callbacks at monotonic timestamps from one lazily started thread."""
+
+    def __init__(self, name: str = "beep-lite-scheduler") -> None:
+        """Initialize an idle scheduler.
+
+        Args:
+            name: Name of the worker thread.
+        """
+        self._name = name
+        self._heap: list[tuple[float, int, ScheduledCall]] = []
+        self._inboxes: tuple[deque[ScheduledCall], ...] = tuple(
+            deque() for _ in range(_INBOXES)
+        )
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._thread: threading.Thread | None = None
+        # When the worker wakes up next: inf while any new call must wake it,
+        # -inf while it runs a callback and will look at new calls anyway.
+        self._wake = math.inf
+
+    def __len__(self) -> int:
+        """Number of pending (not cancelled, not yet run) calls."""
+        with self._cond:
+            self._collect()
+            return len(self._heap) - self._cancelled
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> ScheduledCall:
+        """Run ``callback`` at ``when`` (``time.monotonic()`` clock).
+
+        Times in the past run as soon as possible. Callbacks run on the
+        scheduler thread and should be quick; exceptions are reported and
+        swallowed.
+
+        Args:
+            when: Due time in seconds on the monotonic clock.
+            callback: Zero-argument callable.
+
+        Returns:
+            A handle that can cancel the call.
+        """
+        call = ScheduledCall(when, callback, self)
+        self._inboxes[_inbox_index()].append(call)
+        # Appended before reading _wake, so a worker that has not collected
+        # the call yet either wakes before ``when`` or is woken here.
+        if when < self._wake:
+            with self._cond:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name=self._name, daemon=True
+                    )
+                    self._thread.start()
+                else:
+                    self._cond.notify()
+        return call
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> ScheduledCall:
+        """Run ``callback`` after ``delay`` seconds.
+
+        Args:
+            delay: Seconds from now.
+            callback: Zero-argument callable.
+
+        Returns:
+            A handle that can cancel the call.
+        """
+        return self.call_at(time.monotonic() + delay, callback)
+
+    def _collect(self) -> None:
+        """Move new calls from the inboxes into the heap; needs the lock."""
+        heap = self._heap
+        for inbox in self._inboxes:
+            while inbox:
+                call = inbox.popleft()
+                heapq.heappush(heap, (call.when, next(self._counter), call))
+
+    def _cancel(self, call: ScheduledCall) -> bool:
+        with self._cond:
+            self._collect()
+            if call._state != _PENDING:
+                return False
+            call._state = _CANCELLED
+            self._cancelled += 1
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+                # Mostly tombstones: rebuild so memory does not grow unbounded.
+                self._heap = [e for e in self._heap if e[2]._state == _PENDING]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+            return True
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                self._wake = math.inf
+                self._collect()
+                heap = self._heap
+                while heap and heap[0][2]._state == _CANCELLED:
+                    heapq.heappop(heap)
+                    self._cancelled -= 1
+                if not heap:
+                    self._cond.wait()
+                    continue
+                when, _, call = heap[0]
+                delay = when - time.monotonic()
+                if delay > 0:
+                    # Calls added since _collect() saw _wake as inf and are
+                    # waiting for the lock to wake this thread.
+                    self._wake = when
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(heap)
+                call._state = _DONE
+                self._wake = -math.inf
+                self._cond.release()
+                try:
+                    call._callback()
+                except Exception as e:
+                    report_failure(
+                        "scheduler", e, logger, "Scheduled call failed: %s", e
+                    )
+                finally:
+                    self._cond.acquire()
+
+    def cancel_all(self) -> None:
+        """Cancel every pending call."""
+        with self._cond:
+            self._collect()
+            for _, _, call in self._heap:
+                call._state = _CANCELLED
+            self._heap.clear()
+            self._cancelled = 0
+
+
+_default: Scheduler | None = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Return the process-wide scheduler shared by ``play_at`` and friends."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = Scheduler()
+    return _default
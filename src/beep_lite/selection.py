@@ -0,0 +1,242 @@
+"""Backend selection by measured output latency.
+
+By default the first backend that can be created is used, in a fixed order
+(see :func:`beep_lite.core._backend_candidates`). That order is not always
+the fastest on a given host: a PipeWire desktop may start sounds sooner
+through ``pw-play`` than through simpleaudio's ALSA device, for example.
+
+Latency selection plays a few milliseconds of silence through each available
+backend, ranks them by how long a sound takes from ``play()`` until the
+backend reports that the device is playing it (its ``started`` signal, see
+:class:`~beep_lite.backends.Backend`), and caches the measurements in the
+user cache directory. Later
+starts reuse the ranking without probing:
+
+    >>> import beep_lite
+    >>> beep_lite.warmup(select_fastest=True)
+
+``BEEP_LITE_BACKEND_SELECTION=latency`` turns it on for warm-ups that do not
+ask for it, and makes every beeper use a cached ranking even without
+warm-up. Backends that fail the probe, or cannot report when a sound starts,
+are ranked after the measured ones, and the last candidate (the terminal
+bell) is never probed and always stays last.
+``BEEP_LITE_DISK_CACHE=0`` disables the cache, so each warm-up probes again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import pcm_cache
+from ._version import __version__
+from .backends import ProbeListener, close_backend
+from .health import BackendFactory
+from .pcm import PcmFormat, silent_wav
+from .types import Sound
+
+logger = logging.getLogger(__name__)
+
+SELECTION_ENV = "BEEP_LITE_BACKEND_SELECTION"
+"""Environment variable choosing the selection mode: ``order`` or ``latency``."""
+
+_PROBE_FORMAT = PcmFormat(rate=16000, channels=1, width=2)
+_PROBE_SECONDS = 0.01
+# Plays per backend after priming; the median is its latency.
+_PROBE_ROUNDS = 5
+# Longest wait for one probe play before the backend counts as failed.
+_PROBE_TIMEOUT = 1.0
+
+Candidates = Sequence[tuple[str, BackendFactory]]
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Measured latency of one candidate backend.
+
+    Attributes:
+        name: Candidate name (``"simpleaudio"``, ``"pipe"``, ...).
+        latency: Median seconds from ``play()`` until the sound is playing,
+            or None if the backend is unavailable, failed the probe or
+            cannot report when a sound starts.
+    """
+
+    name: str
+    latency: float | None
+
+
+def enabled() -> bool:
+    """Return True if ``BEEP_LITE_BACKEND_SELECTION`` asks for latency."""
+    return os.environ.get(SELECTION_ENV, "order").strip().lower() == "latency"
+
+
+def _cache_path(candidates: Candidates) -> Path:
+    names = "\0".join(name for name, _ in candidates)
+    digest = hashlib.sha256(names.encode()).hexdigest()[:16]
+    return pcm_cache.cache_dir() / __version__ / "selection" / f"{digest}.json"
+
+
+def _read_cache(candidates: Candidates) -> list[Measurement] | None:
+    if not pcm_cache.disk_cache_enabled():
+        return None
+    # Imported here: json is only needed once, when the backend is created.
+    import json
+
+    try:
+        entry = json.loads(_cache_path(candidates).read_text(encoding="utf-8"))
+        if entry["candidates"] != [name for name, _ in candidates]:
+            return None
+        return [Measurement(name, latency) for name, latency in entry["measured"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(candidates: Candidates, measured: list[Measurement]) -> None:
+    if not pcm_cache.disk_cache_enabled():
+        return
+    import json
+
+    path = _cache_path(candidates)
+    entry = {
+        "candidates": [name for name, _ in candidates],
+        "measured": [[m.name, m.latency] for m in measured],
+        "time": time.time(),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.debug("Could not write backend selection %s: %s", path, e)
+
+
+class _Started(threading.Event):
+    """Start signal that records when the backend set it."""
+
+    at = 0.0
+
+    def set(self) -> None:
+        self.at = time.perf_counter()
+        super().set()
+
+
+def _measure(name: str, factory: BackendFactory) -> float | None:
+    """Return the median start latency of one backend, or None if it fails."""
+    try:
+        backend = factory()
+    except Exception as e:
+        logger.debug("%s backend not available: %s", name, e)
+        return None
+    if getattr(backend, "signals_start", False) is not True:
+        logger.debug("%s backend cannot report when sounds start", name)
+        close_backend(backend)
+        return None
+    probe = ProbeListener()
+    if hasattr(backend, "listener"):
+        backend.listener = probe  # type: ignore[attr-defined]
+    data = silent_wav(_PROBE_FORMAT, _PROBE_SECONDS)
+    signals_completion = getattr(backend, "signals_completion", False) is True
+    samples: list[float] = []
+    try:
+        prime = getattr(backend, "prime", None)
+        if prime is not None:
+            prime()
+        for _ in range(_PROBE_ROUNDS):
+            started = _Started()
+            done = threading.Event() if signals_completion else None
+            start = time.perf_counter()
+            backend.play(  # type: ignore[call-arg]
+                Sound.OK, data, started=started, done=done
+            )
+            if not started.wait(_PROBE_TIMEOUT):
+                raise TimeoutError("probe sound did not start")
+            # Let it finish, so the next round does not queue behind it.
+            if done is not None and not done.wait(_PROBE_TIMEOUT):
+                raise TimeoutError("probe sound did not finish")
+            if probe.error is not None:
+                raise probe.error
+            samples.append(started.at - start)
+    except Exception as e:
+        logger.debug("Latency probe of %s backend failed: %s", name, e)
+        return None
+    finally:
+        close_backend(backend)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def measure(candidates: Candidates) -> list[Measurement]:
+    """Probe every candidate but the last resort, one after another.
+
+    Each backend is created, primed, plays ``_PROBE_ROUNDS`` short silent
+    sounds and is closed again. Takes well under a second per backend.
+
+    Args:
+        candidates: ``(name, factory)`` pairs in priority order.
+
+    Returns:
+        One measurement per probed candidate, in the given order.
+    """
+    measured = [Measurement(name, _measure(name, f)) for name, f in candidates[:-1]]
+    for m in measured:
+        if m.latency is not None:
+            logger.debug("%s backend latency: %.1f ms", m.name, m.latency * 1000)
+    return measured
+
+
+def rank(
+    candidates: Candidates, *, probe: bool = True, refresh: bool = False
+) -> list[tuple[str, BackendFactory]]:
+    """Order candidates by measured latency, fastest first.
+
+    Uses the cached measurements for this candidate list if there are any.
+    Otherwise, and with ``refresh``, measures them (if ``probe`` is set) and
+    caches the result.
+
+    Args:
+        candidates: ``(name, factory)`` pairs in priority order. The last one
+            is the last resort and stays last.
+        probe: Measure if nothing is cached. If False, an uncached list is
+            returned unchanged.
+        refresh: Ignore the cache and measure again.
+
+    Returns:
+        The same pairs, healthy backends by ascending latency first, then the
+        others in their original order.
+    """
+    if len(candidates) < 2:
+        return list(candidates)
+    measured = None if refresh else _read_cache(candidates)
+    if measured is None:
+        if not probe:
+            return list(candidates)
+        measured = measure(candidates)
+        _write_cache(candidates, measured)
+    latency = {m.name: m.latency for m in measured}
+    order = {name: i for i, (name, _) in enumerate(candidates)}
+
+    def key(candidate: tuple[str, BackendFactory]) -> tuple[int, float, int]:
+        name = candidate[0]
+        if candidate is candidates[-1]:
+            return (2, 0.0, 0)
+        value = latency.get(name)
+        if value is None:
+            return (1, 0.0, order[name])
+        return (0, value, order[name])
+
+    ranked = sorted(candidates, key=key)
+    logger.debug("Backend ranking: %s", [name for name, _ in ranked])
+    return ranked
@@ -0,0 +1,112 @@
+"""Deadline-based dropping of stale play requests.
+
+Under load a ``SCAN_OK`` that plays 800 ms late is worse than none: the
+operator links it to the wrong item. Every play request carries the
+``time.monotonic()`` time it was made (for scheduled sounds: the time it was
+due). A sound can be given a maximum age with :func:`set_max_age`; requests
+older than that when they are dispatched are dropped before any decoding or
+device work, and counted. Backends that queue sounds (simpleaudio, the pipe
+players) check the age again when a sound leaves their queue.
+
+Example:
+    >>> import beep_lite
+    >>> from beep_lite import Sound
+    >>> beep_lite.set_max_age(Sound.SCAN_OK, 0.3)
+    >>> beep_lite.dropped_counts()
+    {'scan_ok': 2}
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Mapping
+
+from .types import Sound
+
+_lock = threading.Lock()
+# sound -> maximum age in seconds (absent: never stale)
+_max_age: dict[Sound, float] = {}
+# sound -> number of dropped requests since the last reset
+_drops: dict[Sound, int] = {}
+
+
+def set_max_age(sound: Sound, seconds: float | None) -> None:
+    """Set how old a request for ``sound`` may be when it is dispatched.
+
+    Args:
+        sound: The sound to configure.
+        seconds: Maximum age in seconds, or None to never drop the sound.
+    """
+    with _lock:
+        if seconds is None:
+            _max_age.pop(sound, None)
+        else:
+            _max_age[sound] = max(0.0, seconds)
+
+
+def max_age(sound: Sound) -> float | None:
+    """Return the maximum age configured for ``sound``, or None."""
+    return _max_age.get(sound)
+
+
+def is_stale(
+    sound: Sound,
+    enqueued: float,
+    now: float | None = None,
+    limits: Mapping[Sound, float | None] | None = None,
+) -> bool:
+    """Check a request against its maximum age and count it if it is stale.
+
+    Args:
+        sound: The requested sound.
+        enqueued: When the request was made, on the ``time.monotonic()`` clock.
+        now: Dispatch time, defaults to ``time.monotonic()``.
+        limits: Per-sound overrides of the maximum ages set with
+            :func:`set_max_age` (a None value: never stale).
+
+    Returns:
+        True if the request should be dropped.
+    """
+    if limits is not None and sound in limits:
+        limit = limits[sound]
+    else:
+        limit = _max_age.get(sound)
+    if limit is None:
+        return False
+    if now is None:
+        now = time.monotonic()
+    if now - enqueued <= limit:
+        return False
+    count_drop(sound)
+    return True
+
+
+def count_drop(sound: Sound) -> None:
+    """Count a request for ``sound`` that was dropped without playing.
+
+    Used for stale requests and by backends shedding a backlog they cannot
+    play in time. Files played whole (:data:`beep_lite.stream.FILE`) are not
+    sounds and are not counted.
+    """
+    if not isinstance(sound, Sound):
+        return
+    with _lock:
+        _drops[sound] = _drops.get(sound, 0) + 1
+
+
+def dropped_counts() -> dict[str, int]:
+    """Return how many stale or shed requests were dropped, per sound name.
+
+    Returns:
+        Mapping of ``Sound.value`` to drop count since start-up or the last
+        :func:`reset_dropped_counts`.
+    """
+    with _lock:
+        return {sound.value: count for sound, count in _drops.items()}
+
+
+def reset_dropped_counts() -> None:
+    """Reset the drop counters."""
+    with _lock:
+        _drops.clear()
@@ -0,0 +1,230 @@
+"""Streaming playback of long WAV files in constant memory.
+
+The bundled sounds are a few kilobytes and are loaded, decoded and cached
+whole. A 30-second spoken announcement is megabytes, and a process keeping
+a few of them decoded would hold all of that for the odd time one is
+played. :func:`open_stream` reads such files chunk by chunk instead:
+
+    >>> import beep_lite
+    >>> beep_lite.play_file("announcements/line-stop.wav")
+
+While a backend writes one chunk to the device, a reader thread already
+reads (and converts) the next one, so at most a few chunks are in memory at
+any time, however long the file. Files up to :data:`STREAM_THRESHOLD` bytes
+take the cached path of the bundled sounds instead: they are read once and
+decoded through :mod:`beep_lite.pcm_cache`, and backends that cannot stream
+play them like a sound.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import wave
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from .pcm import Pcm, PcmFormat, convert
+from .pcm_cache import load_pcm
+
+logger = logging.getLogger(__name__)
+
+STREAM_THRESHOLD = 256 * 1024
+"""Files larger than this many bytes are streamed instead of cached."""
+
+# Audio per chunk read from a streamed file.
+_CHUNK_SECONDS = 0.25
+# Small files kept in memory at most; the cache is emptied when exceeded.
+_MAX_CACHED_FILES = 64
+
+_lock = threading.Lock()
+# resolved path -> (mtime_ns, size, WAV data) of small files
+_files: dict[str, tuple[int, int, bytes]] = {}
+
+
+class StreamingUnsupported(RuntimeError):
+    """Raised when a file is too large to play whole and the backend cannot stream."""
+
+
+@dataclass(frozen=True)
+class FileLabel:
+    """Stands in for a :class:`~beep_lite.types.Sound` when a file is played whole.
+
+    Backends that cannot stream are given small files through ``play()``,
+    which takes a sound. They only use it for log messages and as a cache
+    key. The label has no maximum age, drop count or route, and all files
+    share :data:`FILE`, so a per-sound cache holds at most one file.
+
+    Attributes:
+        value: Name shown in log messages.
+    """
+
+    value: str = "file"
+
+
+FILE = FileLabel()
+"""The label of every file played through a backend's ``play()``."""
+
+
+@dataclass(frozen=True)
+class PcmStream:
+    """Audio of a WAV file, produced chunk by chunk when iterated.
+
+    Each iteration starts from the beginning of the file again.
+
+    Attributes:
+        path: The WAV file.
+        format: Sample layout of the chunks.
+        frames: Total number of frames.
+        data: The whole WAV file for small files (the cached path), else None.
+    """
+
+    path: Path
+    format: PcmFormat
+    frames: int
+    data: bytes | None
+    _chunks: Callable[[], Iterator[bytes | memoryview]]
+
+    @property
+    def duration(self) -> float:
+        """Playback time in seconds."""
+        return self.frames / self.format.rate
+
+    def __iter__(self) -> Iterator[bytes | memoryview]:
+        """Yield the frames in chunks, reading ahead on a helper thread."""
+        if self.data is not None:
+            return self._chunks()
+        return _prefetch(self._chunks())
+
+    def to(self, fmt: PcmFormat | None) -> PcmStream:
+        """Return the same audio converted to ``fmt`` (None: unchanged).
+
+        Small files are converted once through the PCM cache. Streamed files
+        are converted chunk by chunk while reading; resampling each chunk on
+        its own is accurate to within a sample at the chunk boundaries.
+        """
+        src = self.format
+        if fmt is None or fmt == src:
+            return self
+        frames = max(1, round(self.frames * fmt.rate / src.rate))
+        if self.data is not None:
+            pcm = load_pcm(self.data, fmt)
+            return PcmStream(
+                self.path, fmt, frames, self.data, lambda: iter((pcm.frames,))
+            )
+        chunks = self._chunks
+
+        def converted() -> Iterator[bytes | memoryview]:
+            for chunk in chunks():
+                yield convert(Pcm(format=src, frames=chunk), fmt).frames
+
+        return PcmStream(self.path, fmt, frames, None, converted)
+
+
+def _read_small(path: Path, stat: os.stat_result) -> bytes:
+    key = str(path)
+    cached = _files.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    data = path.read_bytes()
+    with _lock:
+        if len(_files) >= _MAX_CACHED_FILES:
+            _files.clear()
+        _files[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+def open_stream(
+    path: str | os.PathLike[str], *, chunk_seconds: float = _CHUNK_SECONDS
+) -> PcmStream:
+    """Open a WAV file for playback, reading only its header now.
+
+    Args:
+        path: The WAV file.
+        chunk_seconds: Audio per chunk when the file is streamed.
+
+    Returns:
+        The stream; iterate it (or hand it to ``Beeper.play_file``) to read
+        the audio.
+
+    Raises:
+        OSError: If the file cannot be read.
+        wave.Error: If it is not a supported WAV file.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    if stat.st_size <= STREAM_THRESHOLD:
+        data = _read_small(path, stat)
+        pcm = load_pcm(data)
+        frames = len(pcm.frames) // pcm.format.frame_size
+        return PcmStream(path, pcm.format, frames, data, lambda: iter((pcm.frames,)))
+
+    with wave.open(str(path), "rb") as reader:
+        fmt = PcmFormat(
+            rate=reader.getframerate(),
+            channels=reader.getnchannels(),
+            width=reader.getsampwidth(),
+        )
+        frames = reader.getnframes()
+    chunk_frames = max(1, int(fmt.rate * chunk_seconds))
+
+    def chunks() -> Iterator[bytes]:
+        with wave.open(str(path), "rb") as reader:
+            while True:
+                chunk = reader.readframes(chunk_frames)
+                if not chunk:
+                    return
+                yield chunk
+
+    return PcmStream(path, fmt, frames, None, chunks)
+
+
+_END = object()
+
+
+def _prefetch(chunks: Iterator[bytes | memoryview]) -> Iterator[bytes | memoryview]:
+    """Read the next chunk on a helper thread while the caller uses this one.
+
+    At most one chunk waits in the hand-over slot, so memory stays at a few
+    chunks. If the caller stops early, the reader stops too and the file is
+    closed.
+    """
+    slot: queue.Queue[object] = queue.Queue(maxsize=1)
+    stop = threading.Event()
+
+    def hand_over(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                slot.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read() -> None:
+        try:
+            for chunk in chunks:
+                if not hand_over(chunk):
+                    return
+            hand_over(_END)
+        except BaseException as e:
+            hand_over(e)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    threading.Thread(target=read, name="beep-lite-stream-reader", daemon=True).start()
+    try:
+        while True:
+            item = slot.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item  # type: ignore[misc]
+    finally:
+        stop.set()
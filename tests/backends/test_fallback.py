@@ -1,5 +1,8 @@
 """Tests for fallback backend."""
 
+import sys
+import threading
+import time
 from io import StringIO
 from unittest.mock import patch
 
@@ -7,6 +10,26 @@ from beep_lite.backends.fallback_backend import FallbackBackend
 from beep_lite.types import Sound
 
 
+class _Terminal(StringIO):
+    """StringIO that claims to be a terminal."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+class _StalledTerminal(_Terminal):
+    """Terminal whose flush blocks until released, like a stalled pipe."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushing = threading.Event()
+        self.release = threading.Event()
+
+    def flush(self) -> None:
+        self.flushing.set()
+        self.release.wait(5)
+
+
 class TestFallbackBackend:
     """Test FallbackBackend."""
 
@@ -16,21 +39,87 @@ class TestFallbackBackend:
         assert backend.is_available() is True
 
     def test_fallback_backend_outputs_bell_character(self) -> None:
-        """FallbackBackend.play should output bell character."""
+        """FallbackBackend.play should output bell character to a terminal."""
         backend = FallbackBackend()
 
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            backend.play(Sound.OK, b"ignored")
+        with patch("sys.stderr", new_callable=_Terminal) as mock_stderr:
+            backend.play(Sound.OK, b"ignored", block=True)
             assert mock_stderr.getvalue() == "\a"
+        backend.close()
+
+    def test_fallback_backend_sets_done_without_waiting_for_write(self) -> None:
+        """A stalled stderr should not hold up the caller or done."""
+        backend = FallbackBackend()
+        stderr = _StalledTerminal()
+        done = threading.Event()
+
+        with patch("sys.stderr", stderr):
+            backend.play(Sound.OK, b"ignored")
+            assert stderr.flushing.wait(1)
+            backend.play(Sound.OK, b"ignored", done=done)
+            assert done.is_set()
+            stderr.release.set()
+            backend.close()
+
+    def test_fallback_backend_coalesces_bursts(self) -> None:
+        """Bells requested while one is being written should merge into one."""
+        backend = FallbackBackend()
+        stderr = _StalledTerminal()
+
+        with patch("sys.stderr", stderr):
+            backend.play(Sound.OK, b"ignored")
+            assert stderr.flushing.wait(1)
+            for _ in range(50):
+                backend.play(Sound.OK, b"ignored")
+            stderr.release.set()
+            backend.play(Sound.OK, b"ignored", block=True)
+            backend.close()
+
+        assert stderr.getvalue() == "\a\a"
+
+    def test_fallback_backend_skips_non_terminal_stderr(self) -> None:
+        """Nothing should be written, and no thread started, for a pipe."""
+        backend = FallbackBackend()
+        done = threading.Event()
+
+        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
+            backend.play(Sound.OK, b"ignored", block=True, done=done)
+            assert mock_stderr.getvalue() == ""
+
+        assert done.is_set()
+        assert backend._thread is None
+
+    def test_fallback_backend_handles_missing_stderr(self) -> None:
+        """sys.stderr is None under pythonw; play should just do nothing."""
+        backend = FallbackBackend()
+
+        with patch.object(sys, "stderr", None):
+            backend.play(Sound.OK, b"ignored", block=True)
+
+        assert backend._thread is None
 
     def test_fallback_backend_does_not_raise_on_error(self) -> None:
-        """FallbackBackend.play should not raise on errors."""
+        """Write errors should be reported to the listener, not raised."""
         backend = FallbackBackend()
+        failures = []
+
+        class Listener:
+            def playback_succeeded(self) -> None:
+                pass
+
+            def playback_failed(self, error: BaseException) -> None:
+                failures.append(error)
 
-        # Mock stderr to raise an exception
-        with patch("sys.stderr.write", side_effect=Exception("Test error")):
-            # Should not raise
-            backend.play(Sound.OK, b"data")
+        backend.listener = Listener()
+        stderr = _Terminal()
+        with (
+            patch("sys.stderr", stderr),
+            patch.object(stderr, "write", side_effect=Exception("Test error")),
+        ):
+            backend.play(Sound.OK, b"data", block=True)
+        backend.close()
+
+        assert [str(e) for e in failures] == ["Test error"]
 
     def test_fallback_backend_ignores_sound_type(self) -> None:
         """FallbackBackend should produce same output for all sound types."""
@@ -38,9 +127,22 @@ class TestFallbackBackend:
 
         outputs = []
         for sound in Sound:
-            with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-                backend.play(sound, b"data")
+            with patch("sys.stderr", new_callable=_Terminal) as mock_stderr:
+                backend.play(sound, b"data", block=True)
                 outputs.append(mock_stderr.getvalue())
+        backend.close()
 
         # All outputs should be the same (bell character)
         assert all(output == "\a" for output in outputs)
+
+    def test_fallback_backend_restarts_after_close(self) -> None:
+        """Playing after close should start a new writer thread."""
+        backend = FallbackBackend()
+
+        with patch("sys.stderr", new_callable=_Terminal) as mock_stderr:
+            backend.play(Sound.OK, b"ignored", block=True)
+            backend.close()
+            backend.play(Sound.OK, b"ignored", block=True)
+            time.sleep(0.2)  # room for a stray bell after the requested one
+            backend.close()
+            assert mock_stderr.getvalue() == "\a\a"
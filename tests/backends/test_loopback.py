@@ -0,0 +1,92 @@
+"""Tests for the loopback (virtual device with onset capture) backend."""
+
+import threading
+import time
+
+from beep_lite.backends.loopback_backend import LoopbackBackend, first_audible_frame
+from beep_lite.loader import load_wav
+from beep_lite.pcm import Pcm, PcmFormat, silent_wav
+from beep_lite.types import Sound
+
+
+class TestFirstAudibleFrame:
+    """Test onset detection."""
+
+    def test_skips_leading_silence(self) -> None:
+        """The first frame with a non-zero sample should be found."""
+        fmt = PcmFormat(rate=8000, channels=2, width=2)
+        frames = b"\x00\x00" * 2 * 40 + b"\x00\x00\x10\x00" + b"\x00\x00" * 6
+        assert first_audible_frame(Pcm(fmt, frames)) == 40
+
+    def test_threshold_and_silence(self) -> None:
+        """Quiet samples below the threshold and silent audio should not count."""
+        fmt = PcmFormat(rate=8000, channels=1, width=2)
+        quiet = (100).to_bytes(2, "little", signed=True)
+        loud = (-20000).to_bytes(2, "little", signed=True)
+        pcm = Pcm(fmt, quiet * 10 + loud)
+        assert first_audible_frame(pcm) == 0
+        assert first_audible_frame(pcm, threshold=0.1) == 10
+        assert first_audible_frame(Pcm(fmt, b"\x00\x00" * 100)) is None
+
+    def test_unsigned_8_bit_silence(self) -> None:
+        """8-bit audio is silent at 0x80, not 0x00."""
+        fmt = PcmFormat(rate=8000, channels=1, width=1)
+        assert first_audible_frame(Pcm(fmt, b"\x80" * 5 + b"\xff")) == 5
+
+
+class TestLoopbackBackend:
+    """Test LoopbackBackend."""
+
+    def test_reports_onset_to_the_calling_thread(self) -> None:
+        """Every audible sound should be reported with its caller and times."""
+        heard = []
+        audible = threading.Event()
+
+        def on_audible(onset) -> None:  # noqa: ANN001
+            heard.append(onset)
+            audible.set()
+
+        backend = LoopbackBackend(latency=0.02, on_audible=on_audible)
+        done = threading.Event()
+        start = time.monotonic()
+        try:
+            backend.play(Sound.SCAN_OK, load_wav(Sound.SCAN_OK), done=done)
+            assert audible.wait(2.0)
+            assert done.wait(2.0)
+        finally:
+            backend.close()
+
+        (onset,) = heard
+        assert list(backend.onsets) == [onset]
+        assert onset.sound is Sound.SCAN_OK
+        assert onset.caller == threading.get_ident()
+        assert start <= onset.accepted
+        assert onset.audible >= onset.accepted + 0.02
+
+    def test_silent_sounds_are_not_audible(self) -> None:
+        """A silent sound should finish without an onset."""
+        backend = LoopbackBackend()
+        data = silent_wav(PcmFormat(rate=8000, channels=1, width=2), 0.01)
+        try:
+            backend.play(Sound.OK, data, block=True)
+        finally:
+            backend.close()
+        assert not backend.onsets
+
+    def test_close_releases_waiting_sounds(self) -> None:
+        """Sounds the device never took should still signal completion."""
+        backend = LoopbackBackend()
+        backend._thread = threading.current_thread()  # keep the device idle
+        done = threading.Event()
+        backend._queue.put(None)  # close() came first
+        backend.play(Sound.OK, load_wav(Sound.OK), done=done)
+        backend._run()
+        assert done.is_set()
+
+    def test_invalid_data_sets_done_without_raising(self) -> None:
+        """Undecodable data should be reported, not raised."""
+        backend = LoopbackBackend()
+        done = threading.Event()
+        backend.play(Sound.OK, b"invalid wav data", done=done)
+        assert done.is_set()
+        backend.close()
@@ -0,0 +1,54 @@
+"""Tests for the null (virtual device) backend."""
+
+import threading
+import time
+
+from beep_lite.backends.null_backend import NullBackend
+from beep_lite.loader import load_wav
+from beep_lite.manifest import duration
+from beep_lite.types import Sound
+
+
+class TestNullBackend:
+    """Test NullBackend."""
+
+    def test_records_played_sounds(self) -> None:
+        """Accepted sounds should be recorded in order."""
+        backend = NullBackend()
+        backend.play(Sound.OK, load_wav(Sound.OK))
+        backend.play(Sound.NG, load_wav(Sound.NG))
+
+        assert list(backend.played) == [Sound.OK, Sound.NG]
+
+    def test_done_is_set_after_the_sound_duration(self) -> None:
+        """done should be set once the sound would have finished."""
+        backend = NullBackend()
+        done = threading.Event()
+        start = time.monotonic()
+
+        backend.play(Sound.CRIT, load_wav(Sound.CRIT), done=done)
+
+        assert not done.is_set()
+        assert done.wait(2.0)
+        assert time.monotonic() - start >= duration(Sound.CRIT) - 0.01
+
+    def test_sounds_play_one_after_another_with_latency(self) -> None:
+        """A blocking play should wait for queued sounds and the latency."""
+        backend = NullBackend(latency=0.05)
+        start = time.monotonic()
+
+        backend.play(Sound.OK, load_wav(Sound.OK))
+        backend.play(Sound.OK, load_wav(Sound.OK), block=True)
+
+        expected = 2 * (duration(Sound.OK) + 0.05)
+        assert time.monotonic() - start >= expected - 0.01
+
+    def test_invalid_data_sets_done_without_raising(self) -> None:
+        """Undecodable data should be reported, not raised."""
+        backend = NullBackend()
+        done = threading.Event()
+
+        backend.play(Sound.OK, b"not a wav", done=done)
+
+        assert done.is_set()
+        assert list(backend.played) == []
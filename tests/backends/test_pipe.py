@@ -0,0 +1,280 @@
+"""Tests for the pipe (aplay / pw-play / paplay) backend."""
+
+import os
+import stat
+import sys
+import threading
+import time
+import wave
+from pathlib import Path
+
+import pytest
+
+import beep_lite
+from beep_lite.backends import pipe_backend
+from beep_lite.backends.pipe_backend import PipeBackend, _pad, find_player
+from beep_lite.loader import load_wav
+from beep_lite.pcm import Pcm, PcmFormat, decode_wav
+from beep_lite.stream import open_stream
+from beep_lite.types import Sound
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX only")
+
+# Stub player: appends everything read from stdin to $STUB_OUT.<pid>
+_STUB = """#!{python}
+import os, sys
+out = open(os.environ["STUB_OUT"] + "." + str(os.getpid()), "ab", buffering=0)
+while True:
+    chunk = sys.stdin.buffer.read1(65536)
+    if not chunk:
+        break
+    out.write(chunk)
+"""
+
+
+@pytest.fixture
+def stub_player(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Install a fake 'aplay' on PATH that records its stdin."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    player = bin_dir / "aplay"
+    player.write_text(_STUB.format(python=sys.executable))
+    player.chmod(player.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("STUB_OUT", str(tmp_path / "out"))
+    monkeypatch.delenv("BEEP_LITE_PLAYER", raising=False)
+    return tmp_path
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:  # noqa: ANN001
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def _outputs(tmp_path: Path) -> dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in tmp_path.glob("out.*")}
+
+
+class TestPipeBackend:
+    """Test PipeBackend against a stub player executable."""
+
+    def test_raises_import_error_without_player(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """PipeBackend should raise ImportError when no player is installed."""
+        monkeypatch.setenv("PATH", "")
+        with pytest.raises(ImportError, match="No command-line player"):
+            PipeBackend()
+
+    def test_find_player_honours_env(
+        self, stub_player: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """BEEP_LITE_PLAYER should restrict detection to one player."""
+        assert find_player() == "aplay"
+        monkeypatch.setenv("BEEP_LITE_PLAYER", "paplay")
+        assert find_player() is None
+
+    def test_streams_raw_pcm_to_player(self, stub_player: Path) -> None:
+        """The player should receive the decoded, padded PCM of the sound."""
+        backend = PipeBackend()
+        data = load_wav(Sound.OK)
+        expected = _pad(decode_wav(data))
+        try:
+            backend.play(Sound.OK, data)
+            _wait_for(lambda: list(_outputs(stub_player).values()) == [expected])
+        finally:
+            backend.close()
+        assert expected.startswith(decode_wav(data).frames)
+
+    def test_done_is_set_after_the_sound_has_played(self, stub_player: Path) -> None:
+        """done should be set once the written sound's duration has elapsed."""
+        backend = PipeBackend()
+        data = load_wav(Sound.CRIT)
+        done = threading.Event()
+        try:
+            start = time.monotonic()
+            backend.play(Sound.CRIT, data, done=done)
+            assert not done.is_set()
+            assert done.wait(5.0)
+            elapsed = time.monotonic() - start
+        finally:
+            backend.close()
+        assert elapsed >= decode_wav(data).duration - 0.01
+
+    def test_play_stream_writes_every_chunk(
+        self, stub_player: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A streamed file should reach the player whole, padded like a sound."""
+        monkeypatch.setattr("beep_lite.stream.STREAM_THRESHOLD", 0)
+        path = stub_player / "long.wav"
+        with wave.open(str(path), "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(16000)
+            writer.writeframes(bytes(range(256)) * 250)
+        expected = _pad(decode_wav(path.read_bytes()))
+        backend = PipeBackend()
+        done = threading.Event()
+        try:
+            backend.play_stream(open_stream(path, chunk_seconds=0.1), done=done)
+            assert done.wait(5.0)
+            _wait_for(lambda: list(_outputs(stub_player).values()) == [expected])
+        finally:
+            backend.close()
+
+    def test_reuses_long_lived_processes(self, stub_player: Path) -> None:
+        """Repeated beeps should not spawn more than pool_size processes."""
+        backend = PipeBackend(pool_size=2)
+        data = load_wav(Sound.SCAN_OK)
+        try:
+            for _ in range(10):
+                backend.play(Sound.SCAN_OK, data, block=True)
+            pools = list(backend._pools.values())
+            assert len(pools) == 1
+            assert len(pools[0]) <= 2
+        finally:
+            backend.close()
+        _wait_for(lambda: len(_outputs(stub_player)) == len(pools[0]))
+
+    def test_recycles_dead_process(self, stub_player: Path) -> None:
+        """A player that exits should be replaced and the sound still played."""
+        backend = PipeBackend(pool_size=1)
+        data = load_wav(Sound.SCAN_OK)
+        try:
+            backend.play(Sound.SCAN_OK, data, block=True)
+            worker = next(iter(backend._pools.values()))[0]
+            first_pid = worker.pid
+            worker._proc.kill()
+            worker._proc.wait()
+
+            backend.play(Sound.SCAN_OK, data, block=True)
+            assert worker.pid != first_pid
+        finally:
+            backend.close()
+        _wait_for(lambda: f"out.{worker.pid}" in _outputs(stub_player))
+
+    def test_failing_stream_does_not_stop_the_writer(self, stub_player: Path) -> None:
+        """An unexpected error should fail one sound and keep the player serving."""
+
+        def broken_chunks():  # noqa: ANN202
+            yield b"\x00\x00" * 100
+            raise RuntimeError("disk went away")
+
+        backend = PipeBackend(pool_size=1)
+        fmt = PcmFormat(rate=16000, channels=1, width=2)
+        failed = threading.Event()
+        try:
+            backend._submit(fmt, broken_chunks(), 0.0, False, failed)
+            assert failed.wait(5.0)
+            backend.play(Sound.SCAN_OK, load_wav(Sound.SCAN_OK), block=True)
+            (worker,) = next(iter(backend._pools.values()))
+            assert worker.alive
+        finally:
+            backend.close()
+
+    def test_replaces_worker_whose_writer_died(self, stub_player: Path) -> None:
+        """A worker without a writer thread should not be handed more sounds."""
+        backend = PipeBackend(pool_size=1)
+        data = load_wav(Sound.SCAN_OK)
+        try:
+            backend.play(Sound.SCAN_OK, data, block=True)
+            (dead,) = next(iter(backend._pools.values()))
+            dead._queue.put(None)
+            dead._thread.join(1.0)
+
+            done = threading.Event()
+            backend.play(Sound.SCAN_OK, data, done=done)
+            assert done.wait(5.0)
+            (worker,) = next(iter(backend._pools.values()))
+            assert worker is not dead
+        finally:
+            backend.close()
+
+    def test_drops_sounds_gone_stale_in_queue(self, stub_player: Path) -> None:
+        """A sound past its maximum age when dequeued should not be written."""
+        beep_lite.reset_dropped_counts()
+        backend = PipeBackend(pool_size=1)
+        done = threading.Event()
+        try:
+            backend.play(
+                Sound.SCAN_OK,
+                load_wav(Sound.SCAN_OK),
+                done=done,
+                enqueued=time.monotonic() - 1.0,
+                limits={Sound.SCAN_OK: 0.3},
+            )
+            assert done.wait(5.0)
+        finally:
+            backend.close()
+        assert beep_lite.dropped_counts() == {"scan_ok": 1}
+        assert not any(_outputs(stub_player).values())
+        beep_lite.reset_dropped_counts()
+
+    def test_signals_start_before_completion(self, stub_player: Path) -> None:
+        """started should be set once the player took the sound, before done."""
+        backend = PipeBackend(pool_size=1)
+        started = threading.Event()
+        done = threading.Event()
+        try:
+            backend.play(
+                Sound.SCAN_OK, load_wav(Sound.SCAN_OK), done=done, started=started
+            )
+            assert started.wait(5.0)
+            assert not done.is_set()
+            assert done.wait(5.0)
+        finally:
+            backend.close()
+
+    def test_bounds_the_queue_per_player(
+        self, stub_player: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Sounds beyond a player's backlog limit should be dropped and counted."""
+        beep_lite.reset_dropped_counts()
+        monkeypatch.setattr(pipe_backend, "_MAX_QUEUED", 0)
+        backend = PipeBackend(pool_size=1)
+        done = threading.Event()
+        try:
+            backend.play(Sound.SCAN_OK, load_wav(Sound.SCAN_OK), done=done)
+            assert done.is_set()
+        finally:
+            backend.close()
+        assert beep_lite.dropped_counts() == {"scan_ok": 1}
+        beep_lite.reset_dropped_counts()
+
+    def test_after_fork_releases_inherited_players(self, stub_player: Path) -> None:
+        """after_fork should let go of the players and start new ones on demand."""
+        backend = PipeBackend(pool_size=1)
+        data = load_wav(Sound.SCAN_OK)
+        try:
+            backend.play(Sound.SCAN_OK, data, block=True)
+            inherited = next(iter(backend._pools.values()))[0]
+
+            backend.after_fork()
+
+            # Its stdin now points at /dev/null, so the player sees EOF here.
+            assert inherited._proc.wait(timeout=5.0) == 0
+            assert backend._pools == {}
+            backend.play(Sound.SCAN_OK, data, block=True)
+            assert next(iter(backend._pools.values()))[0].pid != inherited.pid
+        finally:
+            backend.close()
+
+    def test_play_does_not_raise_on_invalid_data(self, stub_player: Path) -> None:
+        """Invalid WAV data should be logged, not raised."""
+        backend = PipeBackend()
+        backend.play(Sound.OK, b"invalid wav data")
+        backend.close()
+
+
+class TestPad:
+    """Test silence padding."""
+
+    def test_pads_to_whole_blocks_with_silence(self) -> None:
+        """Padding should round up to 50 ms and only append zero samples."""
+        pcm = Pcm(PcmFormat(rate=16000, channels=1, width=2), b"\x01\x02" * 10)
+        padded = _pad(pcm)
+        assert len(padded) == 800 * 2
+        assert padded[20:] == b"\x00" * (len(padded) - 20)
@@ -5,14 +5,23 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
-class _ImmediateThread:
-    """Thread stub that executes target immediately (for deterministic tests)."""
+class _IdleThread:
+    """Thread stub that never runs; tests drain the queue with ``_drain``."""
 
-    def __init__(self, target, daemon=True):  # noqa: ANN001, FBT002
+    def __init__(self, target, name=None, daemon=True):  # noqa: ANN001, FBT002
         self._target = target
 
     def start(self) -> None:
-        self._target()
+        pass
+
+    def join(self, timeout=None) -> None:  # noqa: ANN001
+        pass
+
+
+def _drain(backend) -> None:  # noqa: ANN001
+    """Run the backend's worker loop on this thread until the queue is empty."""
+    backend._queue.put(None)
+    backend._run()
 
 
 class TestSimpleaudioBackend:
@@ -53,8 +62,10 @@ class TestSimpleaudioBackend:
             assert backend.is_available() is True
 
     @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
-    def test_simpleaudio_backend_play_uses_wave_read(self, mock_sa: MagicMock) -> None:
-        """play() should decode wav bytes and call from_wave_read."""
+    def test_simpleaudio_backend_play_uses_decoded_pcm(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """play() should decode wav bytes and build a WaveObject from the PCM."""
         with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
             from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
             from beep_lite.types import Sound
@@ -62,7 +73,7 @@ class TestSimpleaudioBackend:
             backend = SimpleaudioBackend()
 
             mock_wave_obj = MagicMock()
-            backend._simpleaudio.WaveObject.from_wave_read.return_value = mock_wave_obj
+            backend._simpleaudio.WaveObject.return_value = mock_wave_obj
 
             # Minimal valid WAV bytes (RIFF/WAVE header)
             wav_bytes = (
@@ -82,9 +93,287 @@ class TestSimpleaudioBackend:
 
             with patch(
                 "beep_lite.backends.simpleaudio_backend.threading.Thread",
-                _ImmediateThread,
+                _IdleThread,
             ):
                 backend.play(Sound.OK, wav_bytes)
+                _drain(backend)
 
-            backend._simpleaudio.WaveObject.from_wave_read.assert_called_once()
+            backend._simpleaudio.WaveObject.assert_called_once_with(b"", 1, 2, 8000)
             mock_wave_obj.play.assert_called_once()
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_block_waits_on_caller_thread(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """play(block=True) should not spawn a thread and should wait_done()."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.types import Sound
+
+            backend = SimpleaudioBackend()
+            play_obj = backend._simpleaudio.WaveObject.return_value.play.return_value
+
+            with (
+                patch("beep_lite.backends.simpleaudio_backend.load_pcm"),
+                patch(
+                    "beep_lite.backends.simpleaudio_backend.threading.Thread"
+                ) as mock_thread,
+            ):
+                backend.play(Sound.OK, b"data", block=True)
+
+            mock_thread.assert_not_called()
+            play_obj.wait_done.assert_called_once()
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_decodes_each_sound_once(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """prepare() and repeated play() should reuse the decoded WaveObject."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.types import Sound
+
+            backend = SimpleaudioBackend()
+            wave_object = backend._simpleaudio.WaveObject
+            data = b"wav"
+
+            with (
+                patch("beep_lite.backends.simpleaudio_backend.load_pcm"),
+                patch(
+                    "beep_lite.backends.simpleaudio_backend.threading.Thread",
+                    _IdleThread,
+                ),
+            ):
+                backend.prepare(Sound.OK, data)
+                backend.play(Sound.OK, data)
+                backend.play(Sound.OK, data)
+                _drain(backend)
+
+            wave_object.assert_called_once()
+            assert wave_object.return_value.play.call_count == 2
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_shares_identical_audio(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """Sounds that decode to the same PCM should share one WaveObject."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.types import Sound
+
+            backend = SimpleaudioBackend()
+            wave_object = backend._simpleaudio.WaveObject
+
+            with patch("beep_lite.backends.simpleaudio_backend.load_pcm"):
+                backend.prepare(Sound.OK, b"wav")
+                backend.prepare(Sound.SCAN_NG, b"wav")
+
+            wave_object.assert_called_once()
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_sets_done_after_playback(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """done should be set on the scheduler once the sound has stopped."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            import threading
+
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.types import Sound
+
+            backend = SimpleaudioBackend()
+            play_obj = backend._simpleaudio.WaveObject.return_value.play.return_value
+            play_obj.is_playing.side_effect = [True, False]
+            done = threading.Event()
+
+            with patch("beep_lite.backends.simpleaudio_backend.load_pcm") as load:
+                load.return_value.duration = 0.02
+                backend.play(Sound.OK, b"data", done=done)
+                assert done.wait(timeout=2.0)
+
+            backend.close()
+            play_obj.wait_done.assert_not_called()
+            assert play_obj.is_playing.call_count == 2
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_checks_overrun_only_once(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """A sound still playing after the retry should be considered finished."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            import threading
+
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.types import Sound
+
+            backend = SimpleaudioBackend()
+            play_obj = backend._simpleaudio.WaveObject.return_value.play.return_value
+            play_obj.is_playing.return_value = True
+            done = threading.Event()
+
+            with patch("beep_lite.backends.simpleaudio_backend.load_pcm") as load:
+                load.return_value.duration = 0.01
+                backend.play(Sound.OK, b"data", done=done)
+                assert done.wait(timeout=2.0)
+
+            backend.close()
+            assert play_obj.is_playing.call_count == 2
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_streams_chunk_by_chunk(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """Each chunk should be played once the previous one has finished."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            from pathlib import Path
+
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.pcm import PcmFormat
+            from beep_lite.stream import PcmStream
+
+            fmt = PcmFormat(rate=8000, channels=1, width=2)
+            chunks = [b"\x01\x00" * 800, b"\x02\x00" * 800, b"\x03\x00" * 400]
+            stream = PcmStream(Path("long.wav"), fmt, 2000, None, lambda: iter(chunks))
+            backend = SimpleaudioBackend()
+            backend._output_format = None
+            backend.listener = MagicMock()
+
+            backend.play_stream(stream, block=True)
+
+            play_buffer = backend._simpleaudio.play_buffer
+            assert [c.args for c in play_buffer.call_args_list] == [
+                (chunk, 1, 2, 8000) for chunk in chunks
+            ]
+            assert play_buffer.return_value.wait_done.call_count == 3
+            backend.listener.playback_succeeded.assert_called_once()
+            backend.close()
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_reuses_one_worker_thread(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """Many non-blocking sounds should be started by a single thread."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            import threading
+
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.types import Sound
+
+            backend = SimpleaudioBackend()
+            play = backend._simpleaudio.WaveObject.return_value.play
+            started = threading.Event()
+            play.side_effect = lambda: started.set() if play.call_count == 50 else None
+
+            with (
+                patch("beep_lite.backends.simpleaudio_backend.load_pcm"),
+                patch(
+                    "beep_lite.backends.simpleaudio_backend.threading.Thread",
+                    wraps=threading.Thread,
+                ) as thread_cls,
+            ):
+                for _ in range(50):
+                    backend.play(Sound.OK, b"data")
+                assert started.wait(timeout=2.0)
+                backend.close()
+
+            thread_cls.assert_called_once()
+            assert play.call_count == 50
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_sheds_backlog(self, mock_sa: MagicMock) -> None:
+        """Sounds beyond the queue limit should be dropped, counted and done."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            import threading
+
+            import beep_lite
+            from beep_lite.backends import simpleaudio_backend
+            from beep_lite.types import Sound
+
+            backend = simpleaudio_backend.SimpleaudioBackend()
+            done = threading.Event()
+
+            with (
+                patch("beep_lite.backends.simpleaudio_backend.load_pcm"),
+                patch(
+                    "beep_lite.backends.simpleaudio_backend.threading.Thread",
+                    _IdleThread,
+                ),
+            ):
+                for _ in range(simpleaudio_backend._MAX_QUEUED):
+                    backend.play(Sound.OK, b"data")
+                backend.play(Sound.SCAN_OK, b"data", done=done)
+                _drain(backend)
+
+            assert done.is_set()
+            assert beep_lite.dropped_counts() == {"scan_ok": 1}
+            play = backend._simpleaudio.WaveObject.return_value.play
+            assert play.call_count == simpleaudio_backend._MAX_QUEUED
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_drops_sounds_gone_stale_in_queue(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """A sound past its maximum age when dequeued should not be started."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            import threading
+            import time
+
+            import beep_lite
+            from beep_lite.backends import simpleaudio_backend
+            from beep_lite.types import Sound
+
+            beep_lite.reset_dropped_counts()
+            backend = simpleaudio_backend.SimpleaudioBackend()
+            stale = threading.Event()
+            limits = {Sound.SCAN_OK: 0.3}
+            now = time.monotonic()
+
+            with (
+                patch("beep_lite.backends.simpleaudio_backend.load_pcm"),
+                patch(
+                    "beep_lite.backends.simpleaudio_backend.threading.Thread",
+                    _IdleThread,
+                ),
+            ):
+                backend.play(
+                    Sound.SCAN_OK, b"data", done=stale, enqueued=now - 1, limits=limits
+                )
+                backend.play(Sound.SCAN_OK, b"data", enqueued=now)
+                _drain(backend)
+
+            assert stale.is_set()
+            assert beep_lite.dropped_counts() == {"scan_ok": 1}
+            play = backend._simpleaudio.WaveObject.return_value.play
+            assert play.call_count == 1
+            beep_lite.reset_dropped_counts()
+
+    @patch("beep_lite.backends.simpleaudio_backend.simpleaudio", create=True)
+    def test_simpleaudio_backend_after_fork_keeps_decoded_sounds(
+        self, mock_sa: MagicMock
+    ) -> None:
+        """after_fork should drop the worker and queue but not the WaveObjects."""
+        with patch.dict("sys.modules", {"simpleaudio": mock_sa}):
+            from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+            from beep_lite.types import Sound
+
+            backend = SimpleaudioBackend()
+            with (
+                patch("beep_lite.backends.simpleaudio_backend.load_pcm"),
+                patch(
+                    "beep_lite.backends.simpleaudio_backend.threading.Thread",
+                    _IdleThread,
+                ),
+            ):
+                backend.prepare(Sound.OK, b"data")
+                backend.play(Sound.OK, b"data")
+                queue = backend._queue
+
+                backend.after_fork()
+
+                assert backend._thread is None
+                assert backend._queue is not queue
+                assert backend._queue.empty()
+                backend.play(Sound.OK, b"data")
+                _drain(backend)
+
+            backend._simpleaudio.WaveObject.assert_called_once()
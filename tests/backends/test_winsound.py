@@ -1,7 +1,12 @@
 """Tests for winsound backend."""
 
+import hashlib
+import os
 import sys
-from unittest.mock import patch
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -37,3 +42,180 @@ class TestWinsoundBackend:
 
         # Play with invalid data - should not raise
         backend.play(Sound.OK, b"invalid wav data")
+
+
+@pytest.fixture
+def fake_winsound(tmp_path: Path) -> Iterator[MagicMock]:
+    """Provide a mocked winsound module and a private temp directory."""
+    winsound = MagicMock()
+    winsound.SND_FILENAME = 0x20000
+    winsound.SND_ASYNC = 0x1
+    winsound.SND_NODEFAULT = 0x2
+    with (
+        patch.dict("sys.modules", {"winsound": winsound}),
+        patch("beep_lite.backends.winsound_backend.sys.platform", "win32"),
+        patch(
+            "beep_lite.backends.winsound_backend.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ),
+    ):
+        yield winsound
+
+
+class TestWinsoundTempFiles:
+    """Test materialisation of WAV payloads with a mocked winsound."""
+
+    def test_payload_is_written_once_under_its_hash(
+        self, fake_winsound: MagicMock, tmp_path: Path
+    ) -> None:
+        """Repeated plays should reuse one content-named file."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        backend = WinsoundBackend()
+        data = b"RIFF-ok"
+        expected = tmp_path / "beep_lite" / f"{hashlib.sha256(data).hexdigest()}.wav"
+
+        with patch(
+            "beep_lite.backends.winsound_backend.os.replace", wraps=os.replace
+        ) as mock_replace:
+            backend.play(Sound.OK, data)
+            backend.play(Sound.OK, data)
+            backend.play(Sound.OK, data)
+
+        mock_replace.assert_called_once()
+        assert expected.read_bytes() == data
+        assert fake_winsound.PlaySound.call_count == 3
+        path, flags = fake_winsound.PlaySound.call_args.args
+        assert path == str(expected)
+        assert flags & fake_winsound.SND_ASYNC
+
+    def test_identical_payloads_share_a_file(
+        self, fake_winsound: MagicMock, tmp_path: Path
+    ) -> None:
+        """Different sounds with the same data should play the same file."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        backend = WinsoundBackend()
+        backend.play(Sound.OK, b"same")
+        backend.play(Sound.SCAN_NG, bytes(bytearray(b"same")))
+
+        assert len(list((tmp_path / "beep_lite").iterdir())) == 1
+        paths = {c.args[0] for c in fake_winsound.PlaySound.call_args_list}
+        assert len(paths) == 1
+
+    def test_existing_file_from_another_process_is_reused(
+        self, fake_winsound: MagicMock, tmp_path: Path
+    ) -> None:
+        """A file already written by another process should not be rewritten."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        backend = WinsoundBackend()
+        data = b"RIFF-ng"
+        path = tmp_path / "beep_lite" / f"{hashlib.sha256(data).hexdigest()}.wav"
+        path.write_bytes(data)
+
+        with patch("beep_lite.backends.winsound_backend.tempfile.mkstemp") as mkstemp:
+            backend.play(Sound.NG, data)
+
+        mkstemp.assert_not_called()
+
+    def test_block_drops_async(self, fake_winsound: MagicMock) -> None:
+        """block=True should play synchronously."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        WinsoundBackend().play(Sound.OK, b"data", block=True)
+
+        _, flags = fake_winsound.PlaySound.call_args.args
+        assert not flags & fake_winsound.SND_ASYNC
+
+    def test_stale_files_are_removed_at_startup(
+        self, fake_winsound: MagicMock, tmp_path: Path
+    ) -> None:
+        """Unused sounds and old partial writes go; everything else stays."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        temp_dir = tmp_path / "beep_lite"
+        temp_dir.mkdir()
+        unknown = temp_dir / "ok.wav"
+        writing = temp_dir / "abc.tmp"
+        crashed = temp_dir / "def.tmp"
+        fresh = temp_dir / f"{'a' * 64}.wav"
+        old = temp_dir / f"{'b' * 64}.wav"
+        for path in (unknown, writing, crashed, fresh, old):
+            path.write_bytes(b"x")
+        hours_ago = time.time() - 2 * 3600
+        os.utime(crashed, (hours_ago, hours_ago))
+        os.utime(old, (0, 0))
+        os.utime(unknown, (0, 0))
+
+        WinsoundBackend()
+
+        assert sorted(temp_dir.iterdir()) == sorted([unknown, writing, fresh])
+
+    def test_used_files_are_kept_fresh(
+        self, fake_winsound: MagicMock, tmp_path: Path
+    ) -> None:
+        """Reusing an existing sound file should refresh its age."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        backend = WinsoundBackend()
+        data = b"RIFF-ok"
+        path = tmp_path / "beep_lite" / f"{hashlib.sha256(data).hexdigest()}.wav"
+        path.write_bytes(data)
+        os.utime(path, (0, 0))
+
+        backend.play(Sound.OK, data)
+
+        assert path.stat().st_mtime > time.time() - 60
+        WinsoundBackend()
+        assert path.is_file()
+
+    def test_deleted_file_is_rewritten(
+        self, fake_winsound: MagicMock, tmp_path: Path
+    ) -> None:
+        """If the file disappears, playback should recreate it and retry."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        backend = WinsoundBackend()
+        backend.prepare(Sound.OK, b"data")
+        for path in (tmp_path / "beep_lite").iterdir():
+            path.unlink()
+        fake_winsound.PlaySound.side_effect = [RuntimeError("not found"), None]
+        listener = MagicMock()
+        backend.listener = listener
+
+        backend.play(Sound.OK, b"data")
+
+        assert fake_winsound.PlaySound.call_count == 2
+        assert len(list((tmp_path / "beep_lite").iterdir())) == 1
+        listener.playback_succeeded.assert_called_once()
+
+    def test_failure_is_reported(self, fake_winsound: MagicMock) -> None:
+        """Playback errors should be reported, not raised."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+
+        backend = WinsoundBackend()
+        listener = MagicMock()
+        backend.listener = listener
+        fake_winsound.PlaySound.side_effect = RuntimeError("device busy")
+
+        backend.play(Sound.OK, b"data")
+
+        listener.playback_failed.assert_called_once()
+
+    def test_async_done_is_set_after_duration(self, fake_winsound: MagicMock) -> None:
+        """winsound has no completion callback: done follows the sound length."""
+        from beep_lite.backends.winsound_backend import WinsoundBackend
+        from beep_lite.loader import load_wav
+
+        backend = WinsoundBackend()
+        done = MagicMock()
+
+        with patch(
+            "beep_lite.backends.winsound_backend.get_scheduler"
+        ) as mock_scheduler:
+            backend.play(Sound.CRIT, load_wav(Sound.CRIT), done=done)
+
+        mock_scheduler.return_value.call_later.assert_called_once_with(
+            pytest.approx(0.21), done.set
+        )
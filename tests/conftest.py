@@ -0,0 +1,26 @@
+"""Shared test fixtures."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from beep_lite import pcm_cache
+from beep_lite.loader import clear_cache
+from beep_lite.staleness import reset_dropped_counts
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Start every test with empty in-memory caches and a private cache dir.
+
+    Keeps the persistent PCM cache out of the user's real cache directory and
+    stops mocked WAV data cached by one test (or its drop counts) from
+    leaking into the next.
+    """
+    monkeypatch.setenv(pcm_cache.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.delenv("BEEP_LITE_OUTPUT_FORMAT", raising=False)
+    clear_cache()
+    yield
+    clear_cache()
+    reset_dropped_counts()
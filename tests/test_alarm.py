@@ -0,0 +1,145 @@
+"""Tests for repeating alarms."""
+
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import beep_lite
+from beep_lite import alarm as alarm_module
+from beep_lite.types import Sound
+
+
+@pytest.fixture
+def played() -> Iterator[MagicMock]:
+    """Record scheduled plays instead of producing sound."""
+    with patch("beep_lite.alarm.play_at") as mock_play:
+        yield mock_play
+    with alarm_module._lock:
+        groups = list(alarm_module._groups.values())
+    for group in groups:
+        for alarm in list(group.alarms):
+            alarm.ack()
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:  # noqa: ANN001
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestRepeat:
+    """Test repeat() and Alarm."""
+
+    def test_repeats_until_acknowledged(self, played: MagicMock) -> None:
+        """An alarm should beep immediately and then every interval."""
+        alarm = beep_lite.repeat(Sound.CRIT, interval=0.02)
+
+        assert _wait_for(lambda: played.call_count >= 3)
+        alarm.ack()
+        count = played.call_count
+        time.sleep(0.08)
+
+        assert not alarm.active
+        assert played.call_count <= count + 1
+        assert all(c.args[0] is Sound.CRIT for c in played.call_args_list)
+
+    def test_max_count_stops_alarm(self, played: MagicMock) -> None:
+        """An alarm should stop by itself after max_count beeps."""
+        alarm = beep_lite.repeat(Sound.WARN, interval=0.01, max_count=3)
+
+        assert _wait_for(lambda: not alarm.active)
+        time.sleep(0.05)
+
+        assert alarm.count == 3
+        assert played.call_count == 3
+        assert Sound.WARN not in alarm_module._groups
+
+    def test_same_sound_alarms_are_coalesced(self, played: MagicMock) -> None:
+        """Many alarms of one sound should beep as one, not once each."""
+        alarms = [beep_lite.repeat(Sound.CRIT, interval=0.05) for _ in range(100)]
+
+        assert _wait_for(lambda: alarms[0].count >= 2)
+        for alarm in alarms:
+            alarm.ack()
+
+        assert played.call_count <= 3
+        assert Sound.CRIT not in alarm_module._groups
+
+    def test_shorter_interval_joins_group(self, played: MagicMock) -> None:
+        """A new alarm with a shorter interval should speed up the group."""
+        slow = beep_lite.repeat(Sound.NG, interval=60.0)
+        assert _wait_for(lambda: played.call_count == 1)
+
+        fast = beep_lite.repeat(Sound.NG, interval=0.01)
+
+        assert _wait_for(lambda: played.call_count >= 3)
+        assert slow.count == 1
+        assert fast.count >= 2
+        fast.ack()
+        slow.ack()
+
+    def test_each_alarm_counts_its_own_interval(self, played: MagicMock) -> None:
+        """A slow alarm in a fast group should only count beeps at its interval."""
+        fast = beep_lite.repeat(Sound.MEW, interval=0.02)
+        slow = beep_lite.repeat(Sound.MEW, interval=0.1, max_count=3)
+
+        assert _wait_for(lambda: fast.count >= 5)
+        assert slow.active
+        assert slow.count <= 2
+        assert _wait_for(lambda: not slow.active)
+        elapsed_beeps = fast.count
+        fast.ack()
+
+        assert slow.count == 3
+        # The slow alarm's three beeps span two of its intervals.
+        assert elapsed_beeps >= 9
+
+    def test_acked_fast_alarm_leaves_slow_cadence(self, played: MagicMock) -> None:
+        """After the fast alarm is acknowledged, beeps return to the slow interval."""
+        slow = beep_lite.repeat(Sound.OK, interval=0.2)
+        fast = beep_lite.repeat(Sound.OK, interval=0.01)
+        assert _wait_for(lambda: fast.count >= 3)
+        fast.ack()
+        before = played.call_count
+        time.sleep(0.1)
+
+        assert played.call_count <= before + 1
+        slow.ack()
+
+    def test_ack_keeps_other_alarms(self, played: MagicMock) -> None:
+        """Acknowledging one alarm should not silence the others."""
+        first = beep_lite.repeat(Sound.MOO, interval=0.01)
+        second = beep_lite.repeat(Sound.MOO, interval=0.01)
+        first.ack()
+        first.ack()
+
+        assert second.active
+        before = second.count
+        assert _wait_for(lambda: second.count >= before + 2)
+        assert not first.active
+
+    def test_alarms_share_the_scheduler_thread(self, played: MagicMock) -> None:
+        """Alarms should not start threads of their own."""
+        beep_lite.repeat(Sound.OK, interval=10.0)
+        before = threading.active_count()
+
+        for sound in Sound:
+            beep_lite.repeat(sound, interval=10.0)
+
+        assert threading.active_count() == before
+
+    @pytest.mark.parametrize(
+        ("interval", "max_count"), [(0.0, None), (-1.0, None), (1.0, 0)]
+    )
+    def test_invalid_arguments(
+        self, played: MagicMock, interval: float, max_count: int | None
+    ) -> None:
+        """Non-positive intervals and counts should be rejected."""
+        with pytest.raises(ValueError):
+            beep_lite.repeat(Sound.CRIT, interval=interval, max_count=max_count)
@@ -1,62 +1,66 @@
 """Tests for public API."""
 
+import importlib
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
+import beep_lite
 from beep_lite import Sound, crit, mew, moo, ng, ok, play, scan_ng, scan_ok, warn
 
 
 class TestApiExceptionSafety:
     """Test that all API functions are exception-safe."""
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_ok_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """ok() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         ok()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_ng_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """ng() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         ng()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_warn_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """warn() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         warn()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_crit_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """crit() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         crit()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_moo_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """moo() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         moo()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_mew_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """mew() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         mew()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_scan_ok_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """scan_ok() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         scan_ok()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_scan_ng_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """scan_ng() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
         scan_ng()  # Should not raise
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_play_does_not_raise_on_error(self, mock_play: MagicMock) -> None:
         """play() should not raise even when playback fails."""
         mock_play.side_effect = Exception("Test error")
@@ -66,56 +70,79 @@ class TestApiExceptionSafety:
 class TestApiCallsCorrectSound:
     """Test that API functions call play_sound with correct Sound enum."""
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_ok_plays_ok_sound(self, mock_play: MagicMock) -> None:
         """ok() should play Sound.OK."""
         ok()
         mock_play.assert_called_once_with(Sound.OK)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_ng_plays_ng_sound(self, mock_play: MagicMock) -> None:
         """ng() should play Sound.NG."""
         ng()
         mock_play.assert_called_once_with(Sound.NG)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_warn_plays_warn_sound(self, mock_play: MagicMock) -> None:
         """warn() should play Sound.WARN."""
         warn()
         mock_play.assert_called_once_with(Sound.WARN)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_crit_plays_crit_sound(self, mock_play: MagicMock) -> None:
         """crit() should play Sound.CRIT."""
         crit()
         mock_play.assert_called_once_with(Sound.CRIT)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_moo_plays_moo_sound(self, mock_play: MagicMock) -> None:
         """moo() should play Sound.MOO."""
         moo()
         mock_play.assert_called_once_with(Sound.MOO)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_mew_plays_mew_sound(self, mock_play: MagicMock) -> None:
         """mew() should play Sound.MEW."""
         mew()
         mock_play.assert_called_once_with(Sound.MEW)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_scan_ok_plays_scan_ok_sound(self, mock_play: MagicMock) -> None:
         """scan_ok() should play Sound.SCAN_OK."""
         scan_ok()
         mock_play.assert_called_once_with(Sound.SCAN_OK)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_scan_ng_plays_scan_ng_sound(self, mock_play: MagicMock) -> None:
         """scan_ng() should play Sound.SCAN_NG."""
         scan_ng()
         mock_play.assert_called_once_with(Sound.SCAN_NG)
 
-    @patch("beep_lite.api.play_sound")
+    @patch("beep_lite.core.Beeper.play_sound")
     def test_play_with_sound_enum(self, mock_play: MagicMock) -> None:
         """play() should accept Sound enum and call play_sound."""
         play(Sound.SCAN_OK)
         mock_play.assert_called_once_with(Sound.SCAN_OK)
+
+
+class TestLazyImports:
+    """Test that optional features are only imported on first use."""
+
+    def test_import_skips_optional_modules(self) -> None:
+        """import beep_lite should not load selection, plugins or render."""
+        code = (
+            "import sys, beep_lite; "
+            "print(sorted(m for m in sys.modules if m.startswith('beep_lite.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        for module in ("alarm", "plugins", "_render", "selection", "stream", "_warmup"):
+            assert f"beep_lite.{module}'" not in result.stdout
+
+    def test_lazy_names_resolve(self) -> None:
+        """Lazy names should be the objects defined in their modules."""
+        module = importlib.import_module("beep_lite._render")
+
+        assert beep_lite.render is module.render
+        assert set(beep_lite.__all__) <= set(dir(beep_lite))
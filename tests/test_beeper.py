@@ -0,0 +1,129 @@
+"""Tests for independent Beeper instances."""
+
+import threading
+import time
+
+from beep_lite import core, warmup
+from beep_lite.core import Beeper, default_beeper
+from beep_lite.types import Sound
+
+
+class _RecordingBackend:
+    """Backend stub remembering what it was asked to play."""
+
+    signals_completion = True
+
+    def __init__(self) -> None:
+        self.played: list[tuple[Sound, bytes]] = []
+        self.pending: list[threading.Event] = []
+        self.prepared: list[Sound] = []
+        self.closed = False
+
+    def play(self, sound: Sound, data: bytes, **kwargs: object) -> None:
+        self.played.append((sound, data))
+        done = kwargs.get("done")
+        if isinstance(done, threading.Event):
+            self.pending.append(done)
+
+    def prepare(self, sound: Sound, data: bytes) -> None:
+        self.prepared.append(sound)
+
+    def is_available(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestBeeper:
+    """Test Beeper instances."""
+
+    def test_instances_use_their_own_backend(self) -> None:
+        """Each beeper should play through its own backend only."""
+        first, second = _RecordingBackend(), _RecordingBackend()
+
+        Beeper(first).ok()
+        Beeper(second).ng()
+        Beeper(second).scan_ok()
+
+        assert [s for s, _ in first.played] == [Sound.OK]
+        assert [s for s, _ in second.played] == [Sound.NG, Sound.SCAN_OK]
+
+    def test_instances_share_audio_data(self) -> None:
+        """WAV data should be loaded once and shared, not copied per instance."""
+        first, second = _RecordingBackend(), _RecordingBackend()
+
+        Beeper(first).crit()
+        Beeper(second).crit()
+
+        assert first.played[0][1] is second.played[0][1]
+
+    def test_default_instance_backs_module_functions(self) -> None:
+        """The module-level functions should be bound to the default beeper."""
+        assert core.play_sound.__self__ is default_beeper()
+        assert core._get_backend.__self__ is default_beeper()
+
+    def test_max_age_is_per_instance(self) -> None:
+        """Staleness limits given to one beeper should not affect another."""
+        strict_backend, lax_backend = _RecordingBackend(), _RecordingBackend()
+        strict = Beeper(strict_backend, max_age={Sound.SCAN_OK: 0.1})
+        lax = Beeper(lax_backend)
+        old = time.monotonic() - 1.0
+
+        strict.play_sound(Sound.SCAN_OK, enqueued=old)
+        lax.play_sound(Sound.SCAN_OK, enqueued=old)
+        strict.set_max_age(Sound.SCAN_OK, None)
+        strict.play_sound(Sound.SCAN_OK, enqueued=old)
+
+        assert len(strict_backend.played) == 1
+        assert len(lax_backend.played) == 1
+
+    def test_flush_is_per_instance(self) -> None:
+        """flush() should only wait for the beeper's own sounds."""
+        busy_backend, idle_backend = _RecordingBackend(), _RecordingBackend()
+        busy, idle = Beeper(busy_backend), Beeper(idle_backend)
+
+        busy.ok()
+
+        assert idle.flush(timeout=0.01) is True
+        assert busy.flush(timeout=0.01) is False
+        busy_backend.pending[0].set()
+        assert busy.flush(timeout=0.01) is True
+
+    def test_candidates_are_created_lazily(self) -> None:
+        """A beeper built from candidates should create its backend on first use."""
+        created: list[_RecordingBackend] = []
+
+        def factory() -> _RecordingBackend:
+            created.append(_RecordingBackend())
+            return created[-1]
+
+        beeper = Beeper(candidates=[("recording", factory)])
+        assert created == []
+
+        beeper.ok()
+        beeper.ok()
+
+        assert len(created) == 1
+        assert len(created[0].played) == 2
+        beeper.close()
+        assert created[0].closed
+
+    def test_play_never_raises(self) -> None:
+        """Instance play methods should swallow backend errors."""
+
+        class _Broken(_RecordingBackend):
+            def play(self, sound: Sound, data: bytes, **kwargs: object) -> None:
+                raise RuntimeError("device gone")
+
+        Beeper(_Broken()).warn()
+
+    def test_warmup_targets_the_given_beeper(self) -> None:
+        """warmup(beeper=...) should prepare that beeper's backend."""
+        backend = _RecordingBackend()
+
+        warmup(background=False, beeper=Beeper(backend)).result(timeout=5)
+
+        assert sorted(s.value for s in backend.prepared) == sorted(
+            s.value for s in Sound
+        )
@@ -0,0 +1,185 @@
+"""Tests for the command-line entry point and daemon client."""
+
+import os
+import socket
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from beep_lite import daemon
+from beep_lite.cli import main
+from beep_lite.types import Sound
+
+
+class TestCliLocalPlayback:
+    """Test playing sounds in-process."""
+
+    @patch("beep_lite.core.play_sound")
+    def test_plays_sequence_blocking_in_order(self, mock_play: MagicMock) -> None:
+        """Each sound should be played blocking, in the given order."""
+        assert main(["ok", "SCAN-NG", "crit"]) == 0
+        assert mock_play.call_args_list == [
+            call(Sound.OK, block=True),
+            call(Sound.SCAN_NG, block=True),
+            call(Sound.CRIT, block=True),
+        ]
+
+    @patch("time.sleep")
+    @patch("beep_lite.core.play_sound")
+    def test_gap_sleeps_between_sounds_only(
+        self, mock_play: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """--gap should pause between sounds but not after the last one."""
+        main(["ok", "ok", "ok", "--gap", "0.25"])
+        assert mock_sleep.call_args_list == [call(0.25), call(0.25)]
+
+    @patch("beep_lite.core.play_sound")
+    def test_returns_error_status_on_failure(self, mock_play: MagicMock) -> None:
+        """A failing sound should give exit status 1 instead of a traceback."""
+        mock_play.side_effect = Exception("Test error")
+        assert main(["ok"]) == 1
+
+    def test_unknown_sound_is_usage_error(self) -> None:
+        """Unknown sound names should exit with argparse's usage status."""
+        with pytest.raises(SystemExit) as excinfo:
+            main(["nope"])
+        assert excinfo.value.code == 2
+
+    def test_missing_sound_is_usage_error(self) -> None:
+        """At least one sound is required."""
+        with pytest.raises(SystemExit) as excinfo:
+            main([])
+        assert excinfo.value.code == 2
+
+    def test_list_prints_all_sounds(self, capsys: pytest.CaptureFixture) -> None:
+        """--list should print every sound name."""
+        assert main(["--list"]) == 0
+        assert capsys.readouterr().out.split() == [s.value for s in Sound]
+
+
+class TestCliDaemonClient:
+    """Test the --daemon-client path."""
+
+    @patch("beep_lite.core.play_sound")
+    @patch("beep_lite.daemon.send")
+    def test_sends_to_daemon(self, mock_send: MagicMock, mock_play: MagicMock) -> None:
+        """Sounds should be handed to the daemon and not played locally."""
+        assert main(["--daemon-client", "ok", "ng", "--address", "x:1"]) == 0
+        mock_send.assert_called_once_with(["ok", "ng"], address="x:1", gap=0.0)
+        mock_play.assert_not_called()
+
+    @patch("beep_lite.core.play_sound")
+    @patch("beep_lite.daemon.send", side_effect=ConnectionRefusedError)
+    def test_falls_back_to_local_playback(
+        self, mock_send: MagicMock, mock_play: MagicMock
+    ) -> None:
+        """Without a reachable daemon the sound should still play locally."""
+        assert main(["--daemon-client", "ok"]) == 0
+        mock_play.assert_called_once_with(Sound.OK, block=True)
+
+
+class TestDaemonProtocol:
+    """Test the daemon client against a minimal listener."""
+
+    def _listen(self, reply: bytes) -> tuple[socket.socket, list[bytes]]:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        received: list[bytes] = []
+
+        def _accept() -> None:
+            conn, _ = server.accept()
+            with conn:
+                received.append(conn.makefile("rb").readline())
+                conn.sendall(reply)
+
+        threading.Thread(target=_accept, daemon=True).start()
+        return server, received
+
+    def test_send_writes_request_line(self) -> None:
+        """send() should write '<gap> <sounds...>' and accept an ok reply."""
+        server, received = self._listen(b"ok\n")
+        with server:
+            port = server.getsockname()[1]
+            daemon.send(["ok", "ng"], address=f"127.0.0.1:{port}", gap=0.5)
+        assert received == [b"0.5 ok ng\n"]
+
+    def test_send_raises_on_error_reply(self) -> None:
+        """send() should raise OSError when the daemon rejects the request."""
+        server, _ = self._listen(b"error bad sound\n")
+        with server, pytest.raises(OSError, match="bad sound"):
+            port = server.getsockname()[1]
+            daemon.send(["ok"], address=f"127.0.0.1:{port}")
+
+    def test_parse_address(self) -> None:
+        """host:port means TCP, anything else is a Unix socket path."""
+        assert daemon._parse_address("127.0.0.1:47800") == (
+            socket.AF_INET,
+            ("127.0.0.1", 47800),
+        )
+        if hasattr(socket, "AF_UNIX"):
+            assert daemon._parse_address("/tmp/x.sock") == (
+                socket.AF_UNIX,
+                "/tmp/x.sock",
+            )
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets")
+    def test_default_address_uses_runtime_dir(self, tmp_path: Path) -> None:
+        """The default socket should live in XDG_RUNTIME_DIR when set."""
+        with patch.dict("os.environ", {"XDG_RUNTIME_DIR": str(tmp_path)}):
+            assert daemon.default_address() == str(tmp_path / "beep_lite.sock")
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets")
+class TestDaemonSocket:
+    """Test where the daemon listens and how it claims its socket."""
+
+    def test_default_address_is_private_without_runtime_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without XDG_RUNTIME_DIR the socket should go in a per-user directory."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        private_dir = tmp_path / f"beep-lite-{os.getuid()}"
+        assert daemon.default_address() == str(private_dir / "beep_lite.sock")
+
+        daemon._private_dir(private_dir)
+        assert private_dir.stat().st_mode & 0o777 == 0o700
+
+    def test_shared_directory_is_refused(self, tmp_path: Path) -> None:
+        """A directory other users can enter should not hold the socket."""
+        shared = tmp_path / "shared"
+        shared.mkdir(mode=0o755)
+        shared.chmod(0o755)
+        with pytest.raises(OSError, match="not a private directory"):
+            daemon._private_dir(shared)
+
+    def test_stale_socket_is_replaced(self, tmp_path: Path) -> None:
+        """A socket nobody listens on any more should be removed."""
+        path = tmp_path / "beep_lite.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(path))
+        daemon._claim_socket_path(path)
+        assert not path.exists()
+
+    def test_running_daemon_is_not_replaced(self, tmp_path: Path) -> None:
+        """Starting a second daemon on the same socket should fail."""
+        path = tmp_path / "beep_lite.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as running:
+            running.bind(str(path))
+            running.listen(1)
+            with pytest.raises(OSError, match="already listening"):
+                daemon._claim_socket_path(path)
+            assert main(["--serve", "--address", str(path)]) == 1
+            assert path.exists()
+
+    def test_other_files_are_not_removed(self, tmp_path: Path) -> None:
+        """A regular file at the socket path should be left alone."""
+        path = tmp_path / "beep_lite.sock"
+        path.write_text("not a socket")
+        with pytest.raises(OSError, match="not a socket"):
+            daemon._claim_socket_path(path)
+        assert path.read_text() == "not a socket"
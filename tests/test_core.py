@@ -1,14 +1,20 @@
 """Tests for core module."""
 
 import sys
+import threading
+import time
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from beep_lite import core
 from beep_lite.core import (
     _get_backend,
     _reset_backend,
     _select_backend,
+    flush,
+    flush_on_exit,
     play_sound,
 )
 from beep_lite.loader import SoundNotFoundError
@@ -51,10 +57,25 @@ class TestBackendSelection:
                 "beep_lite.backends.simpleaudio_backend.SimpleaudioBackend.__init__",
                 side_effect=ImportError("No simpleaudio"),
             ),
+            patch("beep_lite.backends.pipe_backend.find_player", return_value=None),
         ):
             backend = _select_backend()
             assert backend.__class__.__name__ == "FallbackBackend"
 
+    @patch("beep_lite.core.sys.platform", "linux")
+    def test_selects_pipe_backend_on_linux_without_simpleaudio(self) -> None:
+        """Should stream to a command-line player when simpleaudio is missing."""
+        with (
+            patch(
+                "beep_lite.backends.simpleaudio_backend.SimpleaudioBackend.__init__",
+                side_effect=ImportError("No simpleaudio"),
+            ),
+            patch("beep_lite.backends.pipe_backend.find_player", return_value="aplay"),
+            patch("beep_lite.backends.pipe_backend.shutil.which", return_value="x"),
+        ):
+            backend = _select_backend()
+            assert backend.__class__.__name__ == "PipeBackend"
+
 
 class TestGetBackend:
     """Test backend singleton behavior."""
@@ -95,7 +116,7 @@ class TestPlaySound:
         _reset_backend()
 
     @patch("beep_lite.core.load_wav")
-    @patch("beep_lite.core._get_backend")
+    @patch("beep_lite.core.Beeper._get_backend")
     def test_play_sound_loads_and_plays(
         self, mock_get_backend: MagicMock, mock_load_wav: MagicMock
     ) -> None:
@@ -116,3 +137,143 @@ class TestPlaySound:
 
         with pytest.raises(SoundNotFoundError):
             play_sound(Sound.OK)
+
+    @patch("beep_lite.core.load_wav")
+    @patch("beep_lite.core.Beeper._get_backend")
+    def test_play_sound_block_is_passed_to_backend(
+        self, mock_get_backend: MagicMock, mock_load_wav: MagicMock
+    ) -> None:
+        """play_sound(block=True) should ask the backend to block."""
+        mock_backend = MagicMock()
+        mock_get_backend.return_value = mock_backend
+        mock_load_wav.return_value = b"fake wav data"
+
+        play_sound(Sound.OK, block=True)
+
+        mock_backend.play.assert_called_once_with(
+            Sound.OK, b"fake wav data", block=True
+        )
+
+
+class _CompletingBackend:
+    """Backend stub that signals completion after a fixed playing time."""
+
+    signals_completion = True
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.calls: list[dict] = []
+
+    def play(self, sound: Sound, data: bytes, **kwargs: object) -> None:
+        self.calls.append(kwargs)
+        done = kwargs.get("done")
+        if done is not None and self.seconds >= 0:
+            threading.Timer(self.seconds, done.set).start()
+
+    def is_available(self) -> bool:
+        return True
+
+
+class TestCompletion:
+    """Test blocking with a timeout and flushing in-flight sounds."""
+
+    @pytest.fixture(autouse=True)
+    def _wav(self) -> Iterator[None]:
+        with patch("beep_lite.core.load_wav", return_value=b"wav"):
+            yield
+
+    def _use(self, backend: _CompletingBackend) -> Iterator[None]:
+        return patch("beep_lite.core.Beeper._get_backend", return_value=backend)
+
+    def test_block_with_timeout_waits_for_completion(self) -> None:
+        """play_sound(block=True, timeout=...) should return once done is set."""
+        backend = _CompletingBackend(0.05)
+        with self._use(backend):
+            start = time.monotonic()
+            play_sound(Sound.OK, block=True, timeout=2.0)
+            elapsed = time.monotonic() - start
+
+        assert 0.04 <= elapsed < 1.0
+        assert "done" in backend.calls[0]
+
+    def test_block_timeout_bounds_the_wait(self) -> None:
+        """A backend that never completes should not hang the caller."""
+        backend = _CompletingBackend(-1)
+        with self._use(backend):
+            start = time.monotonic()
+            play_sound(Sound.OK, block=True, timeout=0.05)
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 1.0
+        for shard in core._default._inflight:
+            shard.clear()
+
+    def test_block_without_timeout_plays_inline(self) -> None:
+        """Without a timeout the backend blocks on the calling thread."""
+        backend = _CompletingBackend(0.0)
+        with self._use(backend):
+            play_sound(Sound.OK, block=True)
+
+        assert backend.calls == [{"block": True}]
+
+    def test_flush_waits_for_in_flight_sounds(self) -> None:
+        """flush() should return once every started sound has finished."""
+        backend = _CompletingBackend(0.05)
+        with self._use(backend):
+            play_sound(Sound.OK)
+            play_sound(Sound.NG)
+            assert len(core._default._pending()) == 2
+
+            assert flush(timeout=2.0) is True
+
+        assert not core._default._pending()
+
+    def test_flush_is_bounded(self) -> None:
+        """flush() should give up after its timeout."""
+        backend = _CompletingBackend(-1)
+        with self._use(backend):
+            play_sound(Sound.OK)
+            start = time.monotonic()
+            assert flush(timeout=0.05) is False
+
+        assert time.monotonic() - start < 1.0
+        for shard in core._default._inflight:
+            shard.clear()
+
+    def test_flush_covers_sounds_from_many_threads(self) -> None:
+        """Sounds started on different threads should all be tracked."""
+        backend = _CompletingBackend(0.05)
+        barrier = threading.Barrier(8)
+
+        def play() -> None:
+            barrier.wait()
+            for _ in range(5):
+                play_sound(Sound.OK)
+
+        with self._use(backend):
+            threads = [threading.Thread(target=play) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(core._default._pending()) == 40
+            assert sum(1 for shard in core._default._inflight if shard) > 1
+
+            assert flush(timeout=2.0) is True
+
+        assert not core._default._pending()
+
+    def test_flush_on_exit_registers_once(self) -> None:
+        """flush_on_exit should register a single atexit handler."""
+        with (
+            patch("atexit.register") as mock_register,
+            patch("atexit.unregister"),
+            patch("beep_lite.core._exit_timeout", None),
+        ):
+            flush_on_exit(0.5)
+            flush_on_exit(2.0)
+            assert core._exit_timeout == 2.0
+            flush_on_exit(None)
+            assert core._exit_timeout is None
+
+        mock_register.assert_called_once_with(core._flush_at_exit)
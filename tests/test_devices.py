@@ -0,0 +1,90 @@
+"""Tests for output device enumeration and per-device beepers."""
+
+from unittest.mock import patch
+
+from beep_lite import devices
+from beep_lite.backends.pipe_backend import PipeBackend
+from beep_lite.devices import Device, list_devices, open_device
+from beep_lite.pcm import PcmFormat
+
+_FORMAT = PcmFormat(rate=16000, channels=1, width=2)
+
+_APLAY_L = """null
+    Discard all samples (playback) or generate zero samples (capture)
+default
+    Default ALSA Output (currently PipeWire Media Server)
+hw:CARD=Station1,DEV=0
+    USB Speaker, USB Audio
+    Direct hardware device without any conversions
+"""
+
+_PACTL = (
+    "47\talsa_output.usb-Station1.analog-stereo\tPipeWire\ts16le 2ch 48000Hz\tIDLE\n"
+    "48\talsa_output.pci-0000_00_1f.3.analog-stereo\tPipeWire\ts32le 2ch 48000Hz\t"
+    "SUSPENDED\n"
+)
+
+
+class TestListDevices:
+    """Test device enumeration."""
+
+    def test_parses_alsa_listing(self) -> None:
+        """aplay -L names and descriptions should be parsed."""
+        with patch.object(devices, "_run", return_value=_APLAY_L) as run:
+            found = list_devices("aplay")
+
+        run.assert_called_once_with(["aplay", "-L"])
+        assert [d.name for d in found] == [
+            "null",
+            "default",
+            "hw:CARD=Station1,DEV=0",
+        ]
+        assert found[2] == Device(
+            "hw:CARD=Station1,DEV=0",
+            "USB Speaker, USB Audio, Direct hardware device without any conversions",
+            "aplay",
+        )
+
+    def test_parses_pulse_sinks(self) -> None:
+        """pactl sink names should be listed for pw-play and paplay."""
+        with patch.object(devices, "_run", return_value=_PACTL):
+            found = list_devices("pw-play")
+
+        assert [d.name for d in found] == [
+            "alsa_output.usb-Station1.analog-stereo",
+            "alsa_output.pci-0000_00_1f.3.analog-stereo",
+        ]
+        assert {d.player for d in found} == {"pw-play"}
+
+    def test_missing_tools_give_an_empty_list(self) -> None:
+        """Without a player or listing tool there are no devices."""
+        with patch("beep_lite.backends.pipe_backend.find_player", return_value=None):
+            assert list_devices() == []
+        with patch("beep_lite.devices.shutil.which", return_value=None):
+            assert list_devices("aplay") == []
+
+
+class TestOpenDevice:
+    """Test per-device beepers."""
+
+    def test_backend_is_created_for_the_device_on_first_use(self) -> None:
+        """The beeper should lazily create a pipe backend bound to the device."""
+        device = Device("hw:CARD=Station1,DEV=0", "", "aplay")
+        with patch("beep_lite.backends.pipe_backend.PipeBackend") as backend_cls:
+            beeper = open_device(device, pool_size=1)
+            backend_cls.assert_not_called()
+            beeper._get_backend()._current()
+
+        backend_cls.assert_called_once_with("aplay", 1, "hw:CARD=Station1,DEV=0")
+
+    def test_pipe_command_targets_the_device(self) -> None:
+        """Player command lines should carry the device option."""
+        with patch("beep_lite.backends.pipe_backend.shutil.which", return_value="/x"):
+            aplay = PipeBackend("aplay", device="hw:1")
+            pw_play = PipeBackend("pw-play", device="speaker")
+            default = PipeBackend("paplay")
+
+        assert aplay._command(_FORMAT)[:3] == ["aplay", "-D", "hw:1"]
+        assert pw_play._command(_FORMAT)[:3] == ["pw-play", "--target", "speaker"]
+        assert default.device is None
+        assert not any(a.startswith("--device") for a in default._command(_FORMAT))
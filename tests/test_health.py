@@ -0,0 +1,281 @@
+"""Tests for backend health tracking and failover."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from beep_lite.health import ResilientBackend
+from beep_lite.pcm import PcmFormat
+from beep_lite.stream import PcmStream, StreamingUnsupported
+from beep_lite.types import Sound
+
+
+class _FakeBackend:
+    """Backend stub reporting outcomes through its listener."""
+
+    listener = None
+
+    def __init__(self, name: str, log: list[str], broken: threading.Event) -> None:
+        self.name = name
+        self._log = log
+        self._broken = broken
+        self.closed = False
+
+    def play(self, sound: Sound, data: bytes, *, block: bool = False) -> None:
+        self._log.append(self.name)
+        if self._broken.is_set():
+            self.listener.playback_failed(OSError("device unplugged"))
+        else:
+            self.listener.playback_succeeded()
+
+    def is_available(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:  # noqa: ANN001
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+class TestResilientBackend:
+    """Test circuit breaking and failover."""
+
+    def setup_method(self) -> None:
+        self.log: list[str] = []
+        self.broken = threading.Event()
+        self.fallback_broken = threading.Event()
+        self.created: list[_FakeBackend] = []
+
+    def _factory(self, name: str, broken: threading.Event):  # noqa: ANN202
+        def factory() -> _FakeBackend:
+            backend = _FakeBackend(name, self.log, broken)
+            self.created.append(backend)
+            return backend
+
+        return factory
+
+    def _make(self, **kwargs: float) -> ResilientBackend:
+        return ResilientBackend(
+            [
+                ("primary", self._factory("primary", self.broken)),
+                ("fallback", self._factory("fallback", self.fallback_broken)),
+            ],
+            **kwargs,
+        )
+
+    def test_uses_first_candidate_and_creates_it_once(self) -> None:
+        """Healthy primary backend should be created lazily and reused."""
+        backend = self._make()
+        for _ in range(5):
+            backend.play(Sound.OK, b"data")
+        assert self.log == ["primary"] * 5
+        assert len(self.created) == 1
+        backend.close()
+
+    def test_concurrent_first_plays_create_one_backend(self) -> None:
+        """Threads racing to play first should share one backend instance."""
+        backend = self._make()
+        barrier = threading.Barrier(8)
+
+        def play() -> None:
+            barrier.wait()
+            for _ in range(50):
+                backend.play(Sound.OK, b"data")
+
+        threads = [threading.Thread(target=play) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(self.created) == 1
+        assert self.log == ["primary"] * 400
+        backend.close()
+
+    def test_done_is_set_for_backends_without_completion(self) -> None:
+        """done should be set once a non-signalling backend has started."""
+        backend = self._make()
+        done = threading.Event()
+
+        backend.play(Sound.OK, b"data", done=done)
+
+        assert done.is_set()
+        assert self.log == ["primary"]
+        backend.close()
+
+    def test_done_is_forwarded_to_signalling_backends(self) -> None:
+        """Backends that signal completion should get the done object."""
+        received: list[object] = []
+
+        class _Signalling(_FakeBackend):
+            signals_completion = True
+
+            def play(self, sound: Sound, data: bytes, **kwargs: object) -> None:
+                received.append(kwargs.get("done"))
+
+        backend = ResilientBackend(
+            [("s", lambda: _Signalling("s", self.log, self.broken))]
+        )
+        done = threading.Event()
+
+        backend.play(Sound.OK, b"data", done=done)
+
+        assert received == [done]
+        assert not done.is_set()
+        backend.close()
+
+    def test_play_stream_needs_a_streaming_backend(self) -> None:
+        """Streaming a large file on a backend that cannot should raise."""
+        backend = self._make()
+        done = threading.Event()
+        fmt = PcmFormat(rate=8000, channels=1, width=2)
+        stream = PcmStream(Path("long.wav"), fmt, 8000, None, lambda: iter(()))
+        with pytest.raises(StreamingUnsupported):
+            backend.play_stream(stream, done=done)
+        assert done.is_set()
+        assert self.log == []
+        backend.close()
+
+    def test_play_stream_plays_small_files_whole(self) -> None:
+        """A small file should be played like a sound if streaming is not possible."""
+        backend = self._make()
+        done = threading.Event()
+        fmt = PcmFormat(rate=8000, channels=1, width=2)
+        stream = PcmStream(Path("short.wav"), fmt, 80, b"wav", lambda: iter(()))
+        backend.play_stream(stream, done=done)
+        assert done.is_set()
+        assert self.log == ["primary"]
+        backend.close()
+
+    def test_skips_unavailable_candidates(self) -> None:
+        """ImportError from a factory should mark the candidate unavailable."""
+
+        def missing() -> _FakeBackend:
+            raise ImportError("not installed")
+
+        backend = ResilientBackend(
+            [("missing", missing), ("fallback", self._factory("fb", self.broken))]
+        )
+        backend.play(Sound.OK, b"data")
+        assert self.log == ["fb"]
+        assert [s.state for s in backend.status()] == ["unavailable", "closed"]
+
+    def test_opens_circuit_and_fails_over(self) -> None:
+        """After the threshold, sounds should go straight to the next backend."""
+        backend = self._make(failure_threshold=3, backoff=60.0)
+        self.broken.set()
+        for _ in range(6):
+            backend.play(Sound.OK, b"data")
+        assert self.log == ["primary"] * 3 + ["fallback"] * 3
+        assert backend.status()[0].state == "open"
+        assert backend.active_name == "fallback"
+        assert self.created[0].closed
+        backend.close()
+
+    def test_after_fork_keeps_resettable_backends(self) -> None:
+        """after_fork should reset backends that can, and drop the others."""
+        backend = self._make()
+        backend.play(Sound.OK, b"data")
+        primary = self.created[0]
+        primary.after_fork = lambda: self.log.append("after_fork")  # type: ignore[attr-defined]
+
+        backend.after_fork()
+        backend.play(Sound.OK, b"data")
+        assert self.log == ["primary", "after_fork", "primary"]
+        assert len(self.created) == 1
+
+        del primary.after_fork
+        backend.after_fork()
+        backend.play(Sound.OK, b"data")
+        assert len(self.created) == 2
+        assert not primary.closed
+
+    def test_after_fork_closes_open_circuits(self) -> None:
+        """Probe threads do not survive fork, so open circuits are retried."""
+        backend = self._make(failure_threshold=1, backoff=60.0)
+        self.broken.set()
+        backend.play(Sound.OK, b"data")
+        assert backend.status()[0].state == "open"
+
+        backend.after_fork()
+
+        assert [s.state for s in backend.status()] == ["idle", "idle"]
+        self.broken.clear()
+        backend.play(Sound.OK, b"data")
+        assert self.log == ["primary", "primary"]
+        backend.close()
+
+    def test_success_resets_failure_count(self) -> None:
+        """Failures must be consecutive to open the circuit."""
+        backend = self._make(failure_threshold=3)
+        for _ in range(5):
+            self.broken.set()
+            backend.play(Sound.OK, b"data")
+            backend.play(Sound.OK, b"data")
+            self.broken.clear()
+            backend.play(Sound.OK, b"data")
+        assert set(self.log) == {"primary"}
+        assert backend.status()[0].failures == 0
+
+    def test_last_resort_never_opens(self) -> None:
+        """The last candidate should keep being used even when failing."""
+        backend = self._make(failure_threshold=1, backoff=60.0)
+        self.broken.set()
+        self.fallback_broken.set()
+        for _ in range(4):
+            backend.play(Sound.OK, b"data")
+        assert self.log == ["primary"] + ["fallback"] * 3
+        assert backend.status()[1].state == "closed"
+        backend.close()
+
+    def test_reprobes_and_recovers(self) -> None:
+        """A background probe should restore the primary once it works."""
+        backend = self._make(failure_threshold=1, backoff=0.01)
+        self.broken.set()
+        backend.play(Sound.OK, b"data")
+        assert backend.active_name == "fallback"
+
+        self.broken.clear()
+        _wait_for(lambda: backend.status()[0].state == "closed")
+        self.log.clear()
+        backend.play(Sound.OK, b"data")
+        assert self.log == ["primary"]
+        backend.close()
+
+    def test_backoff_grows_while_probes_fail(self) -> None:
+        """Failed probes should back off exponentially up to the maximum."""
+        backend = self._make(failure_threshold=1, backoff=0.01, max_backoff=0.04)
+        self.broken.set()
+        backend.play(Sound.OK, b"data")
+        _wait_for(lambda: backend.status()[0].backoff == pytest.approx(0.04))
+        assert backend.status()[0].state == "open"
+        backend.close()
+
+    def test_synchronous_exception_counts_and_propagates(self) -> None:
+        """Exceptions raised by play() should be recorded and re-raised."""
+
+        class Raising(_FakeBackend):
+            def play(self, sound: Sound, data: bytes, *, block: bool = False) -> None:
+                raise RuntimeError("boom")
+
+        backend = ResilientBackend(
+            [
+                ("raising", lambda: Raising("r", self.log, self.broken)),
+                ("fallback", self._factory("fallback", self.broken)),
+            ],
+            failure_threshold=2,
+            backoff=60.0,
+        )
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                backend.play(Sound.OK, b"data")
+        assert backend.active_name == "fallback"
+        backend.close()
@@ -1,15 +1,18 @@
 """Tests for WAV loader."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from beep_lite.loader import (
     SoundNotFoundError,
+    cache_stats,
     clear_cache,
     load_wav,
     preload_all,
 )
+from beep_lite.pcm_cache import load_pcm
 from beep_lite.types import Sound
 
 
@@ -77,6 +80,25 @@ class TestLoadWav:
         # read_bytes should only be called once due to caching
         assert mock_asset.read_bytes.call_count == 1
 
+    def test_load_wav_is_consistent_across_threads(self) -> None:
+        """Threads loading a sound at once should all get the same object."""
+        barrier = threading.Barrier(8)
+        results: list[bytes] = []
+
+        def load() -> None:
+            barrier.wait()
+            results.append(load_wav(Sound.CRIT))
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+        assert load_wav(Sound.CRIT) is results[0]
+
 
 class TestClearCache:
     """Test clear_cache function."""
@@ -102,6 +124,50 @@ class TestClearCache:
         assert mock_asset.read_bytes.call_count == 2
 
 
+class TestContentSharing:
+    """Test that identical WAV contents are stored once."""
+
+    @patch("beep_lite.loader.resources.files")
+    def test_identical_files_share_one_buffer(self, mock_files: MagicMock) -> None:
+        """Sounds with byte-identical files should get the same bytes object."""
+        mock_asset = MagicMock()
+        mock_asset.read_bytes.side_effect = lambda: bytes(bytearray(b"same tone"))
+        mock_files.return_value.__truediv__.return_value.__truediv__.return_value = (
+            mock_asset
+        )
+
+        assert load_wav(Sound.OK) is load_wav(Sound.SCAN_NG)
+
+    def test_cache_stats_reports_sharing(self) -> None:
+        """cache_stats should count shared WAV and PCM bytes as saved."""
+        real = load_wav(Sound.OK)
+        load_pcm(real)
+        before = cache_stats()
+        assert before.sounds == 1
+        assert before.buffers == 1
+        assert before.wav_bytes == len(real)
+        assert before.pcm_bytes > 0
+        assert before.saved_bytes == 0
+
+        # An alias of the same audio under another name
+        copy = real[:1] + real[1:]
+        mock_asset = MagicMock()
+        mock_asset.read_bytes.return_value = copy
+        with patch("beep_lite.loader.resources.files") as mock_files:
+            assets = mock_files.return_value.__truediv__.return_value
+            assets.__truediv__.return_value = mock_asset
+            alias = load_wav(Sound.MOO)
+        assert alias is real
+        load_pcm(alias)
+
+        after = cache_stats()
+        assert after.sounds == 2
+        assert after.buffers == 1
+        assert after.wav_bytes == before.wav_bytes
+        assert after.pcm_bytes == before.pcm_bytes
+        assert after.saved_bytes == before.wav_bytes + before.pcm_bytes
+
+
 class TestPreloadAll:
     """Test preload_all function."""
 
@@ -0,0 +1,77 @@
+"""Tests for the bundled sound manifest."""
+
+import json
+import wave
+from importlib import resources
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import beep_lite
+from beep_lite.manifest import MANIFEST_NAME, build_manifest, info, write_manifest
+from beep_lite.types import Sound
+
+ASSETS = Path(str(resources.files("beep_lite") / "assets"))
+
+
+class TestManifest:
+    """Test manifest generation and lookups."""
+
+    def test_committed_manifest_is_up_to_date(self) -> None:
+        """The shipped manifest should match the assets it describes."""
+        shipped = json.loads((ASSETS / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+        assert shipped == build_manifest(ASSETS)
+
+    def test_every_sound_is_described(self) -> None:
+        """Each Sound should have a manifest entry."""
+        for sound in Sound:
+            assert info(sound).frames > 0
+
+    @pytest.mark.parametrize("sound", list(Sound))
+    def test_entries_match_wav_headers(self, sound: Sound) -> None:
+        """Manifest fields should agree with the WAV file itself."""
+        entry = info(sound)
+        with wave.open(str(ASSETS / f"{sound.value}.wav"), "rb") as reader:
+            assert entry.rate == reader.getframerate()
+            assert entry.channels == reader.getnchannels()
+            assert entry.width == reader.getsampwidth()
+            assert entry.frames == reader.getnframes()
+        assert entry.duration == entry.frames / entry.rate
+
+    def test_write_manifest(self, tmp_path: Path) -> None:
+        """write_manifest should produce a manifest for a custom assets dir."""
+        with wave.open(str(tmp_path / "tone.wav"), "wb") as writer:
+            writer.setnchannels(2)
+            writer.setsampwidth(2)
+            writer.setframerate(8000)
+            writer.writeframes(b"\x00" * 4 * 4000)
+
+        path = write_manifest(tmp_path)
+
+        entry = json.loads(path.read_text(encoding="utf-8"))["sounds"]["tone"]
+        assert entry["channels"] == 2
+        assert entry["frames"] == 4000
+        assert entry["duration"] == 0.5
+
+
+class TestDuration:
+    """Test the public duration() API."""
+
+    def test_known_durations(self) -> None:
+        """duration() should return the length of the bundled sounds."""
+        assert beep_lite.duration(Sound.OK) == pytest.approx(0.08)
+        assert beep_lite.duration(Sound.CRIT) == pytest.approx(0.21)
+        assert beep_lite.duration(Sound.SCAN_OK) == pytest.approx(0.05)
+
+    def test_duration_does_not_touch_audio(self) -> None:
+        """duration() should not load or decode any WAV data."""
+        with (
+            patch("beep_lite.loader.load_wav") as mock_load,
+            patch("wave.open") as mock_open,
+        ):
+            beep_lite.duration(Sound.NG)
+
+        mock_load.assert_not_called()
+        mock_open.assert_not_called()
@@ -0,0 +1,119 @@
+"""Tests for PCM decoding and conversion."""
+
+from array import array
+
+import pytest
+
+from beep_lite.loader import load_wav
+from beep_lite.pcm import (
+    Pcm,
+    PcmFormat,
+    convert,
+    decode_wav,
+    from_samples,
+    output_format,
+    parse_format,
+    silence,
+    silent_wav,
+    to_samples,
+)
+from beep_lite.types import Sound
+
+MONO16 = PcmFormat(rate=16000, channels=1, width=2)
+
+
+def _samples(pcm: Pcm) -> list[int]:
+    values = array("h")
+    values.frombytes(bytes(pcm.frames))
+    return list(values)
+
+
+class TestDecode:
+    """Test decode_wav and silent_wav."""
+
+    @pytest.mark.parametrize("sound", list(Sound))
+    def test_bundled_sounds_decode(self, sound: Sound) -> None:
+        """All bundled sounds should be 16 kHz mono 16-bit."""
+        pcm = decode_wav(load_wav(sound))
+        assert pcm.format == MONO16
+        assert 0 < pcm.duration < 1
+
+    def test_silent_wav_round_trips(self) -> None:
+        """silent_wav should produce a decodable file of zero samples."""
+        pcm = decode_wav(silent_wav(MONO16, 0.01))
+        assert pcm.format == MONO16
+        assert set(pcm.frames) == {0}
+        assert pcm.duration == pytest.approx(0.01)
+
+    def test_silence_is_midscale_for_8_bit(self) -> None:
+        """Unsigned 8-bit silence should be 0x80, wider formats zero."""
+        assert silence(PcmFormat(rate=8000, channels=2, width=1), 3) == b"\x80" * 6
+        assert silence(MONO16, 2) == b"\x00" * 4
+
+    @pytest.mark.parametrize("width", [1, 2, 3, 4])
+    def test_samples_round_trip(self, width: int) -> None:
+        """to_samples and from_samples should invert each other, clipping."""
+        values = [0.0, 0.5, -0.5, -1.0]
+        frames = from_samples([*values, 2.0], width)
+        decoded = to_samples(frames, width)
+        assert decoded[:4] == pytest.approx(values, abs=1 / 128)
+        assert decoded[4] == pytest.approx(1.0, abs=1 / 64)
+
+
+class TestConvert:
+    """Test format conversion."""
+
+    def test_same_format_is_identity(self) -> None:
+        """Converting to the same format should return the input."""
+        pcm = Pcm(MONO16, b"\x01\x00")
+        assert convert(pcm, MONO16) is pcm
+
+    def test_upsample_keeps_duration(self) -> None:
+        """Resampling should keep the duration and the endpoints."""
+        pcm = decode_wav(load_wav(Sound.CRIT))
+        converted = convert(pcm, PcmFormat(rate=48000, channels=1, width=2))
+        assert converted.duration == pytest.approx(pcm.duration, abs=1e-3)
+        assert _samples(converted)[0] == _samples(pcm)[0]
+        assert _samples(converted)[-1] == _samples(pcm)[-1]
+
+    def test_mono_to_stereo_duplicates(self) -> None:
+        """Mono should be duplicated into every output channel."""
+        pcm = Pcm(MONO16, array("h", [100, -200]).tobytes())
+        stereo = convert(pcm, PcmFormat(rate=16000, channels=2, width=2))
+        assert _samples(stereo) == [100, 100, -200, -200]
+
+    def test_stereo_to_mono_averages(self) -> None:
+        """Stereo should be averaged down to mono."""
+        pcm = Pcm(PcmFormat(16000, 2, 2), array("h", [100, 300, -100, -300]).tobytes())
+        assert _samples(convert(pcm, MONO16)) == [200, -200]
+
+    @pytest.mark.parametrize("width", [1, 3, 4])
+    def test_width_round_trip(self, width: int) -> None:
+        """Converting width and back should stay within one 8-bit step."""
+        pcm = Pcm(MONO16, array("h", [0, 16384, -16384, 32767]).tobytes())
+        back = convert(convert(pcm, PcmFormat(16000, 1, width)), MONO16)
+        tolerance = 256 if width == 1 else 1
+        for a, b in zip(_samples(back), _samples(pcm), strict=True):
+            assert abs(a - b) <= tolerance
+
+
+class TestFormats:
+    """Test output format configuration."""
+
+    def test_parse_format_defaults(self) -> None:
+        """Channels and width should default to mono 16-bit."""
+        assert parse_format("48000") == PcmFormat(48000, 1, 2)
+        assert parse_format("44100:2") == PcmFormat(44100, 2, 2)
+        assert parse_format("8000:1:1") == PcmFormat(8000, 1, 1)
+
+    @pytest.mark.parametrize("text", ["", "abc", "0", "48000:2:5", "1:2:3:4"])
+    def test_parse_format_rejects_invalid(self, text: str) -> None:
+        """Invalid specifications should raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_format(text)
+
+    def test_output_format_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """BEEP_LITE_OUTPUT_FORMAT should be parsed when set."""
+        assert output_format() is None
+        monkeypatch.setenv("BEEP_LITE_OUTPUT_FORMAT", "48000:2")
+        assert output_format() == PcmFormat(48000, 2, 2)
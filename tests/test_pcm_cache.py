@@ -0,0 +1,180 @@
+"""Tests for the persistent PCM cache."""
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from beep_lite import pcm_cache
+from beep_lite._version import __version__
+from beep_lite.loader import clear_cache, load_wav
+from beep_lite.pcm import PcmFormat, decode_wav
+from beep_lite.types import Sound
+
+STEREO48 = PcmFormat(rate=48000, channels=2, width=2)
+_HEADER_SIZE = 16
+
+
+def _entries() -> list[Path]:
+    return sorted(pcm_cache.cache_dir().glob("*/pcm/*.pcm"))
+
+
+class TestLoadPcm:
+    """Test load_pcm."""
+
+    def test_native_entry_is_written_and_matches_decode(self) -> None:
+        """A miss should decode, write one entry and return the same frames."""
+        data = load_wav(Sound.OK)
+        pcm = pcm_cache.load_pcm(data)
+        assert bytes(pcm.frames) == decode_wav(data).frames
+        entries = _entries()
+        assert len(entries) == 1
+        assert entries[0].parent.parent.name == __version__
+        assert entries[0].name.endswith("-native.pcm")
+
+    def test_entry_is_keyed_by_content_hash_and_format(self) -> None:
+        """Different target formats should get different entries."""
+        data = load_wav(Sound.OK)
+        pcm_cache.load_pcm(data)
+        pcm_cache.load_pcm(data, STEREO48)
+        names = [p.name for p in _entries()]
+        assert len(names) == 2
+        assert len({name.split("-")[0] for name in names}) == 1
+
+    def test_fresh_process_maps_instead_of_decoding(self) -> None:
+        """With a warm disk cache, nothing should be decoded or converted."""
+        data = load_wav(Sound.CRIT)
+        first = pcm_cache.load_pcm(data, STEREO48)
+        pcm_cache.clear_memory()  # simulate a restart
+
+        with (
+            patch("beep_lite.pcm_cache.decode_wav") as decode,
+            patch("beep_lite.pcm_cache.convert") as convert,
+        ):
+            second = pcm_cache.load_pcm(data, STEREO48)
+        decode.assert_not_called()
+        convert.assert_not_called()
+        assert isinstance(second.frames, memoryview)
+        assert second.format == STEREO48
+        assert bytes(second.frames) == bytes(first.frames)
+
+    def test_memory_cache_returns_same_object(self) -> None:
+        """Repeated lookups in one process should not touch the disk."""
+        data = load_wav(Sound.OK)
+        first = pcm_cache.load_pcm(data)
+        with patch("beep_lite.pcm_cache._read_entry") as read:
+            assert pcm_cache.load_pcm(data) is first
+        read.assert_not_called()
+
+    def test_corrupt_entry_is_rebuilt(self) -> None:
+        """An entry with a bad header should be ignored and rewritten."""
+        data = load_wav(Sound.OK)
+        pcm_cache.load_pcm(data)
+        (entry,) = _entries()
+        entry.write_bytes(b"garbage")
+        pcm_cache.clear_memory()
+        assert bytes(pcm_cache.load_pcm(data).frames) == decode_wav(data).frames
+
+    def test_disk_cache_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """BEEP_LITE_DISK_CACHE=0 should keep everything in memory."""
+        monkeypatch.setenv(pcm_cache.DISK_CACHE_ENV, "0")
+        pcm_cache.load_pcm(load_wav(Sound.OK))
+        assert _entries() == []
+
+    def test_least_recently_used_entries_are_pruned(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Beyond MAX_DISK_BYTES the entry used longest ago should go first."""
+        datas = {sound: load_wav(sound) for sound in (Sound.OK, Sound.CRIT, Sound.NG)}
+        paths = {
+            sound: pcm_cache._entry_path(hashlib.sha256(data).hexdigest(), None)
+            for sound, data in datas.items()
+        }
+        pcm_cache.load_pcm(datas[Sound.OK])
+        pcm_cache.load_pcm(datas[Sound.CRIT])
+        os.utime(paths[Sound.OK], ns=(1, 1))
+        os.utime(paths[Sound.CRIT], ns=(2, 2))
+        pcm_cache.clear_memory()
+        pcm_cache.load_pcm(datas[Sound.OK])  # read from disk: now the newest
+        kept = 2 * _HEADER_SIZE + sum(
+            len(decode_wav(datas[sound]).frames) for sound in (Sound.OK, Sound.NG)
+        )
+        monkeypatch.setattr(pcm_cache, "MAX_DISK_BYTES", kept)
+
+        pcm_cache.load_pcm(datas[Sound.NG])
+
+        assert _entries() == sorted([paths[Sound.OK], paths[Sound.NG]])
+
+    @patch("beep_lite.pcm_cache._write_entry", side_effect=PermissionError)
+    def test_unwritable_cache_is_not_fatal(self, mock_write: MagicMock) -> None:
+        """A read-only cache directory should only cost the disk layer."""
+        data = load_wav(Sound.OK)
+        assert bytes(pcm_cache.load_pcm(data).frames) == decode_wav(data).frames
+
+
+class TestPack:
+    """Test pack."""
+
+    def test_entries_become_views_of_one_read_only_arena(self) -> None:
+        """Packed PCM should be read-only slices of a single mmap."""
+        datas = [load_wav(sound) for sound in Sound]
+        size = pcm_cache.pack(datas)
+
+        pcms = [pcm_cache.load_pcm(data) for data in datas]
+        arenas = {id(pcm.frames.obj) for pcm in pcms}
+        assert len(arenas) == 1
+        assert isinstance(pcms[0].frames.obj, mmap.mmap)
+        assert all(pcm.frames.readonly for pcm in pcms)
+        assert size == sum(pcm_cache.memory_usage().values())
+        for data, pcm in zip(datas, pcms, strict=True):
+            assert bytes(pcm.frames) == decode_wav(data).frames
+
+    def test_identical_audio_is_packed_once(self) -> None:
+        """The same WAV data should take up space in the arena only once."""
+        data = load_wav(Sound.OK)
+        size = pcm_cache.pack([data, data], STEREO48)
+        assert size == len(pcm_cache.load_pcm(data, STEREO48).frames)
+
+    def test_nothing_to_pack(self) -> None:
+        """An empty input should not create an arena."""
+        assert pcm_cache.pack([]) == 0
+
+
+class TestCacheDir:
+    """Test cache directory resolution."""
+
+    @patch("beep_lite.pcm_cache.sys.platform", "linux")
+    def test_xdg_cache_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without an override the XDG cache directory should be used."""
+        monkeypatch.delenv(pcm_cache.CACHE_DIR_ENV)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert pcm_cache.cache_dir() == tmp_path / "beep_lite"
+
+
+class TestPurge:
+    """Test clear_cache(disk=True)."""
+
+    def test_clear_cache_keeps_disk_by_default(self) -> None:
+        """clear_cache() should only drop in-memory caches."""
+        pcm_cache.load_pcm(load_wav(Sound.OK))
+        clear_cache()
+        assert len(_entries()) == 1
+
+    def test_clear_cache_disk_purges_entries(self) -> None:
+        """clear_cache(disk=True) should delete the on-disk entries."""
+        pcm_cache.load_pcm(load_wav(Sound.OK))
+        other_version = pcm_cache.cache_dir() / "0.0.1" / "pcm"
+        other_version.mkdir(parents=True)
+        (other_version / "x.pcm").write_bytes(b"")
+        unrelated = pcm_cache.cache_dir() / "keep.txt"
+        unrelated.write_text("not ours")
+
+        clear_cache(disk=True)
+
+        assert _entries() == []
+        assert unrelated.exists()
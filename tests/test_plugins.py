@@ -0,0 +1,234 @@
+"""Tests for entry-point backend plugins."""
+
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from beep_lite import core, plugins
+from beep_lite.health import ResilientBackend
+from beep_lite.loader import load_wav
+from beep_lite.types import Sound
+
+_PLUGIN = '''
+from beep_lite.backends.null_backend import NullBackend
+
+
+class NetSpeakerBackend(NullBackend):
+    """Stand-in for a network speaker client."""
+
+    priority = 15
+    platforms = ("linux", "win32")
+
+
+class BuzzerBackend:
+    """A plugin written against the original play(sound, data) protocol."""
+
+    priority = "soon"
+
+    def __init__(self):
+        self.played = []
+
+    def play(self, sound, data):
+        self.played.append(sound)
+
+    def is_available(self):
+        return True
+
+
+class LegacyBackend(BuzzerBackend):
+    priority = 60
+
+
+class ComputedBackend(NullBackend):
+    priority = int("7")
+'''
+
+_ENTRY_POINTS = """[beep_lite.backends]
+netspeaker = acme_beep_plugin:NetSpeakerBackend
+relay = acme_beep_missing:RelayBackend
+bad:soon = acme_beep_plugin:NetSpeakerBackend
+buzzer = acme_beep_plugin:BuzzerBackend
+legacy = acme_beep_plugin:LegacyBackend
+computed = acme_beep_plugin:ComputedBackend
+"""
+
+
+def _install(site: Path, dist: str, entry_points: str) -> None:
+    info = site / f"{dist}-1.0.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {dist}\nVersion: 1.0\n", encoding="utf-8"
+    )
+    (info / "entry_points.txt").write_text(entry_points, encoding="utf-8")
+    # Make sure the directory looks modified even on coarse-mtime filesystems.
+    stat = site.stat()
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def site(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """A site directory on sys.path with one plugin distribution installed."""
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "acme_beep_plugin.py").write_text(_PLUGIN, encoding="utf-8")
+    _install(site, "acme_beep", _ENTRY_POINTS)
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.delenv(plugins.PLUGINS_ENV, raising=False)
+    monkeypatch.setattr(plugins, "_discovered", None)
+    yield site
+    sys.modules.pop("acme_beep_plugin", None)
+
+
+class TestDiscover:
+    """Test discover()."""
+
+    def test_reads_metadata_from_the_factory(self, site: Path) -> None:
+        """Priority and platforms come from attributes of the factory."""
+        found = plugins.discover()
+        assert found == [
+            plugins.PluginInfo(
+                "netspeaker",
+                "acme_beep_plugin:NetSpeakerBackend",
+                15,
+                ("linux", "win32"),
+            ),
+            plugins.PluginInfo("relay", "acme_beep_missing:RelayBackend"),
+            plugins.PluginInfo("legacy", "acme_beep_plugin:LegacyBackend", 60),
+        ]
+
+    def test_discovery_imports_nothing(self, site: Path) -> None:
+        """Metadata should be read from the source, even inside packages."""
+        package = site / "acme_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("raise RuntimeError('imported')\n")
+        (package / "speaker.py").write_text(
+            "class Speaker:\n    priority: int = 5\n    platforms = 'linux'\n"
+        )
+        _install(
+            site, "acme_pkg", "[beep_lite.backends]\nspk = acme_pkg.speaker:Speaker\n"
+        )
+
+        found = plugins.discover(refresh=True)
+
+        assert found[0] == plugins.PluginInfo(
+            "spk", "acme_pkg.speaker:Speaker", 5, ("linux",)
+        )
+        assert "acme_beep_plugin" not in sys.modules
+        assert "acme_pkg" not in sys.modules
+
+    def test_cache_survives_changes_to_the_working_directory(
+        self, site: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files written to the working directory should not force a rescan."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend("")
+        key = plugins._path_key()
+        (tmp_path / "report.txt").write_text("written")
+        os.utime(tmp_path, ns=(0, 0))
+        assert plugins._path_key() == key
+
+    def test_platform_filter(self) -> None:
+        """Plugins should only be offered on their platforms."""
+        info = plugins.PluginInfo("x", "m:a", platforms=("linux", "win32"))
+        assert info.supports("linux")
+        assert not info.supports("darwin")
+        assert plugins.PluginInfo("x", "m:a").supports("darwin")
+
+    def test_later_processes_use_the_cache(self, site: Path) -> None:
+        """A fresh process should not scan the installed distributions."""
+        found = plugins.discover()
+        plugins._discovered = None
+        sys.modules.pop("acme_beep_plugin", None)
+        with patch.object(plugins, "_scan", side_effect=AssertionError("scanned")):
+            assert plugins.discover() == found
+        assert "acme_beep_plugin" not in sys.modules
+
+    def test_installing_a_package_invalidates_the_cache(self, site: Path) -> None:
+        """A changed site directory should trigger a new scan."""
+        plugins.discover()
+        plugins._discovered = None
+        _install(
+            site, "other_beep", "[beep_lite.backends]\nother = other_beep:Backend\n"
+        )
+        assert "other" in [info.name for info in plugins.discover()]
+
+    def test_can_be_disabled(self, site: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """BEEP_LITE_PLUGINS=0 should turn discovery off."""
+        monkeypatch.setenv(plugins.PLUGINS_ENV, "0")
+        assert plugins.discover() == []
+
+    def test_import_does_not_read_entry_points(self) -> None:
+        """import beep_lite should not pay for importlib.metadata."""
+        code = "import sys, beep_lite; print('importlib.metadata' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestPluginCandidates:
+    """Test plugins among the backend candidates."""
+
+    @patch("beep_lite.core.sys.platform", "linux")
+    def test_placed_by_priority(self, site: Path) -> None:
+        """Plugins should be ordered among the built-ins by priority."""
+        names = [name for name, _ in core._backend_candidates()]
+        assert names == [
+            "netspeaker",
+            "simpleaudio",
+            "pipe",
+            "relay",
+            "legacy",
+            "fallback",
+        ]
+
+    @patch("beep_lite.core.sys.platform", "darwin")
+    def test_other_platforms_skip_it(self, site: Path) -> None:
+        """A plugin for other platforms should not be a candidate."""
+        names = [name for name, _ in core._backend_candidates()]
+        assert names == ["simpleaudio", "relay", "legacy", "fallback"]
+
+    @patch("beep_lite.core.sys.platform", "linux")
+    def test_imported_only_when_selected(self, site: Path) -> None:
+        """Creating the backend should import the plugin and play through it."""
+        plugins.discover()
+        sys.modules.pop("acme_beep_plugin", None)
+        backend = ResilientBackend(core._backend_candidates())
+        assert "acme_beep_plugin" not in sys.modules
+
+        backend.play(Sound.OK, load_wav(Sound.OK))
+
+        assert backend.active_name == "netspeaker"
+        assert "acme_beep_plugin" in sys.modules
+        backend.close()
+
+    def test_missing_module_is_unavailable(self, site: Path) -> None:
+        """A plugin that cannot be imported should be skipped like ImportError."""
+        relay = next(info for info in plugins.discover() if info.name == "relay")
+        backend = ResilientBackend(
+            [("relay", plugins.factory(relay)), ("fallback", core._fallback_backend)]
+        )
+        assert backend.active_name == "fallback"
+        assert backend.status()[0].state == "unavailable"
+
+    def test_original_protocol_gets_no_new_keywords(self, site: Path) -> None:
+        """A play(sound, data) plugin should work, blocking and with done."""
+        legacy = next(info for info in plugins.discover() if info.name == "legacy")
+        backend = ResilientBackend(
+            [("legacy", plugins.factory(legacy)), ("fallback", core._fallback_backend)]
+        )
+        beeper = core.Beeper(backend)
+
+        beeper.play(Sound.OK)
+        beeper.play(Sound.NG, block=True, timeout=1.0)
+
+        assert backend.active_name == "legacy"
+        assert backend.status()[0].failures == 0
+        assert list(backend._slots[0].backend.played) == [Sound.OK, Sound.NG]
+        assert beeper.flush(timeout=1.0)
+        backend.close()
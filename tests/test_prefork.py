@@ -0,0 +1,149 @@
+"""Tests for pre-fork cache sharing and the after-fork reset."""
+
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from beep_lite import Beeper, Sound, loader, pcm_cache, prefork, scheduler
+from beep_lite.backends.null_backend import NullBackend
+
+
+class _PreparingBackend(NullBackend):
+    """Null backend recording prepared sounds and fork resets."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.prepared: list[Sound] = []
+        self.forks = 0
+
+    def prepare(self, sound: Sound, data: bytes) -> None:
+        self.prepared.append(sound)
+
+    def after_fork(self) -> None:
+        super().after_fork()
+        self.forks += 1
+
+
+class TestPrefork:
+    """Test prefork()."""
+
+    def test_packs_and_prepares_every_sound(self) -> None:
+        """All sounds should be packed into the arena and prepared."""
+        backend = _PreparingBackend()
+        size = prefork(Beeper(backend))
+
+        assert backend.prepared == list(Sound)
+        assert size == sum(pcm_cache.memory_usage().values())
+        pcm = pcm_cache.load_pcm(loader.load_wav(Sound.OK))
+        assert pcm.frames.readonly
+
+    def test_never_raises(self) -> None:
+        """Failures should be reported, not raised."""
+        backend = _PreparingBackend()
+        with (
+            patch.object(backend, "prepare", side_effect=OSError("no device")),
+            patch.object(pcm_cache, "pack", side_effect=ValueError("bad")),
+        ):
+            assert prefork(Beeper(backend)) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+class TestAfterFork:
+    """Test the state a forked child starts with."""
+
+    def _in_child(self, check) -> None:  # noqa: ANN001
+        """Run ``check`` in a forked child and fail if it fails or hangs."""
+        pid = os.fork()
+        if pid == 0:
+            signal.alarm(5)
+            code = 1
+            try:
+                check()
+                code = 0
+            except BaseException as e:
+                print(f"child check failed: {e!r}", file=sys.stderr)
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+    def test_child_gets_fresh_locks_scheduler_and_backend_state(self) -> None:
+        """Locks held by parent threads and parent threads must not leak in."""
+        backend = _PreparingBackend()
+        beeper = Beeper(backend)
+        prefork(beeper)
+        beeper.play(Sound.OK)
+        parent_scheduler = scheduler.get_scheduler()
+        release = threading.Event()
+        held = threading.Event()
+
+        def hold_locks() -> None:
+            with loader._lock, pcm_cache._lock, beeper._backend_lock:
+                held.set()
+                release.wait(10)
+
+        holder = threading.Thread(target=hold_locks)
+        holder.start()
+        assert held.wait(5)
+
+        def check() -> None:
+            assert backend.forks == 1
+            assert beeper._pending() == []
+            assert scheduler.get_scheduler() is not parent_scheduler
+            loader.clear_cache()
+            beeper.close()
+            beeper.play(Sound.OK, block=True)
+            assert beeper.flush(1.0)
+
+        try:
+            self._in_child(check)
+        finally:
+            release.set()
+            holder.join()
+        assert backend.forks == 0
+
+    def test_reset_without_importing_prefork(self) -> None:
+        """A plain import beep_lite should be enough for forked children."""
+        code = textwrap.dedent("""
+            import os, sys, threading, time
+            import beep_lite
+            from beep_lite.backends.null_backend import NullBackend
+
+            beeper = beep_lite.Beeper(NullBackend())
+            beeper.play(beep_lite.Sound.OK, block=True, timeout=1.0)
+            assert beep_lite.play_after(beep_lite.Sound.OK, 0.0) is not None
+            beep_lite.flush(1.0)
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    start = time.monotonic()
+                    beeper.play(beep_lite.Sound.OK, block=True, timeout=2.0)
+                    fired = threading.Event()
+                    beeper.play_after(beep_lite.Sound.OK, 0.0)
+                    beep_lite.scheduler.get_scheduler().call_later(0.0, fired.set)
+                    assert fired.wait(1.0), "scheduled call did not run"
+                    assert time.monotonic() - start < 1.0, "blocking play hung"
+                    code = 0
+                except BaseException as e:
+                    print(f"child check failed: {e!r}", file=sys.stderr)
+                finally:
+                    os._exit(code)
+            _, status = os.waitpid(pid, 0)
+            assert "beep_lite._prefork" not in sys.modules
+            sys.exit(os.waitstatus_to_exitcode(status))
+            """)
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", code],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,105 @@
+"""Tests for offline rendering."""
+
+import io
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from beep_lite import RenderJob, Sound, render, render_batch
+from beep_lite.loader import load_wav
+from beep_lite.manifest import duration
+from beep_lite.pcm import PcmFormat, decode_wav
+
+
+def _read(data: bytes) -> tuple[PcmFormat, bytes]:
+    pcm = decode_wav(data)
+    return pcm.format, bytes(pcm.frames)
+
+
+class TestRender:
+    """Test render()."""
+
+    def test_single_sound_matches_the_bundled_audio(self) -> None:
+        """Rendering a sound without options should keep its samples."""
+        assert _read(render(Sound.OK)) == _read(load_wav(Sound.OK))
+
+    def test_sequence_with_pause(self) -> None:
+        """Sounds and pauses should be concatenated in order."""
+        fmt, frames = _read(render([Sound.SCAN_OK, 0.1, Sound.SCAN_NG]))
+        _, scan_ok = _read(load_wav(Sound.SCAN_OK))
+        _, scan_ng = _read(load_wav(Sound.SCAN_NG))
+
+        pause = b"\x00" * (int(fmt.rate * 0.1) * fmt.frame_size)
+        assert frames == scan_ok + pause + scan_ng
+
+    def test_format_conversion(self) -> None:
+        """The output should be converted to the requested format."""
+        data = render(Sound.CRIT, fmt="48000:2:2")
+
+        with wave.open(io.BytesIO(data), "rb") as reader:
+            assert reader.getframerate() == 48000
+            assert reader.getnchannels() == 2
+            assert reader.getnframes() / 48000 == pytest.approx(
+                duration(Sound.CRIT), abs=0.001
+            )
+
+    def test_gain_scales_and_clips(self) -> None:
+        """Gain should scale samples and clip them to full scale."""
+        fmt = PcmFormat(rate=16000, channels=1, width=2)
+        _, quiet = _read(render(Sound.NG, gain=0.0, fmt=fmt))
+        _, loud = _read(render(Sound.NG, gain=100.0, fmt=fmt))
+
+        assert set(quiet) == {0}
+        samples = memoryview(loud).cast("h")
+        assert max(samples) == 32767
+        assert min(samples) == -32768
+
+    def test_writes_file(self, tmp_path: Path) -> None:
+        """path= should write the same bytes that are returned."""
+        path = tmp_path / "ok.wav"
+        data = render(Sound.OK, path=path)
+        assert path.read_bytes() == data
+
+    def test_invalid_arguments(self) -> None:
+        """Negative gain or pauses and formatless pauses should be rejected."""
+        with pytest.raises(ValueError, match="gain"):
+            render(Sound.OK, gain=-1.0)
+        with pytest.raises(ValueError, match="pause"):
+            render([Sound.OK, -0.1])
+        with pytest.raises(ValueError, match="fmt"):
+            render([0.5])
+        assert len(render([0.5], fmt="8000")) > 0
+
+
+class TestRenderBatch:
+    """Test render_batch()."""
+
+    def test_small_batch_renders_in_process(self, tmp_path: Path) -> None:
+        """Small sets should not start a process pool."""
+        jobs = {
+            tmp_path / "ok.wav": Sound.OK,
+            tmp_path / "alarm.wav": RenderJob([Sound.CRIT, 0.2, Sound.CRIT], 0.5),
+        }
+        with patch("concurrent.futures.ProcessPoolExecutor") as pool:
+            paths = render_batch(jobs)
+
+        pool.assert_not_called()
+        assert paths == list(jobs)
+        assert paths[0].read_bytes() == render(Sound.OK)
+        assert paths[1].read_bytes() == render([Sound.CRIT, 0.2, Sound.CRIT], gain=0.5)
+
+    def test_large_batch_uses_worker_processes(self, tmp_path: Path) -> None:
+        """Large sets should be rendered by a process pool, in order."""
+        jobs = {
+            tmp_path / f"{sound.value}_{rate}.wav": RenderJob(sound, fmt=str(rate))
+            for sound in Sound
+            for rate in (8000, 22050, 44100)
+        }
+
+        paths = render_batch(jobs, processes=2)
+
+        assert paths == list(jobs)
+        for path, job in jobs.items():
+            assert Path(path).read_bytes() == render(job.sounds, fmt=job.fmt)
@@ -0,0 +1,106 @@
+"""Tests for rate-limited failure reporting."""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from beep_lite import Sound, error_counts, ok, reporting, reset_error_counts
+from beep_lite.reporting import report_failure, set_log_interval
+
+logger = logging.getLogger("beep_lite.tests.reporting")
+
+
+class TestReportFailure:
+    """Test report_failure rate limiting and counting."""
+
+    def setup_method(self) -> None:
+        reset_error_counts()
+        set_log_interval(10.0)
+
+    def teardown_method(self) -> None:
+        reset_error_counts()
+        set_log_interval(10.0)
+
+    def test_logs_first_failure_and_suppresses_the_rest(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Only one record per kind should be emitted within the interval."""
+        with caplog.at_level(logging.WARNING):
+            for _ in range(100):
+                report_failure("test", OSError("gone"), logger, "failed: %s", "x")
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage() == "failed: x"
+
+    def test_next_record_carries_suppressed_count(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """After the interval the next record should summarize suppressions."""
+        with (
+            caplog.at_level(logging.WARNING),
+            patch("beep_lite.reporting.time.monotonic") as clock,
+        ):
+            clock.return_value = 0.0
+            for _ in range(5):
+                report_failure("test", OSError(), logger, "failed")
+            clock.return_value = 11.0
+            report_failure("test", OSError(), logger, "failed")
+        assert [r.getMessage() for r in caplog.records] == [
+            "failed",
+            "failed (suppressed 4 similar)",
+        ]
+
+    def test_kinds_are_rate_limited_independently(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Different sources or exception types should not suppress each other."""
+        with caplog.at_level(logging.WARNING):
+            report_failure("a", OSError(), logger, "a")
+            report_failure("b", OSError(), logger, "b")
+            report_failure("a", ValueError(), logger, "a2")
+        assert len(caplog.records) == 3
+
+    def test_message_is_not_formatted_when_suppressed(self) -> None:
+        """Suppressed failures must not touch the logger at all."""
+        mock_logger = MagicMock()
+        report_failure("test", OSError(), mock_logger, "failed")
+        report_failure("test", OSError(), mock_logger, "failed")
+        assert mock_logger.warning.call_count == 1
+
+    def test_zero_interval_logs_everything(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """set_log_interval(0) should disable rate limiting."""
+        set_log_interval(0)
+        with caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                report_failure("test", OSError(), logger, "failed")
+        assert len(caplog.records) == 3
+
+    def test_error_counts_and_reset(self) -> None:
+        """Every failure should be counted, logged or not."""
+        for _ in range(7):
+            report_failure("pipe", BrokenPipeError(), logger, "x")
+        report_failure("api", OSError(), logger, "x")
+        assert error_counts() == {"pipe:BrokenPipeError": 7, "api:OSError": 1}
+        reset_error_counts()
+        assert error_counts() == {}
+        assert reporting._windows == {}
+
+
+class TestApiReporting:
+    """Test that API failures are reported through the counter."""
+
+    def setup_method(self) -> None:
+        reset_error_counts()
+
+    def teardown_method(self) -> None:
+        reset_error_counts()
+
+    @patch("beep_lite.core.Beeper.play_sound", side_effect=RuntimeError("boom"))
+    def test_api_failures_are_counted(self, mock_play: MagicMock) -> None:
+        """Failed API calls should show up in error_counts()."""
+        for _ in range(3):
+            ok()
+        assert error_counts() == {"api:RuntimeError": 3}
+        mock_play.assert_called_with(Sound.OK)
@@ -0,0 +1,91 @@
+"""Tests for routing sounds to several outputs."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from beep_lite import Beeper, Router, Sound
+from beep_lite.backends.null_backend import NullBackend
+
+
+def _router(**latency: float) -> tuple[Router, dict[str, NullBackend]]:
+    backends = {name: NullBackend(latency=latency.get(name, 0.0)) for name in "abc"}
+    outputs = {name: Beeper(backend=backend) for name, backend in backends.items()}
+    return Router(outputs, default="c"), backends
+
+
+class TestRouter:
+    """Test Router rules and output isolation."""
+
+    def test_station_rule_then_sound_rule_then_default(self) -> None:
+        """Station rules should win over sound rules, which win over default."""
+        router, backends = _router()
+        router.route_station("station-1", "a")
+        router.route_sound(Sound.CRIT, "b")
+
+        router.play(Sound.OK, station="station-1")
+        router.play(Sound.CRIT, station="station-1")
+        router.play(Sound.CRIT, station="station-2")
+        router.play(Sound.OK)
+
+        assert list(backends["a"].played) == [Sound.OK, Sound.CRIT]
+        assert list(backends["b"].played) == [Sound.CRIT]
+        assert list(backends["c"].played) == [Sound.OK]
+
+    def test_removing_a_rule(self) -> None:
+        """Routing to None should remove the rule again."""
+        router, _ = _router()
+        router.route_sound(Sound.NG, "a")
+        router.route_sound(Sound.NG, None)
+
+        assert router.resolve(Sound.NG) is router.outputs["c"]
+
+    def test_without_default_uses_the_default_beeper(self) -> None:
+        """Unrouted sounds should go to the module-level default beeper."""
+        router = Router({"a": Beeper(backend=NullBackend())})
+
+        with patch("beep_lite.core._default.play") as mock_play:
+            router.play(Sound.WARN)
+
+        mock_play.assert_called_once_with(Sound.WARN, block=False, timeout=None)
+
+    def test_unknown_output_is_rejected(self) -> None:
+        """Rules and defaults must name an existing output."""
+        router, _ = _router()
+        with pytest.raises(KeyError):
+            router.route_station("station-1", "nope")
+        with pytest.raises(KeyError):
+            Router({}, default="nope")
+
+    def test_slow_output_does_not_hold_up_others(self) -> None:
+        """A blocking play on one output should not wait for a slow one."""
+        router, backends = _router(a=0.5)
+        router.route_station("slow", "a")
+        router.route_station("fast", "b")
+
+        router.play(Sound.CRIT, station="slow")
+        start = time.monotonic()
+        router.play(Sound.OK, station="fast", block=True)
+
+        assert time.monotonic() - start < 0.3
+        assert list(backends["b"].played) == [Sound.OK]
+
+    def test_flush_waits_for_every_output(self) -> None:
+        """flush() should cover sounds playing on any output."""
+        router, _ = _router()
+        router.route_sound(Sound.CRIT, "a")
+        router.route_sound(Sound.NG, "b")
+        router.play(Sound.CRIT)
+        router.play(Sound.NG)
+
+        assert router.flush(timeout=2.0)
+        assert all(not beeper._pending() for beeper in router.outputs.values())
+
+    def test_play_never_raises(self) -> None:
+        """Errors on an output should be reported, not raised."""
+        backend = NullBackend()
+        router = Router({"a": Beeper(backend=backend)}, default="a")
+
+        with patch.object(backend, "play", side_effect=RuntimeError("gone")):
+            router.play(Sound.OK)
@@ -0,0 +1,165 @@
+"""Tests for scheduled playback."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import beep_lite
+from beep_lite.scheduler import Scheduler
+from beep_lite.types import Sound
+
+
+class TestScheduler:
+    """Test the heap-based Scheduler."""
+
+    def test_runs_calls_in_due_order(self) -> None:
+        """Calls should run by due time, not insertion order."""
+        scheduler = Scheduler()
+        order: list[int] = []
+        done = threading.Event()
+        now = time.monotonic()
+
+        scheduler.call_at(now + 0.06, lambda: (order.append(3), done.set()))
+        scheduler.call_at(now + 0.02, lambda: order.append(1))
+        scheduler.call_at(now + 0.04, lambda: order.append(2))
+
+        assert done.wait(2.0)
+        assert order == [1, 2, 3]
+
+    def test_earlier_insert_wakes_worker(self) -> None:
+        """A new earliest deadline should not wait behind a later one."""
+        scheduler = Scheduler()
+        fired = threading.Event()
+
+        scheduler.call_later(10.0, lambda: None)
+        time.sleep(0.01)
+        start = time.monotonic()
+        scheduler.call_later(0.01, fired.set)
+
+        assert fired.wait(2.0)
+        assert time.monotonic() - start < 1.0
+
+    def test_cancel_prevents_call(self) -> None:
+        """A cancelled call should never run."""
+        scheduler = Scheduler()
+        ran = threading.Event()
+        done = threading.Event()
+
+        handle = scheduler.call_later(0.02, ran.set)
+        scheduler.call_later(0.05, done.set)
+
+        assert handle.cancel() is True
+        assert handle.cancelled
+        assert done.wait(2.0)
+        assert not ran.is_set()
+
+    def test_cancel_after_run_returns_false(self) -> None:
+        """cancel() should report that the call already ran."""
+        scheduler = Scheduler()
+        done = threading.Event()
+
+        handle = scheduler.call_later(0.0, done.set)
+
+        assert done.wait(2.0)
+        time.sleep(0.01)
+        assert handle.cancel() is False
+        assert not handle.pending
+        assert not handle.cancelled
+
+    def test_many_pending_calls_use_one_thread(self) -> None:
+        """Thousands of pending calls should share a single worker thread."""
+        scheduler = Scheduler(name="beep-lite-test-scheduler")
+        handles = [scheduler.call_later(60.0 + i, lambda: None) for i in range(5000)]
+
+        workers = [
+            t for t in threading.enumerate() if t.name == "beep-lite-test-scheduler"
+        ]
+        assert len(workers) == 1
+        assert len(scheduler) == 5000
+
+        for handle in handles:
+            handle.cancel()
+        assert len(scheduler) == 0
+        # Tombstones are compacted rather than kept until their due time.
+        assert len(scheduler._heap) < 5000
+
+    def test_concurrent_calls_all_run(self) -> None:
+        """Calls added from many threads at once should all run on time."""
+        scheduler = Scheduler()
+        scheduler.call_later(60.0, lambda: None)
+        ran = threading.Semaphore(0)
+        barrier = threading.Barrier(8)
+
+        def add() -> None:
+            barrier.wait()
+            for i in range(200):
+                scheduler.call_later(0.001 * (i % 5), ran.release)
+
+        threads = [threading.Thread(target=add) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        deadline = time.monotonic() + 2.0
+        for _ in range(8 * 200):
+            assert ran.acquire(timeout=max(0.0, deadline - time.monotonic()))
+        assert len(scheduler) == 1
+
+    def test_callback_exception_is_reported(self) -> None:
+        """A failing callback should be reported and not stop the worker."""
+        scheduler = Scheduler()
+        done = threading.Event()
+
+        def _boom() -> None:
+            raise RuntimeError("boom")
+
+        with patch("beep_lite.scheduler.report_failure") as mock_report:
+            scheduler.call_later(0.0, _boom)
+            scheduler.call_later(0.01, done.set)
+            assert done.wait(2.0)
+
+        mock_report.assert_called_once()
+        assert mock_report.call_args.args[0] == "scheduler"
+
+
+class TestPlayAt:
+    """Test play_at / play_after."""
+
+    def test_play_after_plays_sound(self) -> None:
+        """play_after should play the sound on the scheduler thread."""
+        played = threading.Event()
+        with patch(
+            "beep_lite.core.Beeper.play_sound", side_effect=lambda s, **kw: played.set()
+        ) as mock_play:
+            handle = beep_lite.play_after(Sound.OK, 0.01)
+            assert played.wait(2.0)
+
+        mock_play.assert_called_once_with(Sound.OK, enqueued=handle.when)
+
+    def test_play_at_cancel(self) -> None:
+        """A cancelled play_at handle should not play."""
+        with patch("beep_lite.core.Beeper.play_sound") as mock_play:
+            handle = beep_lite.play_at(Sound.CRIT, time.monotonic() + 0.05)
+            assert handle.cancel() is True
+            time.sleep(0.1)
+
+        mock_play.assert_not_called()
+
+    def test_play_after_never_raises(self) -> None:
+        """Playback errors from scheduled sounds should be swallowed."""
+        played = threading.Event()
+
+        def _fail(sound: Sound, **kwargs: float) -> None:
+            played.set()
+            raise RuntimeError("device gone")
+
+        with (
+            patch("beep_lite.core.Beeper.play_sound", side_effect=_fail),
+            patch("beep_lite.core.report_failure") as mock_report,
+        ):
+            beep_lite.play_after(Sound.NG, 0.0)
+            assert played.wait(2.0)
+            time.sleep(0.01)
+
+        mock_report.assert_called_once()
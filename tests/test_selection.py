@@ -0,0 +1,194 @@
+"""Tests for latency-based backend selection."""
+
+import threading
+from collections.abc import Callable
+
+import pytest
+
+from beep_lite import Beeper, selection, warmup
+from beep_lite.backends.null_backend import NullBackend
+from beep_lite.scheduler import get_scheduler
+
+
+@pytest.fixture(autouse=True)
+def _quick_probes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Two probe rounds are enough to tell 0 ms from 30 ms."""
+    monkeypatch.setattr(selection, "_PROBE_ROUNDS", 2)
+
+
+class _FailingBackend(NullBackend):
+    """Null backend whose every sound fails."""
+
+    def play(self, sound, data, *, block=False, done=None) -> None:  # noqa: ANN001
+        raise OSError("device unplugged")
+
+
+class _LateFinishBackend(NullBackend):
+    """Null backend that starts sounds at once but reports them done late."""
+
+    def play(self, sound, data, *, done=None, **kwargs) -> None:  # noqa: ANN001, ANN003
+        late = threading.Event()
+        super().play(sound, data, done=late, **kwargs)
+        if done is not None:
+            late.wait()
+            get_scheduler().call_later(0.05, done.set)
+
+
+class _SilentStartBackend(NullBackend):
+    """Null backend that cannot report when a sound starts."""
+
+    signals_start = False
+
+
+class TestRank:
+    """Test rank()."""
+
+    def setup_method(self) -> None:
+        self.created: list[str] = []
+
+    def _factory(
+        self, name: str, backend: type[NullBackend] = NullBackend, **kw
+    ):  # noqa: ANN003, ANN202
+        def factory() -> NullBackend:
+            self.created.append(name)
+            return backend(**kw)
+
+        return factory
+
+    def _candidates(self) -> list[tuple[str, Callable[[], NullBackend]]]:
+        return [
+            ("slow", self._factory("slow", latency=0.03)),
+            ("fast", self._factory("fast")),
+            ("bell", self._factory("bell")),
+        ]
+
+    def test_fastest_first_and_last_resort_last(self) -> None:
+        """Healthy backends should be ordered by latency; the bell stays last."""
+        ranked = selection.rank(self._candidates())
+        assert [name for name, _ in ranked] == ["fast", "slow", "bell"]
+        assert "bell" not in self.created
+
+    def test_failing_and_unavailable_backends_rank_after_healthy(self) -> None:
+        """Backends that fail the probe should keep their order after the rest."""
+
+        def unavailable() -> NullBackend:
+            raise ImportError("not installed")
+
+        candidates = [
+            ("missing", unavailable),
+            ("broken", self._factory("broken", _FailingBackend)),
+            ("slow", self._factory("slow", latency=0.03)),
+            ("bell", self._factory("bell")),
+        ]
+        measured = selection.measure(candidates)
+        assert [m.latency is None for m in measured] == [True, True, False]
+        ranked = selection.rank(candidates)
+        assert [name for name, _ in ranked] == ["slow", "missing", "broken", "bell"]
+
+    def test_measures_the_start_not_the_end(self) -> None:
+        """Latency should run until the sound starts, however late it ends."""
+        candidates = [
+            ("late", self._factory("late", _LateFinishBackend)),
+            ("slow", self._factory("slow", latency=0.03)),
+            ("bell", self._factory("bell")),
+        ]
+        late, slow = selection.measure(candidates)
+        assert late.latency is not None
+        assert slow.latency is not None
+        assert late.latency < 0.02 <= slow.latency
+
+    def test_backends_without_start_signal_are_not_measured(self) -> None:
+        """Backends that cannot report starts should rank after measured ones."""
+        candidates = [
+            ("silent", self._factory("silent", _SilentStartBackend)),
+            ("slow", self._factory("slow", latency=0.03)),
+            ("bell", self._factory("bell")),
+        ]
+        assert [m.latency for m in selection.measure(candidates)][0] is None
+        ranked = selection.rank(candidates)
+        assert [name for name, _ in ranked] == ["slow", "silent", "bell"]
+
+    def test_ranking_is_cached(self) -> None:
+        """A later start should reuse the measurements without probing."""
+        selection.rank(self._candidates())
+        self.created.clear()
+
+        ranked = selection.rank(self._candidates(), probe=False)
+
+        assert [name for name, _ in ranked] == ["fast", "slow", "bell"]
+        assert self.created == []
+        selection.rank(self._candidates(), refresh=True)
+        assert sorted(self.created) == ["fast", "slow"]
+
+    def test_cache_is_per_candidate_list(self) -> None:
+        """Another set of candidates should not reuse the ranking."""
+        selection.rank(self._candidates())
+        reordered = [self._candidates()[i] for i in (1, 0, 2)]
+        assert selection.rank(reordered, probe=False) == reordered
+
+    def test_disk_cache_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without the disk cache every ranking should probe again."""
+        monkeypatch.setenv("BEEP_LITE_DISK_CACHE", "0")
+        candidates = self._candidates()
+        selection.rank(candidates)
+        self.created.clear()
+        assert selection.rank(candidates, probe=False) == candidates
+        selection.rank(candidates)
+        assert sorted(self.created) == ["fast", "slow"]
+
+    def test_corrupt_cache_is_ignored(self) -> None:
+        """An unreadable cache entry should trigger a new probe."""
+        selection.rank(self._candidates())
+        path = selection._cache_path(self._candidates())
+        path.write_text("{not json", encoding="utf-8")
+        self.created.clear()
+        selection.rank(self._candidates())
+        assert sorted(self.created) == ["fast", "slow"]
+
+
+class TestBeeperSelection:
+    """Test selection through Beeper and warmup."""
+
+    def _candidates(self) -> list[tuple[str, Callable[[], NullBackend]]]:
+        return [
+            ("slow", lambda: NullBackend(latency=0.03)),
+            ("fast", NullBackend),
+            ("bell", NullBackend),
+        ]
+
+    def test_warmup_selects_fastest(self) -> None:
+        """warmup(select_fastest=True) should make the fastest backend active."""
+        beeper = Beeper(candidates=self._candidates())
+        warmup(background=False, beeper=beeper, select_fastest=True)
+        assert beeper._get_backend().active_name == "fast"
+        beeper.close()
+
+    def test_default_order_without_selection(self) -> None:
+        """Without latency selection the fixed order should be kept."""
+        beeper = Beeper(candidates=self._candidates())
+        warmup(background=False, beeper=beeper)
+        assert beeper._get_backend().active_name == "slow"
+        beeper.close()
+
+    def test_env_uses_cached_ranking_without_warmup(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """BEEP_LITE_BACKEND_SELECTION=latency should apply a cached ranking."""
+        monkeypatch.setenv(selection.SELECTION_ENV, "latency")
+        assert selection.enabled()
+        beeper = Beeper(candidates=self._candidates())
+        # Nothing cached yet: the first use must not probe.
+        assert beeper._get_backend().active_name == "slow"
+        beeper.close()
+
+        selection.rank(self._candidates())
+        beeper = Beeper(candidates=self._candidates())
+        assert beeper._get_backend().active_name == "fast"
+        beeper.close()
+
+    def test_explicit_backend_is_kept(self) -> None:
+        """A beeper given a backend should not probe or replace it."""
+        backend = NullBackend()
+        beeper = Beeper(backend)
+        beeper._select_fastest()
+        assert beeper._get_backend() is backend
@@ -0,0 +1,176 @@
+"""Soak test: hammer the API from many threads and watch for resource growth.
+
+Playback goes through the real :class:`SimpleaudioBackend` and
+:class:`~beep_lite.health.ResilientBackend` on top of a fake ``simpleaudio``
+module whose sounds take as long to play as the real ones would, so threads,
+completions and scheduled calls live exactly as long as they do in
+production. No audio device is needed.
+
+The default run is short enough for every test session. Stations that run for
+weeks are covered by scaling it up, e.g.::
+
+    BEEP_LITE_SOAK_CALLS=1000000 pytest -m soak -s
+"""
+
+import gc
+import os
+import sys
+import threading
+import time
+import types
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+from unittest.mock import patch
+
+import pytest
+
+import beep_lite
+from beep_lite import Beeper, Sound
+from beep_lite.backends.simpleaudio_backend import SimpleaudioBackend
+from beep_lite.loader import cache_stats
+from beep_lite.scheduler import get_scheduler
+
+pytestmark = [
+    pytest.mark.soak,
+    pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/self"),
+]
+
+CALLS = int(os.environ.get("BEEP_LITE_SOAK_CALLS", "20000"))
+WORKERS = int(os.environ.get("BEEP_LITE_SOAK_THREADS", "16"))
+# Allowed growth between the warmed-up baseline and the end of the run.
+MAX_RSS_GROWTH = int(os.environ.get("BEEP_LITE_SOAK_RSS_MB", "32")) * 1024 * 1024
+MAX_FD_GROWTH = 2
+# Threads the library may add while busy, on top of the callers themselves.
+MAX_EXTRA_THREADS = 2
+# Every this many calls a caller uses a blocking play instead.
+BLOCKING_EVERY = 5000
+
+
+class _FakePlayObject:
+    """Playback handle that reports "playing" for the sound's real length."""
+
+    def __init__(self, duration: float) -> None:
+        self._end = time.monotonic() + duration
+
+    def is_playing(self) -> bool:
+        return time.monotonic() < self._end
+
+    def wait_done(self) -> None:
+        time.sleep(max(0.0, self._end - time.monotonic()))
+
+    def stop(self) -> None:
+        self._end = 0.0
+
+
+class _FakeWaveObject:
+    def __init__(self, frames: bytes, channels: int, width: int, rate: int) -> None:
+        self._duration = len(frames) / (channels * width * rate)
+
+    def play(self) -> _FakePlayObject:
+        return _FakePlayObject(self._duration)
+
+
+class _Sample(NamedTuple):
+    """Process resources at one point of the run."""
+
+    rss: int
+    threads: int
+    fds: int
+    inflight: int
+    scheduled: int
+
+
+def _sample(beeper: Beeper) -> _Sample:
+    with open("/proc/self/statm") as f:
+        rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return _Sample(
+        rss=rss,
+        # Native threads, including any not created through ``threading``.
+        threads=len(os.listdir("/proc/self/task")),
+        fds=len(os.listdir("/proc/self/fd")),
+        inflight=len(beeper._pending()),
+        scheduled=len(get_scheduler()),
+    )
+
+
+@pytest.fixture
+def beeper() -> Iterator[Beeper]:
+    """A beeper on the simpleaudio backend, with fake realistic-length audio."""
+    fake = types.SimpleNamespace(WaveObject=_FakeWaveObject)
+    with patch.dict("sys.modules", {"simpleaudio": fake}):
+        instance = Beeper(candidates=[("simpleaudio", SimpleaudioBackend)])
+        yield instance
+        instance.close()
+
+
+class TestSoak:
+    """Long runs must not grow threads, memory, file handles or caches."""
+
+    def test_hammering_does_not_leak(self, beeper: Beeper) -> None:
+        """Many threads playing every sound should leave no residue."""
+        sounds: list[Callable[[], None]] = [
+            beeper.ok,
+            beeper.ng,
+            beeper.warn,
+            beeper.crit,
+            beeper.moo,
+            beeper.mew,
+            beeper.scan_ok,
+            beeper.scan_ng,
+        ]
+        beep_lite.reset_error_counts()
+
+        # Warm up: everything created lazily exists before the baseline.
+        for sound in Sound:
+            beeper.play(sound)
+        beeper.play(Sound.OK, block=True)
+        assert beeper.flush(timeout=2.0)
+        gc.collect()
+        baseline = _sample(beeper)
+
+        samples: list[_Sample] = []
+        stop = threading.Event()
+
+        def sampler() -> None:
+            while not stop.wait(0.05):
+                samples.append(_sample(beeper))
+
+        def caller(index: int) -> None:
+            for n in range(index, CALLS, WORKERS):
+                if n % BLOCKING_EVERY == 0:
+                    beeper.play(Sound.SCAN_OK, block=True, timeout=1.0)
+                else:
+                    sounds[n % len(sounds)]()
+
+        monitor = threading.Thread(target=sampler, daemon=True)
+        monitor.start()
+        callers = [
+            threading.Thread(target=caller, args=(i,), daemon=True)
+            for i in range(WORKERS)
+        ]
+        for thread in callers:
+            thread.start()
+        for thread in callers:
+            thread.join()
+        assert beeper.flush(timeout=5.0), "sounds never signalled completion"
+        stop.set()
+        monitor.join()
+        gc.collect()
+        final = _sample(beeper)
+
+        peak_threads = max((s.threads for s in samples), default=final.threads)
+        assert (
+            peak_threads <= baseline.threads + WORKERS + 1 + MAX_EXTRA_THREADS
+        ), f"{peak_threads} threads at peak, {baseline.threads} at baseline"
+        assert final.threads <= baseline.threads
+        assert final.fds <= baseline.fds + MAX_FD_GROWTH
+        assert (
+            final.rss - baseline.rss <= MAX_RSS_GROWTH
+        ), f"RSS grew by {(final.rss - baseline.rss) / 1e6:.1f} MB"
+        assert final.inflight == 0
+        assert final.scheduled <= baseline.scheduled
+
+        stats = cache_stats()
+        assert stats.sounds <= len(Sound)
+        assert stats.buffers <= len(Sound)
+        assert beep_lite.error_counts() == {}
@@ -0,0 +1,111 @@
+"""Tests for deadline-based dropping of stale play requests."""
+
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import beep_lite
+from beep_lite import staleness
+from beep_lite.core import play_sound
+from beep_lite.stream import FILE
+from beep_lite.types import Sound
+
+
+@pytest.fixture(autouse=True)
+def _reset_staleness() -> Iterator[None]:
+    yield
+    for sound in Sound:
+        staleness.set_max_age(sound, None)
+    staleness.reset_dropped_counts()
+
+
+class TestIsStale:
+    """Test the staleness check."""
+
+    def test_no_max_age_never_stale(self) -> None:
+        """Sounds without a maximum age should never be dropped."""
+        assert not staleness.is_stale(Sound.OK, enqueued=0.0, now=1e9)
+        assert beep_lite.dropped_counts() == {}
+
+    def test_old_request_is_stale_and_counted(self) -> None:
+        """Requests older than the maximum age should be dropped and counted."""
+        beep_lite.set_max_age(Sound.SCAN_OK, 0.3)
+
+        assert not staleness.is_stale(Sound.SCAN_OK, enqueued=10.0, now=10.2)
+        assert staleness.is_stale(Sound.SCAN_OK, enqueued=10.0, now=10.8)
+        assert staleness.is_stale(Sound.SCAN_OK, enqueued=10.0, now=11.0)
+
+        assert beep_lite.dropped_counts() == {"scan_ok": 2}
+        beep_lite.reset_dropped_counts()
+        assert beep_lite.dropped_counts() == {}
+
+    def test_files_are_not_counted(self) -> None:
+        """Files played whole have no drop count of their own."""
+        staleness.count_drop(FILE)
+        assert beep_lite.dropped_counts() == {}
+
+    def test_clearing_max_age(self) -> None:
+        """set_max_age(sound, None) should disable dropping again."""
+        beep_lite.set_max_age(Sound.SCAN_OK, 0.3)
+        beep_lite.set_max_age(Sound.SCAN_OK, None)
+
+        assert staleness.max_age(Sound.SCAN_OK) is None
+        assert not staleness.is_stale(Sound.SCAN_OK, enqueued=0.0, now=5.0)
+
+
+class TestPlaySoundDropsStale:
+    """Test that play_sound drops stale requests before doing any work."""
+
+    def test_stale_request_skips_decode_and_backend(self) -> None:
+        """A stale request should not load the WAV nor touch the backend."""
+        beep_lite.set_max_age(Sound.SCAN_OK, 0.3)
+        with (
+            patch("beep_lite.core.load_wav") as mock_load,
+            patch("beep_lite.core.Beeper._get_backend") as mock_get,
+        ):
+            play_sound(Sound.SCAN_OK, enqueued=time.monotonic() - 0.8)
+
+        mock_load.assert_not_called()
+        mock_get.assert_not_called()
+        assert beep_lite.dropped_counts() == {"scan_ok": 1}
+
+    def test_fresh_request_plays(self) -> None:
+        """A request within its maximum age should play normally."""
+        beep_lite.set_max_age(Sound.SCAN_OK, 0.3)
+        backend = MagicMock()
+        with (
+            patch("beep_lite.core.load_wav", return_value=b"wav"),
+            patch("beep_lite.core.Beeper._get_backend", return_value=backend),
+        ):
+            play_sound(Sound.SCAN_OK, enqueued=time.monotonic())
+
+        backend.play.assert_called_once_with(Sound.SCAN_OK, b"wav")
+
+    def test_queueing_backend_gets_the_request_time(self) -> None:
+        """Backends that check staleness should get the age data to re-check."""
+        backend = MagicMock(checks_staleness=True, signals_completion=False)
+        with (
+            patch("beep_lite.core.load_wav", return_value=b"wav"),
+            patch("beep_lite.core.Beeper._get_backend", return_value=backend),
+        ):
+            play_sound(Sound.SCAN_OK, enqueued=12.5)
+
+        backend.play.assert_called_once_with(
+            Sound.SCAN_OK, b"wav", enqueued=12.5, limits=None
+        )
+
+    def test_time_held_by_warmup_gate_counts(self) -> None:
+        """Waiting for warm-up should count towards a request's age."""
+        gate = MagicMock()
+        gate.wait.side_effect = lambda timeout: time.sleep(0.05) or True
+        beep_lite.set_max_age(Sound.SCAN_OK, 0.01)
+        with (
+            patch("beep_lite.core._default._ready_gate", gate),
+            patch("beep_lite.core.load_wav") as mock_load,
+        ):
+            play_sound(Sound.SCAN_OK)
+
+        mock_load.assert_not_called()
+        assert beep_lite.dropped_counts() == {"scan_ok": 1}
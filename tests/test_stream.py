@@ -0,0 +1,156 @@
+"""Tests for streaming playback of long WAV files."""
+
+import threading
+import time
+import wave
+from pathlib import Path
+
+import pytest
+
+from beep_lite import stream
+from beep_lite.backends.null_backend import NullBackend
+from beep_lite.core import Beeper
+from beep_lite.pcm import PcmFormat, convert, decode_wav
+from beep_lite.stream import open_stream
+
+_FORMAT = PcmFormat(rate=8000, channels=1, width=2)
+
+
+def _write_wav(path: Path, seconds: float, fmt: PcmFormat = _FORMAT) -> bytes:
+    """Write a WAV file of a counting ramp and return its frames."""
+    samples = int(fmt.rate * seconds) * fmt.channels
+    frames = b"".join((i % 4096).to_bytes(2, "little") for i in range(samples))
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(fmt.channels)
+        writer.setsampwidth(fmt.width)
+        writer.setframerate(fmt.rate)
+        writer.writeframes(frames)
+    return frames
+
+
+class _NoStreaming:
+    """Backend that can play sounds but not stream files."""
+
+    def __init__(self) -> None:
+        self.played: list[tuple[object, bytes]] = []
+
+    def play(self, sound, data, *, block=False) -> None:  # noqa: ANN001
+        self.played.append((sound, data))
+
+    def is_available(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def streamed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stream every file, however small."""
+    monkeypatch.setattr(stream, "STREAM_THRESHOLD", 0)
+
+
+class TestOpenStream:
+    """Test reading WAV files for playback."""
+
+    def test_large_file_is_read_in_chunks(self, tmp_path: Path, streamed: None) -> None:
+        """A streamed file should yield chunk-sized pieces of its frames."""
+        path = tmp_path / "long.wav"
+        frames = _write_wav(path, 1.0)
+
+        opened = open_stream(path, chunk_seconds=0.1)
+        chunks = [bytes(chunk) for chunk in opened]
+
+        assert opened.data is None
+        assert opened.format == _FORMAT
+        assert opened.duration == pytest.approx(1.0)
+        assert len(chunks) == 10
+        assert {len(chunk) for chunk in chunks} == {800 * 2}
+        assert b"".join(chunks) == frames
+        # Iterating again reads the file again.
+        assert b"".join(bytes(chunk) for chunk in opened) == frames
+
+    def test_small_file_is_cached_whole(self, tmp_path: Path) -> None:
+        """Small files should be read once and decoded through the PCM cache."""
+        path = tmp_path / "short.wav"
+        frames = _write_wav(path, 0.1)
+
+        first = open_stream(path)
+        second = open_stream(path)
+
+        assert first.data is not None
+        assert second.data is first.data
+        assert [bytes(chunk) for chunk in first] == [frames]
+
+    def test_conversion_is_applied_per_chunk(
+        self, tmp_path: Path, streamed: None
+    ) -> None:
+        """Converting a streamed file should match converting it whole."""
+        path = tmp_path / "long.wav"
+        _write_wav(path, 0.5)
+        target = PcmFormat(rate=8000, channels=2, width=2)
+
+        converted = open_stream(path, chunk_seconds=0.1).to(target)
+
+        whole = convert(decode_wav(path.read_bytes()), target).frames
+        assert converted.format == target
+        assert b"".join(bytes(chunk) for chunk in converted) == whole
+
+    def test_stopping_early_stops_the_reader(
+        self, tmp_path: Path, streamed: None
+    ) -> None:
+        """Abandoning an iteration should end the read-ahead thread."""
+        path = tmp_path / "long.wav"
+        _write_wav(path, 1.0)
+
+        chunks = iter(open_stream(path, chunk_seconds=0.01))
+        next(chunks)
+        chunks.close()  # type: ignore[attr-defined]
+
+        deadline = time.monotonic() + 2.0
+        while any(t.name == "beep-lite-stream-reader" for t in threading.enumerate()):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    def test_invalid_file_raises(self, tmp_path: Path, streamed: None) -> None:
+        """open_stream should raise for files that are not WAV."""
+        path = tmp_path / "bad.wav"
+        path.write_bytes(b"not a wav file")
+
+        with pytest.raises(Exception):  # noqa: B017, PT011
+            open_stream(path)
+
+
+class TestPlayFile:
+    """Test Beeper.play_file."""
+
+    def test_plays_through_the_backend(self, tmp_path: Path, streamed: None) -> None:
+        """The file should reach the backend, and block should wait for it."""
+        path = tmp_path / "long.wav"
+        _write_wav(path, 0.2)
+        backend = NullBackend()
+        beeper = Beeper(backend=backend)
+
+        start = time.monotonic()
+        beeper.play_file(path, block=True, timeout=2.0)
+
+        assert time.monotonic() - start >= 0.19
+        assert list(backend.streamed) == [path.resolve()]
+        assert beeper.flush(timeout=0.1)
+
+    def test_never_raises(self, tmp_path: Path, streamed: None) -> None:
+        """Missing files and backends without streaming should only be reported."""
+        path = tmp_path / "long.wav"
+        _write_wav(path, 0.1)
+        backend = _NoStreaming()
+
+        Beeper(backend=NullBackend()).play_file(tmp_path / "missing.wav")
+        Beeper(backend=backend).play_file(path, block=True, timeout=1.0)
+        assert backend.played == []
+
+    def test_small_files_play_whole_without_streaming(self, tmp_path: Path) -> None:
+        """A backend that cannot stream should still play small files."""
+        path = tmp_path / "short.wav"
+        _write_wav(path, 0.1)
+        backend = _NoStreaming()
+
+        Beeper(backend=backend).play_file(path, block=True, timeout=1.0)
+
+        assert backend.played == [(stream.FILE, path.read_bytes())]
@@ -0,0 +1,97 @@
+"""Tests for background warm-up."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from beep_lite import core, warmup
+from beep_lite.core import _reset_backend, play_sound
+from beep_lite.loader import clear_cache
+from beep_lite.types import Sound
+
+
+class TestWarmup:
+    """Test warmup()."""
+
+    def setup_method(self) -> None:
+        _reset_backend()
+        clear_cache()
+
+    def teardown_method(self) -> None:
+        core._set_ready_gate(None)
+        _reset_backend()
+        clear_cache()
+
+    @patch("beep_lite.core.Beeper._get_backend")
+    def test_loads_prepares_and_primes(self, mock_get_backend: MagicMock) -> None:
+        """Every sound should be prepared and the device primed once."""
+        backend = mock_get_backend.return_value
+        warmup(background=False).result(timeout=5)
+
+        backend.prime.assert_called_once_with()
+        prepared = {c.args[0] for c in backend.prepare.call_args_list}
+        assert prepared == set(Sound)
+
+    @patch("beep_lite.core.Beeper._get_backend")
+    def test_background_returns_before_done(self, mock_get_backend: MagicMock) -> None:
+        """background=True should return a future that completes later."""
+        release = threading.Event()
+        mock_get_backend.return_value.prime.side_effect = lambda: release.wait(5)
+
+        ready = warmup()
+        assert not ready.done()
+        release.set()
+        assert ready.result(timeout=5) is None
+
+    @patch("beep_lite.core.Beeper._get_backend")
+    def test_runs_in_parallel_threads(self, mock_get_backend: MagicMock) -> None:
+        """Sounds should be warmed concurrently, not one after another."""
+        threads: set[str] = set()
+
+        def prepare(sound: Sound, data: bytes) -> None:
+            threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+
+        mock_get_backend.return_value.prepare.side_effect = prepare
+        start = time.perf_counter()
+        warmup(background=False)
+        assert time.perf_counter() - start < 0.05 * len(Sound)
+        assert len(threads) > 1
+
+    @patch("beep_lite.core.Beeper._get_backend")
+    def test_failures_do_not_raise(self, mock_get_backend: MagicMock) -> None:
+        """Warm-up failures should be reported, never raised."""
+        mock_get_backend.return_value.prime.side_effect = OSError("no device")
+        mock_get_backend.return_value.prepare.side_effect = ValueError("bad wav")
+        assert warmup(background=False).result(timeout=5) is None
+
+    @patch("beep_lite.core.Beeper._get_backend")
+    def test_hold_playback_waits_until_ready(self, mock_get_backend: MagicMock) -> None:
+        """With hold_playback, play_sound should wait for warm-up to finish."""
+        backend = mock_get_backend.return_value
+        release = threading.Event()
+        order: list[str] = []
+        backend.prime.side_effect = lambda: (release.wait(5), order.append("primed"))
+        backend.play.side_effect = lambda *a, **k: order.append("played")
+
+        ready = warmup(hold_playback=True, timeout=5)
+        player = threading.Thread(target=play_sound, args=(Sound.OK,))
+        player.start()
+        time.sleep(0.05)
+        assert order == []
+        release.set()
+        player.join(timeout=5)
+        ready.result(timeout=5)
+        assert order == ["primed", "played"]
+        assert core._default._ready_gate is None
+
+    @patch("beep_lite.core.Beeper._get_backend")
+    def test_hold_playback_times_out(self, mock_get_backend: MagicMock) -> None:
+        """A held sound should play anyway once the timeout expires."""
+        release = threading.Event()
+        mock_get_backend.return_value.prime.side_effect = lambda: release.wait(5)
+
+        warmup(hold_playback=True, timeout=0.01)
+        play_sound(Sound.OK)
+        mock_get_backend.return_value.play.assert_called_once()
+        release.set()